@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Analysis Cache
+
+Persists ProjectAnalyzer detector results between runs. Each result is
+stored together with the mtime/size/inode fingerprint of every file and
+directory the detector looked at, so a re-run only redoes the detectors
+whose inputs changed.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from file_index import TREE
+
+
+# Bump when detector results change for the same inputs
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = Path('.cache') / 'readme-generator'
+
+
+def fingerprint(path: Union[str, Path]) -> Optional[List[int]]:
+    """
+    Fingerprint a file or directory by its metadata
+    
+    Args:
+        path: Absolute path
+    
+    Returns:
+        [mtime_ns, size, inode], or None if the path does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size, st.st_ino]
+
+
+class AnalysisCache:
+    """On-disk cache of detector results keyed on input fingerprints"""
+    
+    def __init__(self, root: Path, cache_dir: Optional[str] = None, config: Optional[Dict] = None):
+        """
+        Initialize cache for a project
+        
+        Args:
+            root: Project root directory
+            cache_dir: Cache directory (defaults to <root>/.cache/readme-generator)
+            config: Analyzer settings that affect results; a mismatch
+                discards the cached entries
+        """
+        self.root = root
+        self.dir = Path(cache_dir) if cache_dir else root / DEFAULT_CACHE_DIR
+        self.path = self.dir / 'analysis.json'
+        self.config = config or {}
+        self._tree_fresh: Optional[bool] = None
+        self._tree_stored = False
+        # Current fingerprints looked up during this run, by relative path
+        self._current: Dict[str, Optional[List[int]]] = {}
+        self.data = self._load()
+    
+    def _load(self) -> Dict:
+        """Load cache file, discarding it if stale or unreadable"""
+        # Create the directory up front so that it does not change the
+        # fingerprint of the root directory after results are recorded
+        self.dir.mkdir(parents=True, exist_ok=True)
+        
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return self._empty()
+        
+        if (not isinstance(data, dict) or
+                data.get('version') != CACHE_VERSION or
+                data.get('root') != str(self.root) or
+                data.get('config') != self.config):
+            return self._empty()
+        return data
+    
+    def _empty(self) -> Dict:
+        """Cache contents with no recorded results"""
+        return {
+            'version': CACHE_VERSION,
+            'root': str(self.root),
+            'config': self.config,
+            'tree': {},
+            'detectors': {},
+        }
+    
+    def save(self):
+        """Write cache file atomically"""
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self.data), encoding='utf-8')
+        os.replace(tmp, self.path)
+    
+    def _current_fingerprint(self, rel: str) -> Optional[List[int]]:
+        """Fingerprint of a path, stat'ed once per run (detectors share many inputs)"""
+        if rel in self._current:
+            return self._current[rel]
+        stamp = fingerprint(os.path.join(self.root, rel))
+        self._current[rel] = stamp
+        return stamp
+    
+    def _is_fresh(self, rel: str, stored: Optional[List[int]]) -> bool:
+        """Check whether a recorded dependency is unchanged"""
+        if rel == TREE:
+            if self._tree_fresh is None:
+                tree = self.data['tree']
+                self._tree_fresh = bool(tree) and all(
+                    self._current_fingerprint(path) == fp for path, fp in tree.items()
+                )
+            return self._tree_fresh
+        return self._current_fingerprint(rel) == stored
+    
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a detector result
+        
+        Args:
+            key: Detector key (e.g. 'language')
+        
+        Returns:
+            Tuple of (hit, value)
+        """
+        entry = self.data['detectors'].get(key)
+        if entry is None:
+            return False, None
+        
+        for rel, fp in entry['deps'].items():
+            if not self._is_fresh(rel, fp):
+                return False, None
+        return True, entry['value']
+    
+    def store(self, key: str, value: Any, deps: Iterable[str], tree_paths: Iterable[str] = ()):
+        """
+        Record a detector result with the fingerprints of its inputs
+        
+        Args:
+            key: Detector key
+            value: JSON-serializable detector result
+            deps: Relative paths the detector looked at (TREE for the whole tree)
+            tree_paths: Paths whose fingerprints capture the tree shape,
+                recorded once per run when a detector depends on TREE
+        """
+        recorded = {}
+        for rel in deps:
+            if rel == TREE:
+                if not self._tree_stored:
+                    self.data['tree'] = {
+                        path: fingerprint(self.root / path) for path in tree_paths
+                    }
+                    self._tree_stored = True
+                recorded[rel] = None
+            else:
+                recorded[rel] = fingerprint(self.root / rel)
+        
+        self.data['detectors'][key] = {'value': value, 'deps': recorded}
+
+
+class MemoryAnalysisCache(AnalysisCache):
+    """AnalysisCache held in memory, e.g. by a long-running server"""
+    
+    def __init__(self, root: Path, config: Optional[Dict] = None, data: Optional[Dict] = None):
+        """
+        Initialize in-memory cache for one analysis run
+        
+        Args:
+            root: Project root directory
+            config: Analyzer settings that affect results
+            data: Contents recorded by an earlier run (the `data` attribute
+                of a previous MemoryAnalysisCache); updated in place
+        """
+        self.root = root
+        self.dir = None
+        self.path = None
+        self.config = config or {}
+        self._tree_fresh = None
+        self._tree_stored = False
+        self._current = {}
+        self.data = data if data is not None and data.get('config') == self.config else self._empty()
+    
+    def save(self):
+        """Nothing to write: results stay in `data`"""
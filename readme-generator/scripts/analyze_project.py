@@ -4,132 +4,713 @@ Project Analyzer
 
 Analyzes project directory structure and files to infer project information.
 Useful for auto-generating README content based on project characteristics.
+Source archives (release tarballs, sdists, zip files, wheels) are analyzed
+in place, without extracting them (see source_archive.py).
 """
 
+import argparse
+import ast
+import functools
 import json
+import math
+import os
+import random
 import sys
+import time
+from email.parser import HeaderParser
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Optional, Tuple
 import re
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from analysis_cache import AnalysisCache, fingerprint
+from batch import expand_paths, run_batch
+from file_index import DEFAULT_PRUNE, TREE, FileIndex, IOCounters
+from import_scan import DEFAULT_IMPORT_BYTES, SOURCE_KINDS, scan_file, scan_head
+from license_index import HEAD_BYTES, identify
+from lockfiles import LOCKFILE_READERS, REQUIREMENT_RE, LockfileError, canonical_name, read_lockfile
+from source_archive import SourceArchive, archive_format, is_archive
+
+
+# Extensions counted towards the language breakdown
+LANGUAGE_EXTENSIONS = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.mjs': 'JavaScript',
+    '.cjs': 'JavaScript',
+    '.jsx': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.mts': 'TypeScript',
+    '.tsx': 'TypeScript',
+    '.rs': 'Rust',
+    '.go': 'Go',
+    '.java': 'Java',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.cpp': 'C++',
+    '.cc': 'C++',
+    '.cxx': 'C++',
+    '.hpp': 'C++',
+    '.c': 'C',
+    '.h': 'C',
+    '.cs': 'C#',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.kts': 'Kotlin',
+    '.scala': 'Scala',
+    '.r': 'R',
+    '.dart': 'Dart',
+    '.lua': 'Lua',
+    '.ex': 'Elixir',
+    '.exs': 'Elixir',
+    '.hs': 'Haskell',
+    '.sh': 'Shell',
+    '.vue': 'Vue',
+    '.svelte': 'Svelte',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+}
+
+# Vendored and generated paths excluded from language statistics,
+# modelled on GitHub linguist's vendor.yml/generated rules
+EXCLUDED_PATHS_RE = re.compile('|'.join([
+    r'(?:^|/)(?:vendor|vendors|third[_-]party|external|bower_components|node_modules)/',
+    r'(?:^|/)(?:dist|__generated__|generated)/',
+    r'(?:^|/)(?:package-lock\.json|yarn\.lock|pnpm-lock\.yaml|Cargo\.lock|poetry\.lock|'
+    r'Pipfile\.lock|composer\.lock|Gemfile\.lock|go\.sum)$',
+    r'[.-]min\.(?:js|css)$',
+    r'\.bundle\.js$',
+    r'\.(?:pb\.go|pb\.cc|pb\.h)$',
+    r'_pb2(?:_grpc)?\.py$',
+    r'\.generated\.\w+$',
+]))
+
+# Files stat-ed per language when sampling
+SAMPLE_PER_LANGUAGE = 256
+
+# Imported or declared package -> framework, per ecosystem. Ties in the
+# framework ranking are broken by this order.
+JS_FRAMEWORKS = {
+    'react': 'react',
+    'vue': 'vue',
+    '@angular/core': 'angular',
+    'svelte': 'svelte',
+    'next': 'next',
+    'nuxt': 'nuxt',
+    'express': 'express',
+    '@nestjs/core': 'nestjs',
+    'fastify': 'fastify',
+    'koa': 'koa',
+}
+PYTHON_FRAMEWORKS = {
+    'django': 'django',
+    'flask': 'flask',
+    'fastapi': 'fastapi',
+    'starlette': 'starlette',
+    'aiohttp': 'aiohttp',
+    'tornado': 'tornado',
+    'sanic': 'sanic',
+    'bottle': 'bottle',
+    'pyramid': 'pyramid',
+    'streamlit': 'streamlit',
+    'gradio': 'gradio',
+}
+
+# Where direct dependencies are declared: (ecosystem, manifest, dotted key
+# with '*' for every entry of a table, development only), runtime first
+DEPENDENCY_DECLARATIONS = [
+    ('npm', 'package.json', 'dependencies', False),
+    ('npm', 'package.json', 'optionalDependencies', False),
+    ('npm', 'package.json', 'peerDependencies', False),
+    ('python', 'pyproject.toml', 'project.dependencies', False),
+    ('python', 'pyproject.toml', 'tool.poetry.dependencies', False),
+    ('python', 'Pipfile', 'packages', False),
+    ('python', 'setup.py', 'install_requires', False),
+    ('python', 'PKG-INFO', 'requires_dist', False),
+    ('python', 'requirements.txt', 'dependencies', False),
+    ('cargo', 'Cargo.toml', 'dependencies', False),
+    ('cargo', 'Cargo.toml', 'build-dependencies', False),
+    ('go', 'go.mod', 'require', False),
+    ('npm', 'package.json', 'devDependencies', True),
+    ('python', 'pyproject.toml', 'project.optional-dependencies.*', True),
+    ('python', 'pyproject.toml', 'tool.poetry.dev-dependencies', True),
+    ('python', 'pyproject.toml', 'tool.poetry.group.*.dependencies', True),
+    ('python', 'PKG-INFO', 'optional_dependencies.*', True),
+    ('python', 'Pipfile', 'dev-packages', True),
+    ('cargo', 'Cargo.toml', 'dev-dependencies', True),
+]
+
+# Ecosystem -> lockfiles (see lockfiles.LOCKFILE_READERS) in order of preference
+DEPENDENCY_LOCKFILES = {
+    'npm': ['package-lock.json', 'npm-shrinkwrap.json', 'pnpm-lock.yaml'],
+    'python': ['poetry.lock', 'Pipfile.lock', 'requirements.txt'],
+    'cargo': ['Cargo.lock'],
+    'go': ['go.sum'],
+}
+
+# Most source files whose imports are scanned, shallowest paths first,
+# and files scanned per thread pool task
+MAX_IMPORT_SCAN_FILES = 2000
+IMPORT_SCAN_CHUNK = 64
+
+# Root files that may hold license text (LICENSE, LICENCE.md, LICENSE-MIT,
+# COPYING.LESSER, UNLICENSE, ...)
+LICENSE_FILE_RE = re.compile(r'^(?:un)?licen[cs]e\b|^copying\b', re.IGNORECASE)
+
+# Manifests that may declare a license, as manifest_field() sources
+LICENSE_SOURCES = [
+    'package.json', 'Cargo.toml:package', 'pyproject.toml:project',
+    'pyproject.toml:tool.poetry', 'setup.py', 'PKG-INFO',
+]
+
+# Requires-Dist marker limiting a requirement to an extra
+EXTRA_MARKER_RE = re.compile(r"""\bextra\s*==\s*['"]([^'"]+)['"]""")
+
+# READMEs whose first paragraph may serve as the description
+README_FILES = ['README.md', 'README.rst', 'README.txt']
+
 
 class ProjectAnalyzer:
     """Analyze project structure and infer metadata"""
     
-    def __init__(self, project_dir: str = '.'):
+    # Result key -> detector method, in output order
+    DETECTORS = {
+        'project_name': 'detect_project_name',
+        'language': 'detect_language',
+        'languages': 'language_breakdown',
+        'project_type': 'detect_project_type',
+        'package_manager': 'detect_package_manager',
+        'has_tests': 'has_tests',
+        'ci_service': 'detect_ci',
+        'dependencies_file': 'find_dependencies_file',
+        'dependencies': 'extract_dependencies',
+        'build_system': 'detect_build_system',
+        'framework': 'detect_framework',
+        'frameworks': 'framework_ranking',
+        'description': 'extract_description',
+        'version': 'extract_version',
+        'license': 'detect_license',
+        'license_match': 'license_details',
+        'has_docs': 'has_documentation',
+        'git_repo': 'is_git_repo',
+        'workspace': 'detect_workspace',
+    }
+    
+    # Manifest that every member of each workspace kind must contain
+    WORKSPACE_MEMBER_MANIFESTS = {
+        'npm': 'package.json',
+        'pnpm': 'package.json',
+        'cargo': 'Cargo.toml',
+        'go': 'go.mod',
+        'python': 'pyproject.toml',
+    }
+    
+    def __init__(self, project_dir: str = '.', prune: Optional[Iterable[str]] = None,
+                 index: Optional[FileIndex] = None, workspace_jobs: Optional[int] = None,
+                 sample_threshold: Optional[int] = 5000, use_git_index: bool = True,
+                 metrics: bool = False, metrics_hook: Optional[Callable[[str, Dict], None]] = None,
+                 manifest_cache: Optional[Any] = None,
+                 import_bytes: int = DEFAULT_IMPORT_BYTES,
+                 archive: Optional[SourceArchive] = None):
         """
         Initialize analyzer with project directory
         
         Args:
-            project_dir: Path to project root directory
+            project_dir: Path to project root directory, or to a source
+                archive (.tar.gz, .tar.zst, .zip, .whl, ...) to analyze
+                without extracting it
+            prune: Directory names not to descend into
+                (defaults to file_index.DEFAULT_PRUNE)
+            index: Prebuilt file index to reuse instead of walking the tree
+            workspace_jobs: Threads used to analyze workspace members and to
+                scan source files for imports
+            sample_threshold: Above this many source files, language byte
+                counts are estimated from a per-language sample (None disables)
+            use_git_index: List files from `.git/index` when the project is
+                a git repository instead of walking the working tree
+            metrics: Record wall time and filesystem calls per detector and
+                add them to the analysis under '_metrics'
+            metrics_hook: Called with (result key, metrics) after each
+                detector; implies metrics
+            manifest_cache: Cache with get(key)/put(key, value) shared between
+                analyzers, holding parsed manifests keyed on path and
+                fingerprint (e.g. the LRU cache of a long-running server)
+            import_bytes: Bytes read from the start of each source file when
+                scanning imports for framework detection
+            archive: Archive (or subarchive) the project is read from;
+                opened automatically when project_dir is an archive file
         """
         self.root = Path(project_dir).resolve()
-        if not self.root.exists():
+        if archive is None and is_archive(self.root):
+            archive = SourceArchive(self.root)
+        self.archive = archive
+        if archive is None and not self.root.exists():
             raise FileNotFoundError(f"Project directory not found: {project_dir}")
         
+        self.prune = prune
+        self._index = index
+        self.workspace_jobs = workspace_jobs
+        self.sample_threshold = sample_threshold
+        self.use_git_index = use_git_index
+        self._language_stats = None
+        self.import_bytes = import_bytes
+        self._frameworks = None
+        self._license_match = None
+        self._manifests: Dict[str, Optional[Dict]] = {}
+        self.manifest_cache = manifest_cache
+        # Paths read by the running detector, plus recorded inputs per detector
+        self._deps: Optional[set] = None
+        self.dependencies: Dict[str, set] = {}
         self.analysis = {}
+        # Per-detector metrics, and the counters of the running detector
+        self.metrics_enabled = metrics or metrics_hook is not None
+        self.metrics_hook = metrics_hook
+        self.metrics: Dict[str, Dict] = {}
+        self._counters: Optional[IOCounters] = None
+    
+    @property
+    def index(self) -> FileIndex:
+        """
+        File index of the project, built on first access
+        
+        Read from the git index when available, otherwise with a single
+        walk. For archives, the member table is listed instead.
+        """
+        if self._index is None:
+            if self.archive is not None:
+                self._index = self.archive.file_index(self.prune, self._archive_capture, self._counters)
+            elif self.use_git_index:
+                self._index = FileIndex.from_git_index(self.root, self.prune, self._counters)
+            if self._index is None:
+                self._index = FileIndex.from_directory(self.root, self.prune, self._counters)
+            self._index.recorder = self._deps
+            self._index.counters = self._counters
+        return self._index
+    
+    def _archive_capture(self, rel: str) -> bool:
+        """Whether listing a tar archive should keep a member that detectors read"""
+        directory, _, name = rel.rpartition('/')
+        if not directory:
+            return (name in MANIFEST_PARSERS or name in LOCKFILE_READERS or name in README_FILES or
+                    LICENSE_FILE_RE.match(name) is not None)
+        if name not in MANIFEST_PARSERS:
+            return False
+        # Manifests of workspace members, outside directories the index skips
+        prune = set(DEFAULT_PRUNE if self.prune is None else self.prune)
+        return not any(part in prune or part.startswith('.') for part in directory.split('/'))
+    
+    def open_file(self, rel: str) -> BinaryIO:
+        """
+        Open a project file for binary reading (use as a context manager)
+        
+        Members of an archive are streamed from it.
+        
+        Raises:
+            OSError: The file is missing or unreadable
+        """
+        if self.archive is not None:
+            return self.archive.open(rel)
+        return open(self.root / rel, 'rb')
+    
+    def read_head(self, rel: str, size: int) -> Optional[str]:
+        """
+        Read the beginning of a project file as text
+        
+        Args:
+            rel: Path relative to the project root
+            size: Maximum number of bytes to read
+        
+        Returns:
+            Up to `size` bytes of content, or None if the file is missing or unreadable
+        """
+        if not self.index.is_file(rel):
+            return None
+        try:
+            with self.open_file(rel) as f:
+                data = f.read(size)
+        except OSError:
+            return None
+        if self._counters is not None:
+            self._counters.read_file(len(data))
+        return data.decode('utf-8', 'replace')
+    
+    def read_text(self, rel: str) -> Optional[str]:
+        """
+        Read a project file as text
+        
+        Args:
+            rel: Path relative to the project root
+        
+        Returns:
+            File content, or None if the file is missing or unreadable
+        """
+        if not self.index.is_file(rel):
+            return None
+        try:
+            with self.open_file(rel) as f:
+                data = f.read()
+        except OSError:
+            return None
+        if self._counters is not None:
+            self._counters.read_file(len(data))
+        # Same newline translation as read_text()
+        return data.decode('utf-8', 'replace').replace('\r\n', '\n').replace('\r', '\n')
+    
+    def manifest(self, name: str) -> Optional[Dict]:
+        """
+        Load a manifest file into structured form
+        
+        Each manifest is read and parsed at most once per analyzer; later
+        calls return the memoized result.
+        
+        Args:
+            name: Manifest file name (package.json, Cargo.toml, pyproject.toml, setup.py, ...)
+        
+        Returns:
+            Parsed manifest, or None if missing or unparsable
+        """
+        if self._deps is not None:
+            self._deps.add(name)
+        if name not in self._manifests:
+            self._manifests[name] = self._parse_manifest(name)
+        return self._manifests[name]
+    
+    def _parse_manifest(self, name: str) -> Optional[Dict]:
+        """Read and parse a manifest, going through manifest_cache if set"""
+        parser = MANIFEST_PARSERS[name]
+        key = None
+        if self.manifest_cache is not None and self.archive is None and self.index.is_file(name):
+            path = self.root / name
+            stamp = fingerprint(path)
+            if stamp is not None:
+                key = (str(path), *stamp)
+                hit = self.manifest_cache.get(key)
+                if hit is not None:
+                    return hit[0]
+        
+        content = self.read_text(name)
+        parsed = parser(content) if content is not None else None
+        if key is not None:
+            # Wrapped so that unparsable manifests (None) are cached too
+            self.manifest_cache.put(key, (parsed,))
+        return parsed
+    
+    def manifest_field(self, *path: str, sources: Iterable[str]) -> Optional[Any]:
+        """
+        Look up the first non-empty value of a field across manifests
+        
+        Args:
+            path: Keys to descend, e.g. ('package', 'name') for Cargo.toml
+            sources: Manifest names to try in order. A source may carry its
+                own key prefix as 'pyproject.toml:tool.poetry'.
+        
+        Returns:
+            First value found, or None
+        """
+        for source in sources:
+            name, _, prefix = source.partition(':')
+            data = self.manifest(name)
+            keys = (prefix.split('.') if prefix else []) + list(path)
+            for key in keys:
+                if not isinstance(data, dict):
+                    data = None
+                    break
+                data = data.get(key)
+            if data:
+                return data
+        return None
+    
+    def declared_requirements(self, manifest: str, key: str) -> List[Tuple[str, str]]:
+        """
+        Requirements declared under a key of a manifest
+        
+        Args:
+            manifest: Manifest name
+            key: Dotted key path; '*' stands for every entry of a table
+                (e.g. 'tool.poetry.group.*.dependencies')
+        
+        Returns:
+            (name, version spec) pairs, see requirement_specs()
+        """
+        values = [self.manifest(manifest)]
+        for part in key.split('.'):
+            values = [value for table in values if isinstance(table, dict)
+                      for value in (table.values() if part == '*' else [table.get(part)])]
+        return [spec for value in values for spec in requirement_specs(value)]
     
-    def analyze(self) -> Dict:
+    def analyze(self, cache: Optional[AnalysisCache] = None) -> Dict:
         """
         Perform complete project analysis
         
+        Args:
+            cache: Optional persistent cache; detectors whose recorded
+                inputs are unchanged are answered from it
+        
         Returns:
             Dictionary containing project metadata
         """
-        self.analysis = {
-            'project_name': self.detect_project_name(),
-            'language': self.detect_language(),
-            'project_type': self.detect_project_type(),
-            'package_manager': self.detect_package_manager(),
-            'has_tests': self.has_tests(),
-            'ci_service': self.detect_ci(),
-            'dependencies_file': self.find_dependencies_file(),
-            'build_system': self.detect_build_system(),
-            'framework': self.detect_framework(),
-            'description': self.extract_description(),
-            'version': self.extract_version(),
-            'license': self.detect_license(),
-            'has_docs': self.has_documentation(),
-            'git_repo': self.is_git_repo()
-        }
+        self.analysis = {key: self.run_detector(key, cache) for key in self.DETECTORS}
+        if self.metrics_enabled:
+            self.analysis['_metrics'] = self.metrics_summary()
+        
+        if cache is not None:
+            cache.save()
         
         return self.analysis
     
-    def detect_project_name(self) -> Optional[str]:
-        """Detect project name from various sources"""
-        # Try package.json
-        pkg_json = self.root / 'package.json'
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                return data.get('name')
-            except:
-                pass
-        
-        # Try setup.py
-        setup_py = self.root / 'setup.py'
-        if setup_py.exists():
-            content = setup_py.read_text()
-            match = re.search(r'name\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                return match.group(1)
+    def cache_config(self) -> Dict:
+        """Settings that affect results, used to key the analysis cache"""
+        return {
+            'prune': sorted(self.prune) if self.prune is not None else None,
+            'sample_threshold': self.sample_threshold,
+            'use_git_index': self.use_git_index,
+            'import_bytes': self.import_bytes,
+        }
+    
+    def run_detector(self, key: str, cache: Optional[AnalysisCache] = None):
+        """
+        Run one detector while recording the paths it depends on
         
-        # Try Cargo.toml
-        cargo_toml = self.root / 'Cargo.toml'
-        if cargo_toml.exists():
-            content = cargo_toml.read_text()
-            match = re.search(r'name\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+        Args:
+            key: Result key from DETECTORS
+            cache: Optional persistent cache to consult and update
         
-        # Try pyproject.toml
-        pyproject = self.root / 'pyproject.toml'
-        if pyproject.exists():
-            content = pyproject.read_text()
-            match = re.search(r'name\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+        Returns:
+            Detector result
+        """
+        counters = None
+        if self.metrics_enabled:
+            counters = IOCounters()
+            started = time.perf_counter()
+        
+        if cache is not None:
+            hit, value = cache.lookup(key)
+            if hit:
+                if counters is not None:
+                    self._record_metrics(key, counters, started, cached=True)
+                return value
+        
+        deps = set()
+        self._deps = deps
+        self._counters = counters
+        if self._index is not None:
+            self._index.recorder = deps
+            self._index.counters = counters
+        try:
+            value = getattr(self, self.DETECTORS[key])()
+        finally:
+            self._deps = None
+            self._counters = None
+            if self._index is not None:
+                self._index.recorder = None
+                self._index.counters = None
+        
+        if counters is not None:
+            self._record_metrics(key, counters, started)
+        
+        self.dependencies[key] = deps
+        if cache is not None:
+            tree_paths = self._index.tree_paths() if self._index is not None else ()
+            cache.store(key, value, deps, tree_paths)
+        return value
+    
+    def _record_metrics(self, key: str, counters: IOCounters, started: float, cached: bool = False):
+        """Store the metrics of one detector run and pass them to the hook"""
+        entry = {'seconds': round(time.perf_counter() - started, 6), 'cached': cached}
+        entry.update(counters.as_dict())
+        self.metrics[key] = entry
+        if self.metrics_hook is not None:
+            self.metrics_hook(key, entry)
+    
+    def metrics_summary(self) -> Dict:
+        """
+        Metrics of the last run of every detector
+        
+        The file index is built by whichever detector first needs it, so
+        the walk (or git index read) is counted towards that detector.
+        
+        Returns:
+            {'detectors': {key: metrics}, 'total': metrics summed over detectors}
+        """
+        total = IOCounters()
+        for entry in self.metrics.values():
+            total.add(entry)
+        summary = {'seconds': round(sum(entry['seconds'] for entry in self.metrics.values()), 6)}
+        summary.update(total.as_dict())
+        return {'detectors': dict(self.metrics), 'total': summary}
+    
+    def refresh(self, changed: Iterable[str], structural: bool = False) -> Dict[str, tuple]:
+        """
+        Recompute only the detectors affected by changed paths
+        
+        Uses the inputs recorded for each detector by run_detector(), so
+        analyze() must have run first.
+        
+        Args:
+            changed: Changed paths relative to the root
+            structural: Whether files or directories were added, removed or
+                renamed (the file index is rebuilt)
+        
+        Returns:
+            Mapping of result key to (old value, new value) for results that changed
+        """
+        changed = set(changed)
+        for rel in changed:
+            self._manifests.pop(rel, None)
+            if self._index is not None:
+                self._index.sizes.pop(rel, None)
+        if self._language_stats is not None and changed.intersection(self._language_stats[1]):
+            self._language_stats = None
+        if self._frameworks is not None and changed.intersection(self._frameworks[1]):
+            self._frameworks = None
+        if self._license_match is not None and changed.intersection(self._license_match[1]):
+            self._license_match = None
+        
+        old_index = self._index
+        if structural:
+            self._index = None
+            self._language_stats = None
+            self._frameworks = None
+            self._license_match = None
+            self._manifests.clear()
+        
+        affected = []
+        for key in self.DETECTORS:
+            deps = self.dependencies.get(key)
+            if deps is None or deps & changed:
+                affected.append(key)
+            elif structural and (TREE in deps or old_index is None or any(
+                    old_index.exists(dep) != self.index.exists(dep) for dep in deps)):
+                affected.append(key)
+        
+        updates = {}
+        for key in affected:
+            old = self.analysis.get(key)
+            new = self.run_detector(key)
+            self.analysis[key] = new
+            if new != old:
+                updates[key] = (old, new)
+        return updates
+    
+    def detect_project_name(self) -> Optional[str]:
+        """Detect project name from various sources"""
+        name = self.manifest_field('name', sources=[
+            'package.json', 'setup.py', 'Cargo.toml:package',
+            'pyproject.toml:project', 'pyproject.toml:tool.poetry', 'PKG-INFO',
+        ])
+        if isinstance(name, str):
+            return name
         
         # Fall back to directory name
+        if self.archive is not None:
+            return self.archive.name
         return self.root.name
     
     def detect_language(self) -> Optional[str]:
-        """Detect primary programming language"""
-        # Count files by extension
-        extensions = {}
-        
-        for file in self.root.rglob('*'):
-            if file.is_file() and not any(part.startswith('.') for part in file.parts):
-                ext = file.suffix.lower()
-                if ext:
-                    extensions[ext] = extensions.get(ext, 0) + 1
-        
-        # Map extensions to languages
-        lang_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.rs': 'Rust',
-            '.go': 'Go',
-            '.java': 'Java',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.r': 'R',
-        }
+        """Detect primary programming language (largest share of source bytes)"""
+        stats = self.language_stats()
+        if stats:
+            return next(iter(stats))
         
-        # Find most common language file
+        # No recognized source files: fall back to the most common extension
+        extensions = self.index.extension_counts()
         if extensions:
             most_common_ext = max(extensions, key=extensions.get)
-            return lang_map.get(most_common_ext, most_common_ext[1:].upper())
+            return most_common_ext[1:].upper()
         
         return None
     
+    def language_breakdown(self) -> Optional[Dict[str, Dict]]:
+        """Language breakdown with file counts, bytes and percentages"""
+        return self.language_stats() or None
+    
+    def language_stats(self) -> Dict[str, Dict]:
+        """
+        Compute byte-weighted language statistics, linguist style
+        
+        Vendored and generated paths (EXCLUDED_PATHS_RE) and hidden files
+        are ignored. When there are more than `sample_threshold` source
+        files, at most SAMPLE_PER_LANGUAGE files per language are stat-ed
+        and byte totals are estimated from their mean size. File counts stay
+        exact; each estimated entry carries a 'tolerance', the half-width of
+        the 95% confidence interval of its percentage in percentage points.
+        
+        Returns:
+            Mapping of language to {'files', 'bytes', 'percent'[, 'tolerance']},
+            largest share first
+        """
+        if self._language_stats is None:
+            self._language_stats = self._compute_language_stats()
+        
+        stats, inputs = self._language_stats
+        if self._deps is not None:
+            self._deps.add(TREE)
+            self._deps.update(inputs)
+        return stats
+    
+    def _compute_language_stats(self):
+        """Compute language_stats() result and the files it looked at"""
+        by_language: Dict[str, List[str]] = {}
+        for rel in self.index.visible_files():
+            name = rel.rsplit('/', 1)[-1]
+            dot = name.rfind('.')
+            if dot <= 0:
+                continue
+            language = LANGUAGE_EXTENSIONS.get(name[dot:].lower())
+            if language is None or EXCLUDED_PATHS_RE.search(rel):
+                continue
+            by_language.setdefault(language, []).append(rel)
+        
+        total_files = sum(len(paths) for paths in by_language.values())
+        sampling = self.sample_threshold is not None and total_files > self.sample_threshold
+        rng = random.Random(0)
+        
+        estimates = {}
+        inputs = []
+        for language, paths in by_language.items():
+            count = len(paths)
+            chosen = paths
+            if sampling and count > SAMPLE_PER_LANGUAGE:
+                chosen = rng.sample(paths, SAMPLE_PER_LANGUAGE)
+            inputs.extend(chosen)
+            
+            sizes = [self.index.size(rel) for rel in chosen]
+            n = len(sizes)
+            mean = sum(sizes) / n
+            error = 0.0
+            if n < count and n > 1:
+                variance = sum((size - mean) ** 2 for size in sizes) / (n - 1)
+                # Standard error of the estimated total, with finite population correction
+                error = count * math.sqrt(variance / n * (1 - n / count))
+            estimates[language] = (count, mean * count, error)
+        
+        total_bytes = sum(estimate for _, estimate, _ in estimates.values())
+        total_variance = sum(error ** 2 for _, _, error in estimates.values())
+        stats = {}
+        for language, (count, estimate, error) in sorted(
+                estimates.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+            share = estimate / total_bytes if total_bytes else count / total_files
+            entry = {'files': count, 'bytes': int(round(estimate)), 'percent': round(share * 100, 1)}
+            if sampling:
+                tolerance = 0.0
+                if total_bytes:
+                    # Delta method for share = B_l / B with independent strata
+                    variance = ((1 - share) ** 2 * error ** 2 +
+                                share ** 2 * (total_variance - error ** 2)) / total_bytes ** 2
+                    tolerance = 1.96 * math.sqrt(variance) * 100
+                entry['tolerance'] = round(tolerance, 1)
+            stats[language] = entry
+        
+        return stats, inputs
+    
     def detect_project_type(self) -> str:
         """Detect project type (library, webapp, cli-tool, etc.)"""
         # Check for web framework indicators
@@ -139,30 +720,27 @@ class ProjectAnalyzer:
         ]
         
         for indicator in web_indicators:
-            if (self.root / indicator).exists():
+            if self.index.exists(indicator):
                 return 'webapp'
         
         # Check for CLI indicators
         cli_indicators = ['main.rs', 'cli.py', 'cmd/', 'bin/']
         for indicator in cli_indicators:
-            if (self.root / indicator).exists():
+            if self.index.exists(indicator):
                 # Check if it's a library with CLI
-                if (self.root / 'src' / 'lib.rs').exists() or (self.root / 'lib').exists():
+                if self.index.exists('src/lib.rs') or self.index.exists('lib'):
                     return 'library'
                 return 'cli-tool'
         
         # Check package files
-        if (self.root / 'setup.py').exists() or (self.root / 'Cargo.toml').exists():
+        if self.index.exists('setup.py') or self.index.exists('Cargo.toml'):
             return 'library'
         
-        if (self.root / 'package.json').exists():
-            try:
-                pkg = json.loads((self.root / 'package.json').read_text())
-                if pkg.get('bin'):
-                    return 'cli-tool'
-                return 'library'
-            except:
-                pass
+        pkg = self.manifest('package.json')
+        if pkg is not None:
+            if pkg.get('bin'):
+                return 'cli-tool'
+            return 'library'
         
         return 'application'
     
@@ -185,7 +763,7 @@ class ProjectAnalyzer:
         }
         
         for file, manager in managers.items():
-            if (self.root / file).exists():
+            if self.index.exists(file):
                 return manager
         
         return None
@@ -199,12 +777,12 @@ class ProjectAnalyzer:
         
         for indicator in test_indicators:
             if '*' in indicator:
-                # Pattern matching
-                if list(self.root.rglob(indicator)):
+                # Pattern matching against indexed file names
+                if self.index.has_basename(indicator):
                     return True
             else:
                 # Directory/file check
-                if (self.root / indicator).exists():
+                if self.index.exists(indicator):
                     return True
         
         return False
@@ -222,7 +800,7 @@ class ProjectAnalyzer:
         }
         
         for file, service in ci_files.items():
-            if (self.root / file).exists():
+            if self.index.exists(file):
                 return service
         
         return None
@@ -235,11 +813,81 @@ class ProjectAnalyzer:
         ]
         
         for file in dep_files:
-            if (self.root / file).exists():
+            if self.index.exists(file):
                 return file
         
         return None
     
+    def extract_dependencies(self) -> Optional[List[Dict]]:
+        """
+        List direct dependencies and count transitive ones per ecosystem
+        
+        Direct dependencies come from the manifests (DEPENDENCY_DECLARATIONS)
+        and, for lockfiles that record them, from the lockfile itself. The
+        first lockfile of each ecosystem in DEPENDENCY_LOCKFILES supplies
+        locked versions and the package count; it is streamed, so memory
+        stays bounded however large it is. Without a lockfile, versions are
+        the declared specs and transitive counts are unknown.
+        
+        Returns:
+            [{'ecosystem', 'source', 'direct': [{'name', 'version', 'dev'}],
+            'counts': {'direct', 'transitive', 'total'}}, ...], or None
+        """
+        results = []
+        for ecosystem, lockfiles in DEPENDENCY_LOCKFILES.items():
+            source = next((name for name in lockfiles if self.index.is_file(name)), None)
+            
+            declared: Dict[str, Tuple[str, bool]] = {}
+            manifests = []
+            for kind, manifest, key, development in DEPENDENCY_DECLARATIONS:
+                # A requirements file read as the lockfile knows better which entries are direct
+                if kind != ecosystem or manifest == source:
+                    continue
+                for name, spec in self.declared_requirements(manifest, key):
+                    if ecosystem == 'python':
+                        name = canonical_name(name)
+                        if name == 'python':
+                            continue
+                    if name not in declared:
+                        declared[name] = (spec, development)
+                        manifests.append(manifest)
+            
+            summary = None
+            if source is not None:
+                try:
+                    with self.open_file(source) as raw:
+                        summary = read_lockfile(Path(source), declared, raw)
+                except (OSError, LockfileError):
+                    summary = None
+                else:
+                    if self._counters is not None:
+                        self._counters.read_file(summary['bytes_read'])
+            if not declared and not (summary and summary['packages']):
+                continue
+            
+            direct = dict(declared)
+            for name, development in ((summary or {}).get('direct') or {}).items():
+                direct.setdefault(name, ('', development))
+            versions = summary['versions'] if summary else {}
+            entries = [{'name': name, 'version': versions.get(name) or spec, 'dev': development}
+                       for name, (spec, development) in direct.items()]
+            
+            counts = {'direct': len(entries), 'transitive': None, 'total': None}
+            if summary is not None:
+                # Direct dependencies found in the lockfile, with or without a version
+                present = summary['direct'] if summary['direct'] is not None else versions
+                locked_direct = sum(1 for name in direct if name in present)
+                counts['transitive'] = max(summary['packages'] - locked_direct, 0)
+                counts['total'] = counts['direct'] + counts['transitive']
+            results.append({
+                'ecosystem': ecosystem,
+                'source': source if summary is not None else (manifests[0] if manifests else None),
+                'direct': entries,
+                'counts': counts,
+            })
+        
+        return results or None
+    
     def detect_build_system(self) -> Optional[str]:
         """Detect build system"""
         build_systems = {
@@ -253,154 +901,356 @@ class ProjectAnalyzer:
         }
         
         for file, system in build_systems.items():
-            if (self.root / file).exists():
+            if self.index.exists(file):
                 return system
         
         return None
     
     def detect_framework(self) -> Optional[str]:
-        """Detect web framework"""
-        # Check package.json
-        pkg_json = self.root / 'package.json'
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                
-                frameworks = ['react', 'vue', 'angular', 'svelte', 'next', 'nuxt', 'express']
-                for fw in frameworks:
-                    if fw in deps:
-                        return fw
-            except:
-                pass
-        
-        # Check Python frameworks
-        if (self.root / 'manage.py').exists():
-            return 'django'
-        
-        if (self.root / 'app.py').exists() or (self.root / 'main.py').exists():
-            try:
-                for py_file in self.root.glob('*.py'):
-                    content = py_file.read_text()
-                    if 'from flask import' in content or 'import flask' in content:
-                        return 'flask'
-                    if 'from fastapi import' in content or 'import fastapi' in content:
-                        return 'fastapi'
-            except:
-                pass
+        """Detect the best-supported framework"""
+        ranking = self.framework_scores()
+        return ranking[0]['name'] if ranking else None
+    
+    def framework_ranking(self) -> Optional[List[Dict]]:
+        """Frameworks ranked by score, with their evidence"""
+        return self.framework_scores() or None
+    
+    def framework_scores(self) -> List[Dict]:
+        """
+        Rank frameworks by manifest declarations and source imports
         
-        return None
+        The leading import block of each Python and JavaScript/TypeScript
+        source file (at most MAX_IMPORT_SCAN_FILES files, `import_bytes`
+        bytes each) is scanned in a thread pool, or in one pass over an
+        archive. A framework's score is the mean of its declaration (1 as a
+        dependency or via Django's manage.py, 0.5 as a development
+        dependency only) and the share of scanned files of its language
+        that import it.
+        
+        Returns:
+            [{'name', 'score', 'declared', 'files'}, ...], highest score first,
+            where 'declared' is the manifest (and key) declaring the
+            framework or None, and 'files' counts the files importing it
+        """
+        if self._frameworks is None:
+            self._frameworks = self._compute_framework_scores()
+        
+        ranking, inputs = self._frameworks
+        if self._deps is not None:
+            self._deps.add(TREE)
+            self._deps.update(inputs)
+        return ranking
+    
+    def _compute_framework_scores(self):
+        """Compute framework_scores() result and the files it looked at"""
+        declared = {}
+        for ecosystem, manifest, key, development in DEPENDENCY_DECLARATIONS:
+            if ecosystem not in ('npm', 'python'):
+                continue
+            for package, _ in self.declared_requirements(manifest, key):
+                name = JS_FRAMEWORKS.get(package) or PYTHON_FRAMEWORKS.get(package)
+                if name is not None and name not in declared:
+                    declared[name] = (f"{manifest}:{key.replace('.*', '')}", development)
+        if 'django' not in declared and self.index.is_file('manage.py'):
+            declared['django'] = ('manage.py', False)
+        
+        sources = []
+        for rel in self.index.visible_files():
+            dot = rel.rfind('.')
+            kind = SOURCE_KINDS.get(rel[dot:].lower()) if dot > rel.rfind('/') + 1 else None
+            if kind is not None and not EXCLUDED_PATHS_RE.search(rel):
+                sources.append((rel, kind))
+        if len(sources) > MAX_IMPORT_SCAN_FILES:
+            sources.sort(key=lambda source: (source[0].count('/'), source[0]))
+            del sources[MAX_IMPORT_SCAN_FILES:]
+        
+        def scan(chunk):
+            return [scan_file(str(self.root / rel), kind, self.import_bytes,
+                              JS_FRAMEWORKS if kind == 'js' else PYTHON_FRAMEWORKS)
+                    for rel, kind in chunk]
+        
+        if self.archive is not None:
+            # All heads in one pass over a tar archive instead of one pass per file
+            heads = self.archive.read_heads([rel for rel, _ in sources], self.import_bytes)
+            results = [scan_head(heads[rel], kind, self.import_bytes,
+                                 JS_FRAMEWORKS if kind == 'js' else PYTHON_FRAMEWORKS)
+                       if rel in heads else ([], 0) for rel, kind in sources]
+        else:
+            # Chunked so that small trees skip the pool and large ones do not
+            # pay for one future per file
+            chunks = [sources[i:i + IMPORT_SCAN_CHUNK] for i in range(0, len(sources), IMPORT_SCAN_CHUNK)]
+            if len(chunks) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=self.workspace_jobs) as executor:
+                    results = [result for chunk in executor.map(scan, chunks) for result in chunk]
+            else:
+                results = scan(sources)
+        
+        scanned = {'python': 0, 'js': 0}
+        importers: Dict[str, int] = {}
+        for (_, kind), (packages, size) in zip(sources, results):
+            # Counted here since worker threads must not share the counters
+            if self._counters is not None:
+                self._counters.read_file(size)
+            scanned[kind] += 1
+            frameworks = JS_FRAMEWORKS if kind == 'js' else PYTHON_FRAMEWORKS
+            for name in {frameworks[package] for package in packages if package in frameworks}:
+                importers[name] = importers.get(name, 0) + 1
+        
+        ranking = []
+        for frameworks, kind in ((JS_FRAMEWORKS, 'js'), (PYTHON_FRAMEWORKS, 'python')):
+            for name in frameworks.values():
+                if name not in declared and name not in importers:
+                    continue
+                where, development = declared.get(name, (None, False))
+                declaration = 0.0 if where is None else 0.5 if development else 1.0
+                files = importers.get(name, 0)
+                share = files / scanned[kind] if scanned[kind] else 0.0
+                ranking.append({'name': name, 'score': round((declaration + share) / 2, 3),
+                                'declared': where, 'files': files})
+        # Stable sort: equal scores keep the JS_FRAMEWORKS/PYTHON_FRAMEWORKS order
+        ranking.sort(key=lambda entry: -entry['score'])
+        
+        inputs = list(dict.fromkeys(manifest for ecosystem, manifest, _, _ in DEPENDENCY_DECLARATIONS
+                                    if ecosystem in ('npm', 'python'))) + ['manage.py']
+        inputs.extend(rel for rel, _ in sources)
+        return ranking, inputs
     
     def extract_description(self) -> Optional[str]:
         """Extract project description"""
-        # Try package.json
-        pkg_json = self.root / 'package.json'
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                if 'description' in data:
-                    return data['description']
-            except:
-                pass
-        
-        # Try Cargo.toml
-        cargo_toml = self.root / 'Cargo.toml'
-        if cargo_toml.exists():
-            content = cargo_toml.read_text()
-            match = re.search(r'description\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+        description = self.manifest_field('description', sources=[
+            'package.json', 'Cargo.toml:package', 'pyproject.toml:project',
+            'pyproject.toml:tool.poetry', 'setup.py', 'PKG-INFO',
+        ])
+        if isinstance(description, str):
+            return description
         
         # Try README
-        for readme in ['README.md', 'README.rst', 'README.txt']:
-            readme_path = self.root / readme
-            if readme_path.exists():
-                try:
-                    lines = readme_path.read_text().split('\n')
-                    # Find first substantial line after title
-                    for line in lines[1:10]:
-                        line = line.strip()
-                        if line and not line.startswith('#') and not line.startswith('[') and len(line) > 20:
-                            return line.strip('> ').strip()
-                except:
-                    pass
+        for readme in README_FILES:
+            content = self.read_text(readme)
+            if content is not None:
+                lines = content.split('\n')
+                # Find first substantial line after title
+                for line in lines[1:10]:
+                    line = line.strip()
+                    if line and not line.startswith('#') and not line.startswith('[') and len(line) > 20:
+                        return line.strip('> ').strip()
         
         return None
     
     def extract_version(self) -> Optional[str]:
         """Extract project version"""
-        # Try package.json
-        pkg_json = self.root / 'package.json'
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                return data.get('version')
-            except:
-                pass
-        
-        # Try Cargo.toml
-        cargo_toml = self.root / 'Cargo.toml'
-        if cargo_toml.exists():
-            content = cargo_toml.read_text()
-            match = re.search(r'version\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
-        
-        # Try setup.py
-        setup_py = self.root / 'setup.py'
-        if setup_py.exists():
-            content = setup_py.read_text()
-            match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-            if match:
-                return match.group(1)
+        version = self.manifest_field('version', sources=[
+            'package.json', 'Cargo.toml:package', 'setup.py',
+            'pyproject.toml:project', 'pyproject.toml:tool.poetry', 'PKG-INFO',
+        ])
+        if isinstance(version, str):
+            return version
         
         return None
     
     def detect_license(self) -> Optional[str]:
-        """Detect license type"""
-        license_files = ['LICENSE', 'LICENSE.txt', 'LICENSE.md', 'COPYING']
+        """Detect license as an SPDX ID (or the manifest's license expression)"""
+        match = self.license_match()
+        return match['id'] if match else None
+    
+    def license_details(self) -> Optional[Dict]:
+        """License with the confidence of the match and where it was found"""
+        return self.license_match()
+    
+    def license_match(self) -> Optional[Dict]:
+        """
+        Identify the project license
         
-        for license_file in license_files:
-            path = self.root / license_file
-            if path.exists():
-                try:
-                    content = path.read_text()
-                    # Simple license detection
-                    if 'MIT License' in content:
-                        return 'MIT'
-                    elif 'Apache License' in content and '2.0' in content:
-                        return 'Apache-2.0'
-                    elif 'GNU GENERAL PUBLIC LICENSE' in content and 'Version 3' in content:
-                        return 'GPL-3.0'
-                    elif 'BSD' in content:
-                        return 'BSD'
-                except:
-                    pass
-        
-        # Check package.json
-        pkg_json = self.root / 'package.json'
-        if pkg_json.exists():
-            try:
-                data = json.loads(pkg_json.read_text())
-                return data.get('license')
-            except:
-                pass
+        License files in the root are identified from their first HEAD_BYTES
+        by license_index.identify(), so the cost does not grow with the size
+        of the license text. When the matched license is part of the license
+        expression a manifest declares (e.g. 'MIT OR Apache-2.0'), the
+        expression is returned instead. Without a recognizable license file
+        the manifest's license is used as is.
         
-        return None
+        Returns:
+            {'id', 'confidence', 'source'} where confidence is None for a
+            license taken from a manifest alone, or None if nothing is found
+        """
+        if self._license_match is None:
+            self._license_match = self._compute_license_match()
+        
+        match, inputs = self._license_match
+        if self._deps is not None:
+            self._deps.add(TREE)
+            self._deps.update(inputs)
+        return match
+    
+    def _compute_license_match(self):
+        """Compute license_match() result and the files it looked at"""
+        def preference(name: str) -> tuple:
+            upper = name.upper()
+            if upper.startswith(('COPYING.LESSER', 'COPYING.LIB')):
+                rank = 0
+            elif upper.split('.', 1)[0] in ('LICENSE', 'LICENCE'):
+                rank = 1
+            elif upper.split('.', 1)[0] == 'COPYING':
+                rank = 2
+            else:
+                rank = 3
+            return rank, name
+        
+        candidates = sorted((name for name in self.index.root_files() if LICENSE_FILE_RE.match(name)),
+                            key=preference)
+        inputs = list(candidates) + [source.partition(':')[0] for source in LICENSE_SOURCES]
+        
+        declared = self.manifest_field('license', sources=LICENSE_SOURCES)
+        if isinstance(declared, dict):
+            # pyproject.toml allows license = { text = "..." }
+            declared = declared.get('text')
+        if not isinstance(declared, str):
+            declared = None
+        
+        for name in candidates:
+            head = self.read_head(name, HEAD_BYTES)
+            found = identify(head) if head else None
+            if found is None:
+                continue
+            spdx_id, confidence = found
+            if declared and any(term == spdx_id or term.startswith((spdx_id + '-', spdx_id + '+'))
+                                for term in re.split(r'[\s()]+', declared)):
+                spdx_id = declared
+            return {'id': spdx_id, 'confidence': confidence, 'source': name}, inputs
+        
+        if declared:
+            return {'id': declared, 'confidence': None, 'source': 'manifest'}, inputs
+        return None, inputs
     
     def has_documentation(self) -> bool:
         """Check if project has documentation"""
         doc_indicators = ['docs/', 'doc/', 'documentation/', 'README.md']
         
         for indicator in doc_indicators:
-            if (self.root / indicator).exists():
+            if self.index.exists(indicator):
                 return True
         
         return False
     
     def is_git_repo(self) -> bool:
         """Check if project is a git repository"""
-        return (self.root / '.git').exists()
+        return self.index.exists('.git')
+    
+    def discover_workspace(self) -> Dict[str, List[str]]:
+        """
+        Discover monorepo workspace members
+        
+        Reads npm/yarn `workspaces` from package.json, pnpm-workspace.yaml,
+        `[workspace] members` from Cargo.toml, go.work and uv workspaces.
+        A Python repository without a root package whose subdirectories
+        hold pyproject.toml/setup.py files is treated as a multi-package repo.
+        
+        Returns:
+            Mapping of workspace kind to member directories relative to the root
+        """
+        patterns: Dict[str, List[str]] = {}
+        excludes: Dict[str, List[str]] = {}
+        heuristic = None
+        
+        pkg = self.manifest('package.json')
+        if pkg is not None:
+            workspaces = pkg.get('workspaces')
+            if isinstance(workspaces, dict):
+                workspaces = workspaces.get('packages')
+            if isinstance(workspaces, list):
+                patterns['npm'] = workspaces
+        
+        pnpm = self.manifest('pnpm-workspace.yaml')
+        if pnpm:
+            patterns['pnpm'] = pnpm['packages']
+        
+        cargo_workspace = self.manifest_field('members', sources=['Cargo.toml:workspace'])
+        if isinstance(cargo_workspace, list):
+            patterns['cargo'] = cargo_workspace
+            excludes['cargo'] = self.manifest_field('exclude', sources=['Cargo.toml:workspace']) or []
+        
+        go_work = self.manifest('go.work')
+        if go_work:
+            patterns['go'] = go_work['use']
+        
+        uv_workspace = self.manifest_field('members', sources=['pyproject.toml:tool.uv.workspace'])
+        if isinstance(uv_workspace, list):
+            patterns['python'] = uv_workspace
+            excludes['python'] = self.manifest_field('exclude', sources=['pyproject.toml:tool.uv.workspace']) or []
+        elif (self.manifest_field('name', sources=['pyproject.toml:project', 'setup.py']) is None and
+              self.index.has_basename('pyproject.toml')):
+            # Heuristic: only counts with at least two packages (see below)
+            patterns['python'] = ['*', '*/*']
+            heuristic = 'python'
+        
+        dirs = None
+        members = {}
+        for kind, kind_patterns in patterns.items():
+            include = [p for p in kind_patterns if isinstance(p, str) and not p.startswith('!')]
+            exclude = [p[1:] for p in kind_patterns if isinstance(p, str) and p.startswith('!')]
+            exclude += [p for p in excludes.get(kind, []) if isinstance(p, str)]
+            if not include:
+                continue
+            
+            if dirs is None:
+                dirs = sorted(self.index.all_dirs())
+            include_re = workspace_pattern(include)
+            exclude_re = workspace_pattern(exclude) if exclude else None
+            manifest = self.WORKSPACE_MEMBER_MANIFESTS[kind]
+            
+            found = [
+                rel for rel in dirs
+                if include_re.match(rel) and not (exclude_re and exclude_re.match(rel))
+                and self.index.is_file(f"{rel}/{manifest}")
+            ]
+            if found and (kind != heuristic or len(found) > 1):
+                members[kind] = found
+        
+        return members
+    
+    def detect_workspace(self) -> Optional[Dict]:
+        """
+        Analyze every workspace member concurrently over the shared file index
+        
+        Returns:
+            {'kinds': [...], 'packages': {member_dir: analysis}}, or None
+            if the project is not a workspace
+        """
+        members = self.discover_workspace()
+        if not members:
+            return None
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        member_dirs = list(dict.fromkeys(rel for found in members.values() for rel in found))
+        
+        def analyze_member(rel: str):
+            analyzer = ProjectAnalyzer(
+                str(self.root / rel), prune=self.prune, index=self.index.subindex(rel),
+                sample_threshold=self.sample_threshold, use_git_index=self.use_git_index,
+                metrics=self.metrics_enabled, manifest_cache=self.manifest_cache,
+                import_bytes=self.import_bytes, workspace_jobs=self.workspace_jobs,
+                archive=self.archive.subarchive(rel) if self.archive is not None else None
+            )
+            return analyzer.analyze(), analyzer.dependencies
+        
+        with ThreadPoolExecutor(max_workers=self.workspace_jobs) as executor:
+            results = list(executor.map(analyze_member, member_dirs))
+        
+        packages = {}
+        for rel, (analysis, dependencies) in zip(member_dirs, results):
+            # Member filesystem calls are counted towards this detector;
+            # results stay the same with or without metrics
+            metrics = analysis.pop('_metrics', None)
+            if self._counters is not None and metrics is not None:
+                self._counters.add(metrics['total'])
+            packages[rel] = analysis
+            # Member inputs are inputs of this detector too
+            if self._deps is not None:
+                for deps in dependencies.values():
+                    self._deps.update(dep if dep == TREE else f"{rel}/{dep}" for dep in deps)
+        
+        return {'kinds': list(members), 'packages': packages}
     
     def print_analysis(self):
         """Print analysis results in a readable format"""
@@ -409,20 +1259,380 @@ class ProjectAnalyzer:
         print("="*60 + "\n")
         
         for key, value in self.analysis.items():
-            if value is not None:
+            if key == '_metrics':
+                continue
+            if key == 'workspace' and value:
+                print(f"{'Workspace':.<30} {', '.join(value['kinds'])} ({len(value['packages'])} packages)")
+                for rel, package in value['packages'].items():
+                    print(f"  {rel:.<28} {package['project_name']} "
+                          f"[{package['language']}, {package['project_type']}]")
+            elif key == 'languages' and value:
+                shares = ', '.join(f"{language} {entry['percent']}%" for language, entry in value.items())
+                print(f"{'Languages':.<30} {shares}")
+            elif key == 'dependencies' and value:
+                summaries = []
+                for entry in value:
+                    counts = entry['counts']
+                    transitive = '' if counts['transitive'] is None else f", {counts['transitive']} transitive"
+                    summaries.append(f"{entry['ecosystem']} {counts['direct']} direct{transitive} ({entry['source']})")
+                print(f"{'Dependencies':.<30} {'; '.join(summaries)}")
+            elif key == 'frameworks' and value:
+                scores = ', '.join(f"{entry['name']} {entry['score']}" for entry in value)
+                print(f"{'Frameworks':.<30} {scores}")
+            elif value is not None:
                 key_display = key.replace('_', ' ').title()
                 print(f"{key_display:.<30} {value}")
         
         print("\n" + "="*60 + "\n")
+        
+        if '_metrics' in self.analysis:
+            self.print_metrics()
+    
+    def print_metrics(self):
+        """Print per-detector metrics, slowest first"""
+        metrics = self.analysis['_metrics']
+        print(f"{'Detector':<26} {'ms':>9} {'stat':>7} {'open':>6} {'read':>6} "
+              f"{'scandir':>8} {'bytes read':>11} {'files':>8}")
+        rows = sorted(metrics['detectors'].items(), key=lambda item: item[1]['seconds'], reverse=True)
+        for key, entry in rows + [('total', metrics['total'])]:
+            name = key + (' (cached)' if entry.get('cached') else '')
+            print(f"{name:<26} {entry['seconds'] * 1000:>9.2f} {entry['stat']:>7} {entry['open']:>6} "
+                  f"{entry['read']:>6} {entry['scandir']:>8} {entry['bytes_read']:>11} "
+                  f"{entry['files_visited']:>8}")
+        print()
+
+
+def parse_json_manifest(content: str) -> Optional[Dict]:
+    """Parse a JSON manifest such as package.json"""
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def parse_toml_manifest(content: str) -> Optional[Dict]:
+    """Parse a TOML manifest such as Cargo.toml or pyproject.toml"""
+    if tomllib is not None:
+        try:
+            return tomllib.loads(content)
+        except tomllib.TOMLDecodeError:
+            return None
+    
+    # Minimal fallback without tomllib/tomli: tables and string values only
+    data: Dict = {}
+    table = data
+    for line in content.split('\n'):
+        line = line.strip()
+        header = re.match(r'^\[([^\[\]]+)\]$', line)
+        if header:
+            table = data
+            for key in header.group(1).strip().split('.'):
+                table = table.setdefault(key.strip().strip('"'), {})
+            continue
+        match = re.match(r'^([\w.-]+)\s*=\s*"([^"]*)"', line)
+        if match and isinstance(table, dict):
+            table[match.group(1)] = match.group(2)
+    return data
+
+
+def parse_setup_py(content: str) -> Optional[Dict]:
+    """Extract literal keyword arguments of the setup() call in setup.py"""
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return None
+    
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        func_name = func.attr if isinstance(func, ast.Attribute) else getattr(func, 'id', None)
+        if func_name != 'setup':
+            continue
+        
+        data = {}
+        for keyword in node.keywords:
+            if keyword.arg is None:
+                continue
+            try:
+                data[keyword.arg] = ast.literal_eval(keyword.value)
+            except (ValueError, TypeError, SyntaxError):
+                continue
+        return data
+    
+    return None
+
+
+def parse_requirements(content: str) -> Optional[Dict]:
+    """Read requirement lines from requirements.txt, skipping options and comments"""
+    requirements = []
+    for line in content.split('\n'):
+        line = line.split(' #', 1)[0].strip()
+        if line and not line.startswith(('#', '-')):
+            requirements.append(line)
+    return {'dependencies': requirements}
+
+
+def parse_pkg_info(content: str) -> Optional[Dict]:
+    """
+    Read core metadata from PKG-INFO (sdists) or METADATA (wheels)
+    
+    Summary is returned as 'description', and Requires-Dist entries that
+    only apply to an extra are grouped under 'optional_dependencies'.
+    """
+    headers = HeaderParser().parsestr(content)
+    if headers.get('Metadata-Version') is None:
+        return None
+    
+    def field(name: str) -> Optional[str]:
+        value = (headers.get(name) or '').strip()
+        return value if value and value != 'UNKNOWN' else None
+    
+    license_id = field('License-Expression')
+    if license_id is None:
+        # Older metadata often holds the whole license text here
+        license_id = field('License')
+        if license_id is not None and ('\n' in license_id or len(license_id) > 64):
+            license_id = None
+    
+    requires, extras = [], {}
+    for requirement in headers.get_all('Requires-Dist') or []:
+        extra = EXTRA_MARKER_RE.search(requirement)
+        if extra:
+            extras.setdefault(extra.group(1), []).append(requirement)
+        else:
+            requires.append(requirement)
+    return {
+        'name': field('Name'),
+        'version': field('Version'),
+        'description': field('Summary'),
+        'license': license_id,
+        'requires_dist': requires,
+        'optional_dependencies': extras,
+    }
+
+
+def requirement_specs(requirements: Any) -> List[Tuple[str, str]]:
+    """
+    (name, version spec) pairs from a list of requirements or a name -> version table
+    
+    Names in requirement strings (PEP 508, e.g. 'Flask[async]>=2') are
+    lower-cased. Table keys such as npm package names are returned as is;
+    table values are a version or a table with a 'version' (Cargo, Poetry).
+    """
+    specs = []
+    if isinstance(requirements, dict):
+        for name, spec in requirements.items():
+            if isinstance(spec, dict):
+                spec = spec.get('version')
+            specs.append((name, spec if isinstance(spec, str) else ''))
+    elif isinstance(requirements, list):
+        for requirement in requirements:
+            match = REQUIREMENT_RE.match(requirement) if isinstance(requirement, str) else None
+            if match:
+                specs.append((match.group(1).lower().replace('_', '-'), match.group(2).split(';', 1)[0].strip()))
+    return specs
+
+
+def parse_go_mod(content: str) -> Optional[Dict]:
+    """Read the module path and `require` directives (single-line and block form) from go.mod"""
+    module = None
+    requires = {}
+    indirect = {}
+    in_block = False
+    for line in content.split('\n'):
+        line, _, comment = line.partition('//')
+        line = line.strip()
+        if in_block:
+            if line == ')':
+                in_block = False
+                continue
+            entry = line
+        elif line.startswith('module'):
+            module = line[len('module'):].strip().strip('"')
+            continue
+        elif line.startswith('require'):
+            entry = line[len('require'):].strip()
+            if entry == '(':
+                in_block = True
+                continue
+        else:
+            continue
+        parts = entry.split()
+        if len(parts) == 2:
+            (indirect if comment.strip() == 'indirect' else requires)[parts[0]] = parts[1]
+    return {'module': module, 'require': requires, 'indirect': indirect}
+
+
+def parse_pnpm_workspace(content: str) -> Optional[Dict]:
+    """Read the `packages:` list from pnpm-workspace.yaml"""
+    packages = []
+    in_packages = False
+    for line in content.split('\n'):
+        stripped = line.split('#', 1)[0].rstrip()
+        if not stripped:
+            continue
+        if not line[0].isspace() and not stripped.startswith('-'):
+            in_packages = stripped.startswith('packages:')
+            continue
+        if in_packages and stripped.lstrip().startswith('-'):
+            packages.append(stripped.lstrip()[1:].strip().strip('"\''))
+    return {'packages': packages}
+
+
+def parse_go_work(content: str) -> Optional[Dict]:
+    """Read `use` directives (single-line and block form) from go.work"""
+    uses = []
+    in_block = False
+    for line in content.split('\n'):
+        line = line.split('//', 1)[0].strip()
+        if in_block:
+            if line == ')':
+                in_block = False
+            elif line:
+                uses.append(line)
+        elif line.startswith('use'):
+            rest = line[3:].strip()
+            if rest == '(':
+                in_block = True
+            elif rest:
+                uses.append(rest)
+    return {'use': [use.strip('"') for use in uses]}
+
+
+def workspace_pattern(patterns: List[str]) -> 're.Pattern':
+    """
+    Compile workspace member globs into one regex over relative directories
+    
+    '*' matches within one path segment and '**' across segments.
+    """
+    parts = []
+    for pattern in patterns:
+        pattern = pattern.strip().rstrip('/')
+        while pattern.startswith('./'):
+            pattern = pattern[2:]
+        regex = ''
+        i = 0
+        while i < len(pattern):
+            if pattern.startswith('**', i):
+                regex += '.*'
+                i += 2
+            elif pattern[i] == '*':
+                regex += '[^/]*'
+                i += 1
+            elif pattern[i] == '?':
+                regex += '[^/]'
+                i += 1
+            else:
+                regex += re.escape(pattern[i])
+                i += 1
+        parts.append(regex)
+    return re.compile('(?:' + '|'.join(parts) + ')$')
+
+
+MANIFEST_PARSERS = {
+    'package.json': parse_json_manifest,
+    'Cargo.toml': parse_toml_manifest,
+    'pyproject.toml': parse_toml_manifest,
+    'setup.py': parse_setup_py,
+    'requirements.txt': parse_requirements,
+    'Pipfile': parse_toml_manifest,
+    'PKG-INFO': parse_pkg_info,
+    'go.mod': parse_go_mod,
+    'pnpm-workspace.yaml': parse_pnpm_workspace,
+    'go.work': parse_go_work,
+}
+
+
+def analyze_path(project_dir: str, use_cache: bool = False,
+                 sample_threshold: Optional[int] = 5000, use_git_index: bool = True,
+                 metrics: bool = False, import_bytes: int = DEFAULT_IMPORT_BYTES) -> Dict:
+    """
+    Analyze one project for batch mode, isolating any failure
+    
+    Args:
+        project_dir: Project root directory or source archive
+        use_cache: Use the persistent per-project analysis cache (not
+            for archives, which are not expected to change)
+        sample_threshold: See ProjectAnalyzer
+        use_git_index: See ProjectAnalyzer
+        metrics: See ProjectAnalyzer
+        import_bytes: See ProjectAnalyzer
+    
+    Returns:
+        {'path', 'ok', 'result'} on success, {'path', 'ok', 'error'} on failure
+    """
+    try:
+        analyzer = ProjectAnalyzer(project_dir, sample_threshold=sample_threshold,
+                                   use_git_index=use_git_index, metrics=metrics,
+                                   import_bytes=import_bytes)
+        cache = None
+        if use_cache and analyzer.archive is None:
+            cache = AnalysisCache(analyzer.root, config=analyzer.cache_config())
+        return {'path': project_dir, 'ok': True, 'result': analyzer.analyze(cache)}
+    except Exception as e:
+        return {'path': project_dir, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
 
 
 def main():
     """Main entry point for command-line usage"""
-    project_dir = sys.argv[1] if len(sys.argv) > 1 else '.'
+    parser = argparse.ArgumentParser(description='Analyze a project directory or source archive')
+    parser.add_argument('project_dir', nargs='*',
+                        help='Project root directory, or .tar.gz/.tar.zst/.zip/.whl archive '
+                             '(several paths or globs with --batch)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse results from the previous run for unchanged inputs')
+    parser.add_argument('--cache-dir',
+                        help='Cache directory (default: <project>/.cache/readme-generator, implies --cache)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Analyze many projects in parallel and print one JSON line per project')
+    parser.add_argument('--from-file', metavar='FILE',
+                        help="With --batch, read project roots from FILE ('-' for stdin)")
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--quiet', action='store_true', help='Suppress progress output on stderr')
+    parser.add_argument('--sample-threshold', type=int, default=5000, metavar='N',
+                        help='Estimate language bytes from a sample above N source files (0 disables)')
+    parser.add_argument('--import-bytes', type=int, default=DEFAULT_IMPORT_BYTES, metavar='N',
+                        help='Bytes read from the start of each source file to find framework imports '
+                             f'(default: {DEFAULT_IMPORT_BYTES})')
+    parser.add_argument('--no-git-index', action='store_true',
+                        help='Walk the working tree even in git repositories')
+    parser.add_argument('--metrics', action='store_true',
+                        help="Record time and filesystem calls per detector (under '_metrics' in the JSON)")
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and re-analyze/re-validate only what changed on file changes')
+    parser.add_argument('--readme', metavar='PATH',
+                        help='README validated in --watch mode (default: <project>/README.md)')
+    parser.add_argument('--poll', action='store_true',
+                        help='Use polling instead of inotify in --watch mode')
+    args = parser.parse_args()
+    
+    if args.batch or args.from_file:
+        roots = expand_paths(args.project_dir, args.from_file,
+                             match=lambda path: os.path.isdir(path) or is_archive(path))
+        worker = functools.partial(analyze_path, use_cache=args.cache,
+                                   sample_threshold=args.sample_threshold or None,
+                                   use_git_index=not args.no_git_index, metrics=args.metrics,
+                                   import_bytes=args.import_bytes)
+        progress = run_batch(worker, roots, jobs=args.jobs, label='analyzed', quiet=args.quiet)
+        sys.exit(1 if progress.errors else 0)
+    
+    if len(args.project_dir) > 1:
+        parser.error('multiple project directories require --batch')
+    if args.project_dir and archive_format(args.project_dir[0]) and (args.cache or args.cache_dir or args.watch):
+        parser.error('--cache and --watch need a project directory, not an archive')
     
     try:
-        analyzer = ProjectAnalyzer(project_dir)
-        results = analyzer.analyze()
+        analyzer = ProjectAnalyzer(args.project_dir[0] if args.project_dir else '.',
+                                   sample_threshold=args.sample_threshold or None,
+                                   use_git_index=not args.no_git_index, metrics=args.metrics,
+                                   import_bytes=args.import_bytes)
+        cache = None
+        if args.cache or args.cache_dir:
+            cache = AnalysisCache(analyzer.root, args.cache_dir, analyzer.cache_config())
+        results = analyzer.analyze(cache)
         
         # Print results
         analyzer.print_analysis()
@@ -430,6 +1640,11 @@ def main():
         # Also output as JSON
         print("JSON Output:")
         print(json.dumps(results, indent=2))
+        
+        if args.watch:
+            from watch import run_watch
+            readme = Path(args.readme) if args.readme else analyzer.root / 'README.md'
+            run_watch(analyzer, readme, poll=args.poll)
     
     except Exception as e:
         print(f"Error analyzing project: {e}")
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Batch Runner
+
+Fans a per-path worker function out over a process pool and streams one
+JSON line per result as soon as it finishes. Shared by the fleet modes of
+analyze_project.py and validate_readme.py.
+"""
+
+import functools
+import glob
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, TextIO
+
+
+def expand_paths(patterns: Iterable[str], list_file: Optional[str] = None,
+                 match: Optional[Callable[[str], bool]] = None) -> List[str]:
+    """
+    Expand glob patterns and path lists into a list of paths
+    
+    Args:
+        patterns: Paths or glob patterns (recursive '**' supported)
+        list_file: Optional file with one path per line ('-' for stdin)
+        match: Optional filter applied to glob matches (explicit paths are
+            kept so that they are reported if invalid)
+    
+    Returns:
+        Paths in input order, without duplicates
+    """
+    paths = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            paths.extend(path for path in matches if match is None or match(path))
+        else:
+            paths.append(pattern)
+    
+    if list_file:
+        stream = sys.stdin if list_file == '-' else open(list_file, encoding='utf-8')
+        with stream:
+            paths.extend(line.strip() for line in stream if line.strip())
+    
+    return list(dict.fromkeys(paths))
+
+
+class Progress:
+    """Throughput counters printed to stderr"""
+    
+    def __init__(self, total: int, label: str, stream: Optional[TextIO] = sys.stderr,
+                 interval: float = 1.0):
+        """
+        Initialize progress reporter
+        
+        Args:
+            total: Number of items to process
+            label: Verb shown in the progress line (e.g. 'analyzed')
+            stream: Output stream for progress lines (None to count silently)
+            interval: Minimum seconds between progress lines
+        """
+        self.total = total
+        self.label = label
+        self.stream = stream
+        self.interval = interval
+        self.done = 0
+        self.errors = 0
+        self.start = time.monotonic()
+        self._last = 0.0
+    
+    def update(self, ok: bool):
+        """Count one finished item and print a progress line if due"""
+        self.done += 1
+        if not ok:
+            self.errors += 1
+        
+        now = time.monotonic()
+        if now - self._last >= self.interval or self.done == self.total:
+            self._last = now
+            self.report()
+    
+    def report(self):
+        """Print the current counters"""
+        if self.stream is None:
+            return
+        elapsed = max(time.monotonic() - self.start, 1e-9)
+        print(
+            f"{self.label} {self.done}/{self.total} "
+            f"({self.done / elapsed:.1f}/s, {elapsed:.1f}s elapsed), {self.errors} error(s)",
+            file=self.stream, flush=True
+        )
+
+
+# Queue on which pool processes announce the path they start (set by
+# _init_worker in each process)
+_started = None
+
+
+def _init_worker(started):
+    """Pool initializer: remember the queue for start announcements"""
+    global _started
+    _started = started
+
+
+def _tracked(worker: Callable[[str], Dict], path: str) -> Dict:
+    """Announce a path as started, then run the worker on it"""
+    # SimpleQueue writes synchronously, so the announcement survives a
+    # worker that dies right after
+    _started.put(path)
+    return worker(path)
+
+
+def run_batch(worker: Callable[[str], Dict], paths: List[str], jobs: Optional[int] = None,
+              out: TextIO = sys.stdout, label: str = 'processed', quiet: bool = False,
+              on_result: Optional[Callable[[Dict], None]] = None) -> Progress:
+    """
+    Run a worker over many paths in a process pool, streaming JSONL results
+    
+    The worker must be a picklable top-level function returning a
+    JSON-serializable dict and should catch its own per-path errors. A
+    worker process that dies outright (segfault, OOM kill) breaks the pool:
+    the paths it may have been running are then retried one at a time in a
+    pool of their own, so the crash is reported as an error line for that
+    path only, and paths that had not started go to a fresh pool.
+    
+    Args:
+        worker: Function called with one path per task
+        paths: Paths to process
+        jobs: Number of worker processes (defaults to the CPU count)
+        out: Output stream for JSON lines
+        label: Verb used in progress lines
+        quiet: Suppress progress lines on stderr
+        on_result: Optional callback invoked with each result dict
+    
+    Returns:
+        Final Progress counters
+    """
+    # Imported here: the process pool machinery is slow to import and only
+    # batch runs need it
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from concurrent.futures.process import BrokenProcessPool
+    
+    jobs = jobs or os.cpu_count() or 1
+    progress = Progress(len(paths), label, stream=None if quiet else sys.stderr)
+    started = multiprocessing.SimpleQueue()
+    task = functools.partial(_tracked, worker)
+    
+    def emit(result: Dict):
+        out.write(json.dumps(result, ensure_ascii=False) + '\n')
+        out.flush()
+        progress.update(result.get('ok', True))
+        if on_result is not None:
+            on_result(result)
+    
+    waiting = list(paths)
+    # Paths that were running when a worker died, retried in isolation
+    suspects: List[str] = []
+    while waiting or suspects:
+        if suspects:
+            batch, workers = [suspects.pop(0)], 1
+        else:
+            batch, workers, waiting = waiting, jobs, []
+        
+        finished = set()
+        broken = None
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(started,)) as executor:
+            futures = {executor.submit(task, path): path for path in batch}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    broken = e
+                    continue
+                except Exception as e:
+                    result = {'path': path, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+                finished.add(path)
+                emit(result)
+        
+        running = set()
+        while not started.empty():
+            running.add(started.get())
+        if broken is None:
+            continue
+        
+        if len(batch) == 1:
+            emit({'path': batch[0], 'ok': False, 'error': f"{type(broken).__name__}: {broken}"})
+            continue
+        unfinished = [path for path in batch if path not in finished]
+        crashed = [path for path in unfinished if path in running] or unfinished
+        suspects.extend(crashed)
+        waiting.extend(path for path in unfinished if path not in crashed)
+    
+    return progress
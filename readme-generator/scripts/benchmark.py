@@ -0,0 +1,584 @@
+#!/usr/bin/env python3
+"""
+Benchmark Harness
+
+Times ProjectAnalyzer, READMEValidator and BadgeGenerator on synthetic
+inputs. Project trees and READMEs are produced by deterministic generators
+(the same shape and seed always give the same files), so results are
+comparable between runs and machines. Each case reports its best time,
+throughput and peak traced memory, and can be compared against a stored
+baseline with regression thresholds.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from analyze_project import ProjectAnalyzer
+from file_index import FileIndex
+from generate_badges import BadgeGenerator
+from section_cache import SectionCache
+from validate_readme import READMEValidator
+
+
+BASELINE_VERSION = 1
+# Bump when the generators change, to regenerate cached trees
+GENERATOR_VERSION = 1
+
+# Project tree shapes (keyword arguments of generate_tree)
+TREE_SHAPES = {
+    'small': {'files': 500},
+    'node-modules': {'files': 1000, 'node_modules': 5000, 'node_modules_depth': 6},
+    'hidden': {'files': 1000, 'hidden_dirs': 500},
+    'monorepo': {'files': 4000, 'packages': 40},
+    'large': {'files': 100_000, 'depth': 6},
+    'deep-node-modules': {'files': 2000, 'node_modules': 50_000, 'node_modules_depth': 12},
+    'many-hidden': {'files': 5000, 'hidden_dirs': 5000},
+    'large-monorepo': {'files': 40_000, 'packages': 400},
+}
+
+# README sizes in bytes
+README_SIZES = {
+    'tiny': 2 * 1024,
+    'small': 16 * 1024,
+    'medium': 256 * 1024,
+    'large': 2 * 1024 * 1024,
+    'huge': 8 * 1024 * 1024,
+}
+
+SUITES = {
+    'quick': {
+        'trees': ['small', 'node-modules', 'hidden', 'monorepo'],
+        'readmes': ['tiny', 'small', 'medium'],
+    },
+    'full': {
+        'trees': list(TREE_SHAPES),
+        'readmes': list(README_SIZES),
+    },
+}
+
+# Project info passed to BadgeGenerator, and calls per timed run
+BADGE_PROJECT_INFO = {
+    'project_name': 'bench-project',
+    'username': 'bench-org',
+    'language': 'JavaScript',
+    'package_manager': 'npm',
+    'license': 'MIT',
+    'ci_service': 'github-actions',
+}
+BADGE_CALLS = 1000
+
+# Default regression thresholds (fraction above the baseline). Time
+# differences below MIN_REGRESSION_SECONDS are treated as noise.
+TIME_THRESHOLD = 0.25
+MEMORY_THRESHOLD = 0.25
+MIN_REGRESSION_SECONDS = 0.002
+
+WORDS = (
+    'project', 'install', 'configure', 'module', 'build', 'release', 'feature',
+    'support', 'example', 'command', 'option', 'server', 'client', 'request',
+    'cache', 'file', 'value', 'default', 'output', 'input', 'test', 'run',
+    'the', 'a', 'of', 'to', 'and', 'with', 'for', 'when', 'each', 'every',
+)
+
+# Source file extensions and their relative frequency
+SOURCE_EXTENSIONS = (('.js', 4), ('.ts', 3), ('.py', 2), ('.go', 1), ('.json', 1), ('.md', 1))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """Random sentence of the given number of words"""
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def generate_readme(size: int, seed: int = 0) -> str:
+    """
+    Generate a README of roughly the given size
+    
+    The document has a title, badges, a table of contents and the required
+    sections, followed by as many numbered sections (paragraphs with
+    external, in-page and relative links, and fenced code blocks) as it
+    takes to reach the size.
+    
+    Args:
+        size: Target size in characters
+        seed: Random seed
+    
+    Returns:
+        README text
+    """
+    rng = random.Random(seed)
+    parts = [
+        '# Bench Project',
+        '',
+        '[![Build](https://img.shields.io/badge/build-passing-green.svg)](https://example.com/ci) '
+        '[![License](https://img.shields.io/badge/license-MIT-blue.svg)](LICENSE)',
+        '',
+        'A synthetic project used to benchmark README validation on documents of every size.',
+        '',
+        '## Table of Contents',
+        '',
+        '- [Installation](#installation)',
+        '- [Usage](#usage)',
+        '- [License](#license)',
+        '',
+        '## Installation',
+        '',
+        '```bash',
+        'npm install bench-project',
+        '```',
+        '',
+        '## Usage',
+        '',
+        _sentence(rng, 12),
+        '',
+    ]
+    length = sum(len(part) + 1 for part in parts)
+    
+    section = 0
+    while length < size:
+        section += 1
+        block = [f"{'#' * rng.choice((2, 3))} Section {section}", '']
+        for _ in range(rng.randint(1, 3)):
+            line = _sentence(rng, rng.randint(8, 20))
+            choice = rng.random()
+            if choice < 0.4:
+                line += f" See [the docs](https://example.com/docs/{rng.randrange(500)})."
+            elif choice < 0.6 and section > 1:
+                line += f" Compare [section {section - 1}](#section-{section - 1})."
+            elif choice < 0.7:
+                line += " Details are in the [license](LICENSE)."
+            block.extend([line, ''])
+        if rng.random() < 0.5:
+            block.append(f"```{rng.choice(('python', 'bash', 'json', 'js'))}")
+            block.extend(f"value_{n} = {rng.randrange(1000)}" for n in range(rng.randint(2, 12)))
+            block.extend(['```', ''])
+        parts.extend(block)
+        length += sum(len(part) + 1 for part in block)
+    
+    parts.extend(['## License', '', 'MIT', ''])
+    return '\n'.join(parts)
+
+
+def generate_tree(root: Path, files: int = 1000, depth: int = 4, node_modules: int = 0,
+                  node_modules_depth: int = 4, hidden_dirs: int = 0, packages: int = 0,
+                  seed: int = 0) -> int:
+    """
+    Generate a JavaScript project tree
+    
+    Args:
+        root: Directory to create the project in (must not exist)
+        files: Number of source files
+        depth: Maximum directory nesting below each source root
+        node_modules: Number of files in nested node_modules directories
+        node_modules_depth: Maximum node_modules nesting
+        hidden_dirs: Number of hidden directories (three files each)
+        packages: Number of workspace packages under packages/ (0 for a
+            single-package project); source files are spread across them
+        seed: Random seed
+    
+    Returns:
+        Number of files written
+    """
+    rng = random.Random(seed)
+    made = set()
+    written = 0
+    
+    def write(rel: str, content: str):
+        nonlocal written
+        parent = os.path.dirname(rel)
+        if parent not in made:
+            os.makedirs(root / parent, exist_ok=True)
+            made.add(parent)
+        with open(root / rel, 'w', encoding='utf-8') as f:
+            f.write(content)
+        written += 1
+    
+    manifest = {
+        'name': 'bench-project',
+        'version': '1.0.0',
+        'description': 'Synthetic project tree for benchmarks',
+        'license': 'MIT',
+        'scripts': {'test': 'jest'},
+        'dependencies': {'react': '^18.0.0'},
+    }
+    if packages:
+        manifest['workspaces'] = ['packages/*']
+    write('package.json', json.dumps(manifest, indent=2))
+    write('package-lock.json', '{}')
+    write('README.md', generate_readme(4096, seed))
+    write('LICENSE', 'MIT License\n\nPermission is hereby granted, free of charge, '
+                     'to any person obtaining a copy of this software.\n')
+    write('.github/workflows/ci.yml', 'name: CI\non: [push]\n')
+    
+    source_roots = [f"packages/pkg-{i}" for i in range(packages)] or ['src']
+    for package in source_roots[:packages]:
+        write(f"{package}/package.json",
+              json.dumps({'name': os.path.basename(package), 'version': '1.0.0'}))
+    source_roots.append('tests')
+    
+    # Directory tree: each new directory hangs below a random shallower one
+    dirs = [(source, 0) for source in source_roots]
+    for i in range(max(0, files // 20 - len(dirs))):
+        parent, level = rng.choice(dirs)
+        if level < depth:
+            dirs.append((f"{parent}/dir{i}", level + 1))
+    
+    extensions = [ext for ext, weight in SOURCE_EXTENSIONS for _ in range(weight)]
+    for i in range(files):
+        directory = rng.choice(dirs)[0]
+        ext = rng.choice(extensions)
+        line = f"// generated line {i}\n" if ext != '.py' else f"# generated line {i}\n"
+        write(f"{directory}/file{i}{ext}", line * (rng.randint(64, 2048) // len(line) + 1))
+    
+    for i in range(node_modules):
+        nesting = '/node_modules/'.join(f"pkg{rng.randrange(50)}"
+                                        for _ in range(rng.randint(1, node_modules_depth)))
+        write(f"node_modules/{nesting}/lib/file{i}.js", 'module.exports = {};\n')
+    
+    for i in range(hidden_dirs):
+        for j in range(3):
+            write(f".hidden{i}/sub/file{j}.txt", 'hidden\n')
+    
+    return written
+
+
+def prepare_tree(workdir: Path, shape: str) -> Tuple[Path, int]:
+    """
+    Generate a tree shape under workdir, reusing it if already generated
+    
+    Returns:
+        Tuple of (tree root, number of files)
+    """
+    params = dict(TREE_SHAPES[shape])
+    stamp = workdir / f"{shape}.json"
+    root = workdir / shape
+    expected = {'generator': GENERATOR_VERSION, 'params': params}
+    try:
+        recorded = json.loads(stamp.read_text(encoding='utf-8'))
+        if recorded['shape'] == expected and root.is_dir():
+            return root, recorded['files']
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    if root.exists():
+        shutil.rmtree(root)
+    print(f"Generating tree '{shape}'...", file=sys.stderr)
+    count = generate_tree(root, **params)
+    stamp.write_text(json.dumps({'shape': expected, 'files': count}), encoding='utf-8')
+    return root, count
+
+
+class Case:
+    """One benchmark case"""
+    
+    def __init__(self, name: str, setup: Callable[[], Callable[[], None]],
+                 units: float, unit: str):
+        """
+        Initialize case
+        
+        Args:
+            name: Case name, e.g. 'analyze[small]'
+            setup: Called before every run; returns the function to time
+            units: Amount of work per run, for throughput
+            unit: Unit name for throughput ('files', 'MB', 'calls')
+        """
+        self.name = name
+        self.setup = setup
+        self.units = units
+        self.unit = unit
+    
+    def run(self, repeat: int) -> Dict:
+        """
+        Time the case and measure its peak memory
+        
+        Args:
+            repeat: Number of timed runs; the fastest counts
+        
+        Returns:
+            {'seconds', 'throughput', 'unit', 'peak_bytes'}
+        """
+        best = None
+        for _ in range(repeat):
+            func = self.setup()
+            gc.collect()
+            started = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        
+        # Tracing slows execution, so memory is measured in a separate run
+        func = self.setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        return {
+            'seconds': best,
+            'throughput': self.units / best if best else 0.0,
+            'unit': self.unit,
+            'peak_bytes': peak,
+        }
+
+
+def tree_cases(shape: str, root: Path, file_count: int) -> List[Case]:
+    """Cases for one tree: full analysis, index build and each detector"""
+    cases = [
+        Case(f"analyze[{shape}]",
+             lambda: ProjectAnalyzer(str(root), use_git_index=False).analyze,
+             file_count, 'files'),
+        Case(f"index[{shape}]",
+             lambda: lambda: FileIndex.from_directory(root),
+             file_count, 'files'),
+    ]
+    
+    # Detectors run in isolation over a shared prebuilt index
+    index = FileIndex.from_directory(root)
+    for key in ProjectAnalyzer.DETECTORS:
+        def setup(key=key):
+            analyzer = ProjectAnalyzer(str(root), index=index, use_git_index=False)
+            return lambda: analyzer.run_detector(key)
+        cases.append(Case(f"detector[{shape}].{key}", setup, file_count, 'files'))
+    return cases
+
+
+def readme_cases(size_name: str, path: Path) -> List[Case]:
+    """Cases for one README: validation without and with a warm section cache"""
+    content = path.read_text(encoding='utf-8')
+    megabytes = len(content.encode('utf-8')) / (1024 * 1024)
+    
+    def cold():
+        validator = READMEValidator(str(path), section_cache=SectionCache(), content=content)
+        return validator.validate_all
+    
+    warm_cache = SectionCache()
+    READMEValidator(str(path), section_cache=warm_cache, content=content).validate_all()
+    
+    def warm():
+        validator = READMEValidator(str(path), section_cache=warm_cache, content=content)
+        return validator.validate_all
+    
+    return [
+        Case(f"validate[{size_name}].cold", cold, megabytes, 'MB'),
+        Case(f"validate[{size_name}].warm", warm, megabytes, 'MB'),
+    ]
+
+
+def badge_case() -> Case:
+    """BadgeGenerator.generate_all() for a typical project"""
+    def setup():
+        generator = BadgeGenerator(dict(BADGE_PROJECT_INFO))
+        def run():
+            for _ in range(BADGE_CALLS):
+                generator.generate_all()
+        return run
+    return Case('badges.generate_all', setup, BADGE_CALLS, 'calls')
+
+
+def build_cases(suite: str, workdir: Path, only: Optional[str] = None) -> List[Case]:
+    """
+    Build the cases of a suite, generating inputs as needed
+    
+    Args:
+        suite: Suite name from SUITES
+        workdir: Directory for generated trees and READMEs
+        only: Optional regular expression; cases whose names do not
+            match are skipped (and their inputs not generated)
+    
+    Returns:
+        List of cases
+    """
+    pattern = re.compile(only) if only else None
+    cases = []
+    for shape in SUITES[suite]['trees']:
+        probe = [f"analyze[{shape}]", f"index[{shape}]", f"detector[{shape}]."]
+        if pattern is not None and not any(pattern.search(name) for name in probe):
+            continue
+        root, count = prepare_tree(workdir, shape)
+        cases.extend(tree_cases(shape, root, count))
+    
+    readme_dir = workdir / 'readmes'
+    readme_dir.mkdir(parents=True, exist_ok=True)
+    for size_name in SUITES[suite]['readmes']:
+        probe = [f"validate[{size_name}].cold", f"validate[{size_name}].warm"]
+        if pattern is not None and not any(pattern.search(name) for name in probe):
+            continue
+        path = readme_dir / f"{size_name}.md"
+        content = generate_readme(README_SIZES[size_name])
+        if not path.is_file() or path.read_text(encoding='utf-8') != content:
+            path.write_text(content, encoding='utf-8')
+        cases.extend(readme_cases(size_name, path))
+    
+    cases.append(badge_case())
+    if pattern is not None:
+        cases = [case for case in cases if pattern.search(case.name)]
+    return cases
+
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    """Load baseline results, ignoring a missing or outdated file"""
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != BASELINE_VERSION:
+        return {}
+    return data.get('results', {})
+
+
+def save_baseline(path: Path, results: Dict[str, Dict]):
+    """Merge results into the baseline file (cases not run keep their entries)"""
+    merged = load_baseline(path)
+    for name, result in results.items():
+        merged[name] = {'seconds': result['seconds'], 'peak_bytes': result['peak_bytes']}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        'version': BASELINE_VERSION,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': dict(sorted(merged.items())),
+    }, indent=2) + '\n', encoding='utf-8')
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict],
+            time_threshold: float = TIME_THRESHOLD,
+            memory_threshold: float = MEMORY_THRESHOLD) -> List[str]:
+    """
+    Compare results against a baseline
+    
+    Sets 'time_change' and 'memory_change' (fraction relative to the
+    baseline) on every result that has a baseline entry.
+    
+    Args:
+        results: Case name -> result from Case.run()
+        baseline: Case name -> {'seconds', 'peak_bytes'}
+        time_threshold: Allowed slowdown as a fraction of the baseline time
+        memory_threshold: Allowed growth as a fraction of the baseline peak
+    
+    Returns:
+        Descriptions of the regressions found
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if base['seconds']:
+            result['time_change'] = result['seconds'] / base['seconds'] - 1
+            if (result['time_change'] > time_threshold and
+                    result['seconds'] - base['seconds'] > MIN_REGRESSION_SECONDS):
+                regressions.append(f"{name}: {result['time_change']:+.0%} time "
+                                   f"({base['seconds'] * 1000:.1f} ms -> {result['seconds'] * 1000:.1f} ms)")
+        if base['peak_bytes']:
+            result['memory_change'] = result['peak_bytes'] / base['peak_bytes'] - 1
+            if result['memory_change'] > memory_threshold:
+                regressions.append(f"{name}: {result['memory_change']:+.0%} peak memory "
+                                   f"({format_bytes(base['peak_bytes'])} -> {format_bytes(result['peak_bytes'])})")
+    return regressions
+
+
+def format_bytes(count: float) -> str:
+    """Human-readable byte count"""
+    for unit in ('B', 'KB', 'MB'):
+        if count < 1024:
+            return f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+def format_rate(rate: float, unit: str) -> str:
+    """Human-readable throughput"""
+    if rate >= 1_000_000:
+        return f"{rate / 1_000_000:.1f}M {unit}/s"
+    if rate >= 1000:
+        return f"{rate / 1000:.1f}k {unit}/s"
+    return f"{rate:.1f} {unit}/s"
+
+
+def print_results(results: Dict[str, Dict], stream=sys.stdout):
+    """Print a results table"""
+    width = max([len(name) for name in results] + [4])
+    print(f"{'case':<{width}}  {'time':>11}  {'throughput':>16}  {'peak mem':>10}  {'vs baseline':>16}",
+          file=stream)
+    for name, result in results.items():
+        change = ''
+        if 'time_change' in result:
+            change = f"{result['time_change']:+.0%}"
+            if 'memory_change' in result:
+                change += f" / {result['memory_change']:+.0%}"
+        print(f"{name:<{width}}  {result['seconds'] * 1000:>8.2f} ms  "
+              f"{format_rate(result['throughput'], result['unit']):>16}  "
+              f"{format_bytes(result['peak_bytes']):>10}  {change:>16}", file=stream)
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='Benchmark project analysis, README validation and badge generation',
+        epilog='Example: python benchmark.py --suite full --update-baseline'
+    )
+    parser.add_argument('--suite', choices=sorted(SUITES), default='quick',
+                        help="Inputs to benchmark (default: quick; 'full' adds a 100k-file tree and multi-MB READMEs)")
+    parser.add_argument('--only', metavar='REGEX', help='Run only cases whose name matches REGEX')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case; the fastest counts (default: 3)')
+    parser.add_argument('--workdir', metavar='DIR',
+                        help='Directory for generated inputs, reused between runs '
+                             '(default: <tmp>/readme-generator-bench)')
+    parser.add_argument('--baseline', metavar='FILE', default='.cache/readme-generator/benchmark-baseline.json',
+                        help='Baseline results file (default: .cache/readme-generator/benchmark-baseline.json)')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='Store these results as the new baseline instead of comparing')
+    parser.add_argument('--threshold', type=float, default=TIME_THRESHOLD, metavar='FRACTION',
+                        help='Allowed slowdown relative to the baseline (default: 0.25)')
+    parser.add_argument('--memory-threshold', type=float, default=MEMORY_THRESHOLD, metavar='FRACTION',
+                        help='Allowed peak memory growth relative to the baseline (default: 0.25)')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+    
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.gettempdir()) / 'readme-generator-bench'
+    workdir.mkdir(parents=True, exist_ok=True)
+    cases = build_cases(args.suite, workdir, args.only)
+    
+    results = {}
+    for case in cases:
+        print(f"Running {case.name}...", file=sys.stderr)
+        results[case.name] = case.run(args.repeat)
+    
+    baseline_path = Path(args.baseline)
+    regressions = []
+    if args.update_baseline:
+        save_baseline(baseline_path, results)
+    else:
+        regressions = compare(results, load_baseline(baseline_path), args.threshold, args.memory_threshold)
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+    
+    if args.update_baseline:
+        print(f"\nBaseline saved to {baseline_path}", file=sys.stderr)
+    elif regressions:
+        print(f"\n❌ {len(regressions)} regression(s) against {baseline_path}:", file=sys.stderr)
+        for regression in regressions:
+            print(f"  - {regression}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+"""
+File Index
+
+Builds an in-memory index of a project tree in a single pass.
+All ProjectAnalyzer detectors query this index instead of walking the
+filesystem on their own, so each analysis touches the tree exactly once.
+"""
+
+import os
+from bisect import bisect_left
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from git_index import MODE_GITLINK, MODE_TYPE_MASK, load_tracked_files
+
+
+# Directories that are never descended into. They are still recorded as
+# existing so marker checks like `node_modules/` keep working.
+DEFAULT_PRUNE = (
+    '.git', '.hg', '.svn',
+    'node_modules', 'bower_components',
+    '.venv', 'venv', '__pycache__', '.tox', '.nox',
+    '.mypy_cache', '.pytest_cache', '.ruff_cache',
+    'target',
+)
+
+# Hidden directories are not descended into either, except these ones
+# which hold files some detectors look for (e.g. `.github/workflows`).
+DESCEND_HIDDEN = ('.github', '.circleci', '.gitlab')
+
+# Dependency marker for queries that depend on the whole tree
+TREE = '*'
+
+
+class IOCounters:
+    """Filesystem calls made on behalf of one detector run"""
+    
+    __slots__ = ('stat', 'open', 'read', 'scandir', 'bytes_read', 'files_visited')
+    
+    def __init__(self):
+        self.stat = 0
+        self.open = 0
+        self.read = 0
+        self.scandir = 0
+        self.bytes_read = 0
+        # Files listed by a walk or index read, plus files stat-ed or read
+        self.files_visited = 0
+    
+    def read_file(self, size: int):
+        """Count one whole-file read (open + read) of size bytes"""
+        self.open += 1
+        self.read += 1
+        self.bytes_read += size
+        self.files_visited += 1
+    
+    def add(self, counts: Dict[str, int]):
+        """Add counts from as_dict() of another run"""
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + counts.get(name, 0))
+    
+    def as_dict(self) -> Dict[str, int]:
+        """Counters as a JSON-serializable dict"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class FileIndex:
+    """In-memory index of files and directories below a project root"""
+    
+    def __init__(self, root: Path):
+        """
+        Initialize an empty index
+        
+        Args:
+            root: Project root directory the relative paths refer to
+        """
+        self.root = root
+        self.files: List[str] = []
+        self.visible: List[str] = []
+        self.file_set: Set[str] = set()
+        self.sizes: Dict[str, int] = {}
+        self.top_files: List[str] = []
+        self.dirs: Set[str] = set()
+        self.basenames: Set[str] = set()
+        self.ext_counts: Dict[str, int] = {}
+        self.walked_dirs: List[str] = []
+        # Where the file list came from ('walk', 'git-index' or the source
+        # given to from_listing()), and for sources other than the walk, the
+        # paths whose metadata changes whenever the listing does
+        self.source = 'walk'
+        self.tree_deps: Optional[List[str]] = None
+        self._sorted: Optional[Dict[str, List[str]]] = None
+        # Set of relative paths to record lookups into (see ProjectAnalyzer)
+        self.recorder: Optional[Set[str]] = None
+        # Counters for filesystem calls made by lookups (see ProjectAnalyzer)
+        self.counters: Optional[IOCounters] = None
+    
+    @classmethod
+    def from_directory(cls, root: Path, prune: Optional[Iterable[str]] = None,
+                       counters: Optional[IOCounters] = None) -> 'FileIndex':
+        """
+        Build an index with one os.scandir walk
+        
+        Args:
+            root: Project root directory
+            prune: Directory names to skip (defaults to DEFAULT_PRUNE)
+            counters: Optional counters for the walk's filesystem calls
+        
+        Returns:
+            Populated FileIndex
+        """
+        index = cls(root)
+        prune = set(DEFAULT_PRUNE if prune is None else prune)
+        
+        # Stack of (absolute path, relative prefix, inside hidden dir)
+        stack = [(str(root), '', False)]
+        while stack:
+            path, prefix, hidden = stack.pop()
+            index.walked_dirs.append(prefix.rstrip('/'))
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        rel = prefix + name
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            continue
+                        
+                        if is_dir:
+                            index.dirs.add(rel)
+                            # Symlinked directories are not followed
+                            if name in prune or entry.is_symlink():
+                                continue
+                            is_hidden = name.startswith('.')
+                            if is_hidden and name not in DESCEND_HIDDEN:
+                                continue
+                            stack.append((entry.path, rel + '/', hidden or is_hidden))
+                        else:
+                            index.add_file(rel, hidden=hidden or name.startswith('.'))
+            except OSError:
+                continue
+        
+        if counters is not None:
+            counters.scandir += len(index.walked_dirs)
+            counters.files_visited += len(index.files)
+        return index
+    
+    @classmethod
+    def from_git_index(cls, root: Path, prune: Optional[Iterable[str]] = None,
+                       counters: Optional[IOCounters] = None) -> Optional['FileIndex']:
+        """
+        Build an index from the tracked files listed in `.git/index`
+        
+        Ignored and untracked files never appear, and sizes come from the
+        index itself, so no per-file stat calls are needed. Prune and
+        hidden-directory rules are applied as in from_directory().
+        
+        Args:
+            root: Repository working tree root
+            prune: Directory names to skip (defaults to DEFAULT_PRUNE)
+            counters: Optional counters for reading the git index
+        
+        Returns:
+            Populated FileIndex, or None if there is no readable git index
+        """
+        loaded = load_tracked_files(root)
+        if loaded is None:
+            return None
+        index_path, entries = loaded
+        if counters is not None:
+            try:
+                counters.read_file(index_path.stat().st_size)
+            except OSError:
+                pass
+            counters.files_visited += len(entries)
+        
+        index = cls(root)
+        index.source = 'git-index'
+        index.tree_deps = [str(index_path)]
+        prune = set(DEFAULT_PRUNE if prune is None else prune)
+        if (root / '.git').is_dir():
+            index.dirs.add('.git')
+        elif (root / '.git').is_file():
+            index.add_file('.git', hidden=True)
+        index.walked_dirs.append('')
+        
+        visit = index._directory_visitor(prune)
+        
+        for rel, size, mode in entries:
+            directory, _, name = rel.rpartition('/')
+            descended, hidden = visit(directory)
+            if not descended:
+                continue
+            if mode & MODE_TYPE_MASK == MODE_GITLINK:
+                # Submodule checkout
+                index.dirs.add(rel)
+                continue
+            index.add_file(rel, hidden=hidden or name.startswith('.'))
+            index.sizes[rel] = size
+        
+        return index
+    
+    @classmethod
+    def from_listing(cls, root: Path, entries: Iterable[Tuple[str, Optional[int]]],
+                     prune: Optional[Iterable[str]] = None, source: str = 'listing') -> 'FileIndex':
+        """
+        Build an index from a flat list of paths, such as an archive's member table
+        
+        Prune and hidden-directory rules are applied as in from_directory().
+        
+        Args:
+            root: Path the relative paths refer to (used for display and
+                for stat-ing files whose size is unknown)
+            entries: (relative path, size or None) pairs; paths ending in
+                '/' are directories
+            prune: Directory names to skip (defaults to DEFAULT_PRUNE)
+            source: Name of the listing, stored in `source`
+        
+        Returns:
+            Populated FileIndex
+        """
+        index = cls(root)
+        index.source = source
+        index.tree_deps = []
+        index.walked_dirs.append('')
+        visit = index._directory_visitor(set(DEFAULT_PRUNE if prune is None else prune))
+        
+        for rel, size in entries:
+            if rel.endswith('/'):
+                visit(rel.rstrip('/'))
+                continue
+            directory, _, name = rel.rpartition('/')
+            descended, hidden = visit(directory)
+            if not descended or rel in index.file_set:
+                continue
+            index.add_file(rel, hidden=hidden or name.startswith('.'))
+            if size is not None:
+                index.sizes[rel] = size
+        
+        return index
+    
+    def _directory_visitor(self, prune: Set[str]) -> Callable[[str], tuple]:
+        """
+        Directory lookup for indexes built from flat path lists
+        
+        The returned function maps a directory to (descended into, hidden),
+        recording the directories it passes in `dirs` and `walked_dirs`.
+        """
+        # Directory -> (descended into, hidden), memoized per directory
+        seen: Dict[str, tuple] = {'': (True, False)}
+        
+        def visit(directory: str) -> tuple:
+            status = seen.get(directory)
+            if status is None:
+                parent, _, name = directory.rpartition('/')
+                descended, hidden = visit(parent)
+                if descended:
+                    self.dirs.add(directory)
+                is_hidden = name.startswith('.')
+                descended = (descended and name not in prune and
+                             (not is_hidden or name in DESCEND_HIDDEN))
+                if descended:
+                    self.walked_dirs.append(directory)
+                status = (descended, hidden or is_hidden)
+                seen[directory] = status
+            return status
+        
+        return visit
+    
+    def add_file(self, rel: str, hidden: bool = False):
+        """
+        Record a file in the index
+        
+        Args:
+            rel: Path relative to the root, using forward slashes
+            hidden: Whether the file lives under a hidden path. Hidden files
+                are indexed but not counted towards extension statistics.
+        """
+        self.files.append(rel)
+        self.file_set.add(rel)
+        if '/' not in rel:
+            self.top_files.append(rel)
+        name = rel.rsplit('/', 1)[-1]
+        self.basenames.add(name)
+        
+        if not hidden:
+            self.visible.append(rel)
+            dot = name.rfind('.')
+            if 0 < dot < len(name) - 1:
+                ext = name[dot:].lower()
+                self.ext_counts[ext] = self.ext_counts.get(ext, 0) + 1
+    
+    def subindex(self, prefix: str) -> 'FileIndex':
+        """
+        Build an index of a subdirectory from this one without walking again
+        
+        Args:
+            prefix: Directory relative to the root (e.g. 'packages/core')
+        
+        Returns:
+            FileIndex rooted at the subdirectory
+        """
+        prefix = prefix.strip('/')
+        if self._sorted is None:
+            self._sorted = {
+                'files': sorted(self.files),
+                'dirs': sorted(self.dirs),
+                'walked': sorted(self.walked_dirs),
+            }
+        
+        def below(paths: List[str]) -> List[str]:
+            # '0' sorts right after '/', so [lo, hi) holds exactly prefix/...
+            lo = bisect_left(paths, prefix + '/')
+            hi = bisect_left(paths, prefix + '0', lo)
+            return [path[len(prefix) + 1:] for path in paths[lo:hi]]
+        
+        sub = FileIndex(self.root / prefix)
+        for rel in below(self._sorted['files']):
+            hidden = any(part.startswith('.') for part in rel.split('/'))
+            sub.add_file(rel, hidden=hidden)
+            size = self.sizes.get(f"{prefix}/{rel}")
+            if size is not None:
+                sub.sizes[rel] = size
+        sub.dirs = set(below(self._sorted['dirs']))
+        sub.source = self.source
+        sub.tree_deps = self.tree_deps
+        walked = self._sorted['walked']
+        sub.walked_dirs = below(walked)
+        pos = bisect_left(walked, prefix)
+        if pos < len(walked) and walked[pos] == prefix:
+            sub.walked_dirs.insert(0, '')
+        return sub
+    
+    def tree_paths(self) -> List[str]:
+        """Paths whose metadata changes whenever the indexed tree shape changes"""
+        if self.tree_deps is not None:
+            return self.tree_deps
+        return self.walked_dirs
+    
+    def _record(self, rel: str):
+        """Record a lookup for dependency tracking"""
+        if self.recorder is not None:
+            self.recorder.add(rel)
+    
+    def exists(self, rel: str) -> bool:
+        """Check whether a file or directory exists (trailing '/' means directory)"""
+        self._record(rel.rstrip('/'))
+        if rel.endswith('/'):
+            return rel.rstrip('/') in self.dirs
+        return rel in self.file_set or rel in self.dirs
+    
+    def is_file(self, rel: str) -> bool:
+        """Check whether a file exists"""
+        self._record(rel)
+        return rel in self.file_set
+    
+    def is_dir(self, rel: str) -> bool:
+        """Check whether a directory exists"""
+        self._record(rel.rstrip('/'))
+        return rel.rstrip('/') in self.dirs
+    
+    def all_files(self) -> List[str]:
+        """All indexed file paths"""
+        self._record(TREE)
+        return self.files
+    
+    def visible_files(self) -> List[str]:
+        """Indexed file paths outside hidden directories"""
+        self._record(TREE)
+        return self.visible
+    
+    def root_files(self) -> List[str]:
+        """Indexed files directly in the root directory"""
+        self._record(TREE)
+        return self.top_files
+    
+    def size(self, rel: str) -> int:
+        """
+        Size of an indexed file in bytes
+        
+        Sizes known from the index source are returned directly; others are
+        looked up with one stat call and remembered.
+        """
+        size = self.sizes.get(rel)
+        if size is None:
+            if self.counters is not None:
+                self.counters.stat += 1
+                self.counters.files_visited += 1
+            try:
+                size = os.stat(self.root / rel).st_size
+            except OSError:
+                size = 0
+            self.sizes[rel] = size
+        return size
+    
+    def all_dirs(self) -> Set[str]:
+        """All indexed directory paths"""
+        self._record(TREE)
+        return self.dirs
+    
+    def extension_counts(self) -> Dict[str, int]:
+        """File counts per lower-cased extension, excluding hidden paths"""
+        self._record(TREE)
+        return self.ext_counts
+    
+    def has_basename(self, pattern: str) -> bool:
+        """Check whether any indexed file name matches a glob pattern"""
+        self._record(TREE)
+        if not any(c in pattern for c in '*?['):
+            return pattern in self.basenames
+        return any(fnmatch(name, pattern) for name in self.basenames)
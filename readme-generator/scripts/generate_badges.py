@@ -4,18 +4,23 @@ Badge Generator for README files
 
 Generates markdown badges based on project information.
 Supports various badge types from shields.io and other services.
+Static badges (license, language, version, custom) can instead be rendered
+to local SVG files for offline mirrors (see svg_badges.py).
 """
 
+import argparse
 import json
 import sys
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
+from svg_badges import SVGBadgeRenderer
+
 
 class BadgeGenerator:
     """Generate badges for README files"""
     
-    def __init__(self, project_info: Dict):
+    def __init__(self, project_info: Dict, renderer: Optional[SVGBadgeRenderer] = None):
         """
         Initialize badge generator with project information
         
@@ -27,9 +32,27 @@ class BadgeGenerator:
                 - package_manager: npm, pip, cargo, etc.
                 - license: License type (MIT, Apache-2.0, etc.)
                 - ci_service: CI service (github-actions, travis, circle, etc.)
+                - version: Released version (used by locally rendered version badges)
+            renderer: Render static badges to local SVG files instead of
+                linking to shields.io; badges showing live data (build
+                status, downloads, coverage) stay remote
         """
         self.info = project_info
         self.shields_base = "https://img.shields.io"
+        self.renderer = renderer
+    
+    def static_image(self, remote_url: str, label: str, message: str, color: str) -> str:
+        """Image URL of a badge with fixed text: a local SVG when a renderer is set"""
+        if self.renderer is None:
+            return remote_url
+        return self.renderer.badge(label, message, color)
+    
+    def version_image(self, remote_url: str, label: str) -> str:
+        """Image URL of a version badge, rendered locally if the version is known"""
+        version = self.info.get('version')
+        if self.renderer is None or not version:
+            return remote_url
+        return self.renderer.badge(label, f"v{version}", 'blue')
     
     def generate_all(self) -> str:
         """Generate all applicable badges"""
@@ -94,27 +117,27 @@ class BadgeGenerator:
             return None
         
         if pkg_manager == 'npm':
-            url = f"{self.shields_base}/npm/v/{project}.svg"
+            url = self.version_image(f"{self.shields_base}/npm/v/{project}.svg", 'npm')
             link = f"https://www.npmjs.com/package/{project}"
             return f"[![npm version]({url})]({link})"
         
         elif pkg_manager == 'pypi':
-            url = f"{self.shields_base}/pypi/v/{project}.svg"
+            url = self.version_image(f"{self.shields_base}/pypi/v/{project}.svg", 'pypi')
             link = f"https://pypi.org/project/{project}/"
             return f"[![PyPI version]({url})]({link})"
         
         elif pkg_manager == 'cargo':
-            url = f"{self.shields_base}/crates/v/{project}.svg"
+            url = self.version_image(f"{self.shields_base}/crates/v/{project}.svg", 'crates.io')
             link = f"https://crates.io/crates/{project}"
             return f"[![Crates.io]({url})]({link})"
         
         elif pkg_manager == 'gem':
-            url = f"{self.shields_base}/gem/v/{project}.svg"
+            url = self.version_image(f"{self.shields_base}/gem/v/{project}.svg", 'gem')
             link = f"https://rubygems.org/gems/{project}"
             return f"[![Gem Version]({url})]({link})"
         
         elif pkg_manager == 'nuget':
-            url = f"{self.shields_base}/nuget/v/{project}.svg"
+            url = self.version_image(f"{self.shields_base}/nuget/v/{project}.svg", 'nuget')
             link = f"https://www.nuget.org/packages/{project}/"
             return f"[![NuGet]({url})]({link})"
         
@@ -154,21 +177,49 @@ class BadgeGenerator:
             'APACHE': ('Apache_2.0', 'blue'),
             'GPL-3.0': ('GPLv3', 'blue'),
             'GPL': ('GPLv3', 'blue'),
+            'GPL-2.0': ('GPLv2', 'blue'),
+            'AGPL-3.0': ('AGPL_v3', 'blue'),
+            'LGPL-3.0': ('LGPL_v3', 'blue'),
+            'LGPL-2.1': ('LGPL_v2.1', 'blue'),
+            'MPL-2.0': ('MPL_2.0', 'brightgreen'),
             'BSD-3': ('BSD_3--Clause', 'blue'),
+            'BSD-3-CLAUSE': ('BSD_3--Clause', 'blue'),
+            'BSD-2-CLAUSE': ('BSD_2--Clause', 'orange'),
             'BSD': ('BSD_3--Clause', 'blue'),
+            'ISC': ('ISC', 'blue'),
+            '0BSD': ('0BSD', 'blue'),
+            'UNLICENSE': ('Unlicense', 'blue'),
+            'CC0-1.0': ('CC0_1.0', 'lightgrey'),
+            'BSL-1.0': ('Boost_1.0', 'lightblue'),
+            'ZLIB': ('Zlib', 'lightgrey'),
         }
         
-        license_info = license_map.get(license_type, (license_type, 'blue'))
-        license_name, color = license_info
+        # Other IDs are shown as is, escaped for the shields.io path
+        license_name, color = license_map.get(
+            license_type, (self.info['license'].replace('-', '--').replace(' ', '_'), 'blue'))
         
-        url = f"{self.shields_base}/badge/License-{license_name}-{color}.svg"
+        # shields.io path escapes: '_' is a space, '--' a dash
+        url = self.static_image(f"{self.shields_base}/badge/License-{license_name}-{color}.svg",
+                                'License', license_name.replace('--', '-').replace('_', ' '), color)
         
         # Link to common license URLs
         license_links = {
             'MIT': 'https://opensource.org/licenses/MIT',
             'Apache_2.0': 'https://opensource.org/licenses/Apache-2.0',
             'GPLv3': 'https://www.gnu.org/licenses/gpl-3.0',
+            'GPLv2': 'https://www.gnu.org/licenses/old-licenses/gpl-2.0',
+            'AGPL_v3': 'https://www.gnu.org/licenses/agpl-3.0',
+            'LGPL_v3': 'https://www.gnu.org/licenses/lgpl-3.0',
+            'LGPL_v2.1': 'https://www.gnu.org/licenses/old-licenses/lgpl-2.1',
+            'MPL_2.0': 'https://opensource.org/licenses/MPL-2.0',
             'BSD_3--Clause': 'https://opensource.org/licenses/BSD-3-Clause',
+            'BSD_2--Clause': 'https://opensource.org/licenses/BSD-2-Clause',
+            'ISC': 'https://opensource.org/licenses/ISC',
+            '0BSD': 'https://opensource.org/licenses/0BSD',
+            'Unlicense': 'https://unlicense.org/',
+            'CC0_1.0': 'https://creativecommons.org/publicdomain/zero/1.0/',
+            'Boost_1.0': 'https://www.boost.org/LICENSE_1_0.txt',
+            'Zlib': 'https://opensource.org/licenses/Zlib',
         }
         
         link = license_links.get(license_name, 'LICENSE')
@@ -201,7 +252,8 @@ class BadgeGenerator:
         color = language_colors.get(language.lower(), 'blue')
         lang_display = language.capitalize()
         
-        url = f"{self.shields_base}/badge/Language-{quote(lang_display)}-{color}.svg"
+        url = self.static_image(f"{self.shields_base}/badge/Language-{quote(lang_display)}-{color}.svg",
+                                'Language', lang_display, color)
         
         return f"![Language: {lang_display}]({url})"
     
@@ -228,7 +280,8 @@ class BadgeGenerator:
     
     def custom_badge(self, label: str, message: str, color: str = 'blue') -> str:
         """Generate a custom badge"""
-        url = f"{self.shields_base}/badge/{quote(label)}-{quote(message)}-{color}"
+        url = self.static_image(f"{self.shields_base}/badge/{quote(label)}-{quote(message)}-{color}",
+                                label, message, color)
         return f"![{label}]({url})"
 
 
@@ -248,12 +301,21 @@ def main():
         }, indent=2))
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description='Generate README badges')
+    parser.add_argument('project_info', help='Project info JSON file')
+    parser.add_argument('--local', metavar='DIR',
+                        help='Render static badges as SVG files into DIR instead of linking to shields.io')
+    parser.add_argument('--link-prefix', metavar='PATH',
+                        help='Path or URL of DIR used in the Markdown (default: DIR)')
+    args = parser.parse_args()
+    
     # Read project info from JSON file
-    with open(sys.argv[1], 'r') as f:
+    with open(args.project_info, 'r') as f:
         project_info = json.load(f)
     
     # Generate badges
-    generator = BadgeGenerator(project_info)
+    renderer = SVGBadgeRenderer(args.local, args.link_prefix) if args.local else None
+    generator = BadgeGenerator(project_info, renderer)
     badges = generator.generate_all()
     
     # Output
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Git Index Reader
+
+Reads the list of tracked files straight from a repository's `.git/index`
+(versions 2, 3 and 4), without running git and without a stat call per
+file. Sizes come from the cached stat data stored in the index.
+"""
+
+import re
+import struct
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+# Entry mode types (upper bits of the 32-bit mode field)
+MODE_TYPE_MASK = 0o170000
+MODE_GITLINK = 0o160000
+MODE_DIRECTORY = 0o040000
+
+FLAG_EXTENDED = 0x4000
+FLAG_STAGE_MASK = 0x3000
+FLAG_NAME_MASK = 0x0fff
+EXT_FLAG_SKIP_WORKTREE = 0x4000
+
+ENTRY_STAT = struct.Struct('>10I')
+
+
+class GitIndexError(Exception):
+    """Raised when an index cannot be read with this reader"""
+
+
+def find_git_dir(root: Path) -> Optional[Tuple[Path, Path]]:
+    """
+    Locate the repository containing a directory
+    
+    Args:
+        root: Directory inside a working tree
+    
+    Returns:
+        Tuple of (working tree top, git directory), following `gitdir:`
+        files used by worktrees and submodules, or None outside a repository
+    """
+    for top in (root, *root.parents):
+        dot_git = top / '.git'
+        if dot_git.is_dir():
+            return top, dot_git
+        if dot_git.is_file():
+            try:
+                content = dot_git.read_text(encoding='utf-8').strip()
+            except OSError:
+                return None
+            if not content.startswith('gitdir:'):
+                return None
+            git_dir = Path(content[len('gitdir:'):].strip())
+            return top, git_dir if git_dir.is_absolute() else (top / git_dir).resolve()
+    return None
+
+
+def _hash_size(git_dir: Path) -> int:
+    """Object id size in bytes (32 for sha256 repositories, else 20)"""
+    for config in (git_dir / 'config', git_dir.parent.parent / 'config'):
+        try:
+            text = config.read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            continue
+        if re.search(r'^\s*objectformat\s*=\s*sha256\s*$', text, re.IGNORECASE | re.MULTILINE):
+            return 32
+        return 20
+    return 20
+
+
+def read_git_index(index_path: Path, hash_size: int = 20) -> List[Tuple[str, int, int]]:
+    """
+    Parse a git index file
+    
+    Args:
+        index_path: Path of the index file
+        hash_size: Object id size in bytes
+    
+    Returns:
+        List of (path, size, mode) for tracked entries present in the
+        working tree (conflict stages and skip-worktree entries are dropped)
+    
+    Raises:
+        GitIndexError: If the file is not an index this reader understands
+            (unknown version, split index or sparse index)
+        OSError: If the file cannot be read
+    """
+    data = index_path.read_bytes()
+    if len(data) < 12 or data[:4] != b'DIRC':
+        raise GitIndexError('not a git index')
+    
+    version, count = struct.unpack_from('>II', data, 4)
+    if version not in (2, 3, 4):
+        raise GitIndexError(f'unsupported index version {version}')
+    
+    entries = []
+    offset = 12
+    previous = b''
+    flags_offset = ENTRY_STAT.size + hash_size
+    for _ in range(count):
+        start = offset
+        stat = ENTRY_STAT.unpack_from(data, offset)
+        mode, size = stat[6], stat[9]
+        flags, = struct.unpack_from('>H', data, offset + flags_offset)
+        offset += flags_offset + 2
+        
+        ext_flags = 0
+        if flags & FLAG_EXTENDED and version >= 3:
+            ext_flags, = struct.unpack_from('>H', data, offset)
+            offset += 2
+        
+        if version == 4:
+            # Prefix-compressed path: varint bytes to drop from the previous path
+            byte = data[offset]
+            offset += 1
+            strip = byte & 0x7f
+            while byte & 0x80:
+                byte = data[offset]
+                offset += 1
+                strip = ((strip + 1) << 7) | (byte & 0x7f)
+            end = data.index(b'\0', offset)
+            name = previous[:len(previous) - strip] + data[offset:end]
+            offset = end + 1
+        else:
+            length = flags & FLAG_NAME_MASK
+            if length == FLAG_NAME_MASK:
+                end = data.index(b'\0', offset)
+            else:
+                end = offset + length
+            name = data[offset:end]
+            # Entries are NUL-padded to a multiple of 8 bytes
+            offset = start + ((end - start + 8) & ~7)
+        previous = name
+        
+        if mode & MODE_TYPE_MASK == MODE_DIRECTORY:
+            raise GitIndexError('sparse index')
+        if ext_flags & EXT_FLAG_SKIP_WORKTREE:
+            # Sparse checkout: tracked but absent from the working tree
+            continue
+        path = name.decode('utf-8', 'surrogateescape')
+        if flags & FLAG_STAGE_MASK and entries and entries[-1][0] == path:
+            # Unmerged stages of the same path are adjacent
+            continue
+        entries.append((path, size, mode))
+    
+    # Extensions follow the entries; a split index keeps entries elsewhere
+    while offset + 8 <= len(data) - hash_size:
+        signature = data[offset:offset + 4]
+        ext_size, = struct.unpack_from('>I', data, offset + 4)
+        if signature == b'link':
+            raise GitIndexError('split index')
+        offset += 8 + ext_size
+    
+    return entries
+
+
+def load_tracked_files(root: Path) -> Optional[Tuple[Path, List[Tuple[str, int, int]]]]:
+    """
+    Read tracked files below a directory of a repository
+    
+    Args:
+        root: Working tree root or any directory inside a working tree
+    
+    Returns:
+        Tuple of (index path, entries) with paths relative to root, or None
+        if there is no usable index. The index of an enclosing repository
+        is only used when it tracks files below root, so untracked or
+        ignored directories inside a repository are walked instead.
+    """
+    found = find_git_dir(root)
+    if found is None:
+        return None
+    top, git_dir = found
+    
+    index_path = git_dir / 'index'
+    try:
+        entries = read_git_index(index_path, _hash_size(git_dir))
+    except (OSError, GitIndexError, struct.error, ValueError, IndexError):
+        return None
+    
+    if top != root:
+        prefix = root.relative_to(top).as_posix() + '/'
+        entries = [
+            (path[len(prefix):], size, mode) for path, size, mode in entries
+            if path.startswith(prefix)
+        ]
+        if not entries:
+            return None
+    return index_path, entries
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+HTTP Prober
+
+Small asyncio HTTP/1.1 client used by LinkChecker. Each URL is requested
+with HEAD (falling back to GET for servers that reject HEAD), following
+redirects, over connections kept alive per host. Concurrency is capped per
+host and overall. Kept separate from link_checker.py so that asyncio and
+ssl are only imported when links are actually checked.
+"""
+
+import asyncio
+import ssl
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urldefrag, urljoin, urlsplit
+
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+# Statuses some servers return for HEAD although GET works
+HEAD_FALLBACK_STATUSES = (403, 405, 501)
+
+# Response bodies up to this size are drained to keep the connection
+# reusable; larger ones close it instead
+DRAIN_LIMIT = 64 * 1024
+
+USER_AGENT = 'readme-generator-link-checker/1.0'
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)"""
+    
+    def __init__(self, ssl_context: ssl.SSLContext):
+        self.ssl_context = ssl_context
+        self.idle: Dict[Tuple[str, str, int], List] = {}
+        self.opened = 0
+    
+    async def acquire(self, key: Tuple[str, str, int]):
+        """
+        Get a connection for a host
+        
+        Returns:
+            Tuple of (reader, writer, reused)
+        """
+        idle = self.idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        
+        scheme, host, port = key
+        reader, writer = await asyncio.open_connection(
+            host, port, ssl=self.ssl_context if scheme == 'https' else None
+        )
+        self.opened += 1
+        return reader, writer, False
+    
+    def release(self, key: Tuple[str, str, int], reader, writer, reusable: bool):
+        """Return a connection to the pool, or close it"""
+        if reusable and not writer.is_closing():
+            self.idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+    
+    def close(self):
+        """Close all idle connections"""
+        for connections in self.idle.values():
+            for _, writer in connections:
+                writer.close()
+        self.idle.clear()
+
+
+async def _drain_chunked(reader) -> bool:
+    """Read a chunked body; returns False if it was too large to drain"""
+    total = 0
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b';', 1)[0].strip() or b'0', 16)
+        if size == 0:
+            # Trailer section ends with an empty line
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+            return True
+        total += size
+        if total > DRAIN_LIMIT:
+            return False
+        await reader.readexactly(size + 2)
+
+
+async def _read_response(reader, method: str) -> Tuple[int, Dict[str, str], bool]:
+    """
+    Read a response status line, headers and body
+    
+    Returns:
+        Tuple of (status, lower-cased headers, connection reusable)
+    
+    Raises:
+        ConnectionError: If the server closed the connection first
+        ValueError: If the status line is malformed
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('connection closed by server')
+    parts = status_line.decode('latin-1').split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+        raise ValueError(f'invalid status line: {status_line[:80]!r}')
+    version, status = parts[0], int(parts[1])
+    
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    
+    reusable = version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+    if method == 'HEAD' or status in (204, 304) or status < 200:
+        pass
+    elif 'chunked' in headers.get('transfer-encoding', '').lower():
+        reusable = reusable and await _drain_chunked(reader)
+    elif 'content-length' in headers:
+        length = int(headers['content-length'])
+        if length <= DRAIN_LIMIT:
+            await reader.readexactly(length)
+        else:
+            reusable = False
+    else:
+        # Body delimited by connection close
+        reusable = False
+    return status, headers, reusable
+
+
+class URLProber:
+    """Resolves the final status of URLs concurrently"""
+    
+    def __init__(self, timeout: float = 10.0, per_host: int = 4, total: int = 32,
+                 max_redirects: int = 5):
+        """
+        Initialize prober
+        
+        Args:
+            timeout: Seconds allowed for each request
+            per_host: Maximum concurrent requests to one host
+            total: Maximum concurrent requests overall
+            max_redirects: Redirects followed before giving up
+        """
+        self.timeout = timeout
+        self.per_host = per_host
+        self.total = total
+        self.max_redirects = max_redirects
+        # Counters for the last run()
+        self.requests = 0
+        self.connections = 0
+    
+    def run(self, urls: List[str]) -> Dict[str, Dict]:
+        """
+        Check URLs over one connection pool
+        
+        Args:
+            urls: Absolute http(s) URLs without fragments
+        
+        Returns:
+            Dict mapping each URL to {'status', 'error', 'final', 'checked'}
+        """
+        self.requests = 0
+        self.connections = 0
+        return asyncio.run(self._check_all(urls))
+    
+    async def _check_all(self, urls: List[str]) -> Dict[str, Dict]:
+        """Check URLs concurrently over one connection pool"""
+        self._pool = _ConnectionPool(ssl.create_default_context())
+        self._global = asyncio.Semaphore(self.total)
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        try:
+            results = await asyncio.gather(*(self._check_url(url) for url in urls))
+        finally:
+            self.connections = self._pool.opened
+            self._pool.close()
+        return dict(zip(urls, results))
+    
+    async def _check_url(self, url: str) -> Dict:
+        """Resolve one URL through redirects"""
+        current = url
+        seen = {url}
+        status = None
+        error = None
+        try:
+            for _ in range(self.max_redirects + 1):
+                status, headers = await self._request('HEAD', current)
+                if status in HEAD_FALLBACK_STATUSES:
+                    status, headers = await self._request('GET', current)
+                
+                location = headers.get('location')
+                if status not in REDIRECT_STATUSES or not location:
+                    break
+                current = urldefrag(urljoin(current, location))[0]
+                if current in seen:
+                    status, error = None, 'redirect loop'
+                    break
+                seen.add(current)
+            else:
+                status, error = None, 'too many redirects'
+        except asyncio.TimeoutError:
+            status, error = None, 'timeout'
+        except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+            status, error = None, f"{type(e).__name__}: {e}"
+        
+        return {'status': status, 'error': error, 'final': current, 'checked': time.time()}
+    
+    async def _request(self, method: str, url: str) -> Tuple[int, Dict[str, str]]:
+        """Send one request within the per-host and global limits"""
+        parts = urlsplit(url)
+        scheme = parts.scheme
+        if scheme not in ('http', 'https'):
+            raise ValueError(f'unsupported scheme: {scheme}')
+        host = parts.hostname
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, host, port)
+        
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        # netloc without credentials keeps the port and IPv6 brackets as given
+        host_header = parts.netloc.rsplit('@', 1)[-1]
+        request = (
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            f"Accept: */*\r\n"
+            f"Connection: keep-alive\r\n\r\n"
+        ).encode('latin-1', 'replace')
+        
+        semaphore = self._hosts.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with semaphore, self._global:
+            return await asyncio.wait_for(self._exchange(key, method, request), self.timeout)
+    
+    async def _exchange(self, key: Tuple[str, str, int], method: str,
+                        request: bytes) -> Tuple[int, Dict[str, str]]:
+        """Write a request and read the response, retrying once on a stale pooled connection"""
+        while True:
+            reader, writer, reused = await self._pool.acquire(key)
+            self.requests += 1
+            try:
+                writer.write(request)
+                await writer.drain()
+                status, headers, reusable = await _read_response(reader, method)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused:
+                    # The server dropped an idle connection; use a fresh one
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            self._pool.release(key, reader, writer, reusable)
+            return status, headers
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Import Scanner
+
+Lists the packages a Python or JavaScript/TypeScript source file imports by
+tokenizing only its leading import block: the imports, comments, docstrings
+and directives before the first other statement. Files are read up to a
+byte cap, so scanning a whole source tree costs bounded I/O per file.
+"""
+
+import argparse
+import io
+import json
+import re
+import sys
+import tokenize
+from typing import Collection, List, Optional, Tuple
+
+
+# Bytes read from the start of each source file by default
+DEFAULT_IMPORT_BYTES = 4096
+
+# Source extension -> import syntax
+SOURCE_KINDS = {
+    '.py': 'python',
+    '.js': 'js',
+    '.mjs': 'js',
+    '.cjs': 'js',
+    '.jsx': 'js',
+    '.ts': 'js',
+    '.mts': 'js',
+    '.cts': 'js',
+    '.tsx': 'js',
+}
+
+# Python statements that may precede or surround imports at module level
+PY_BLOCK_KEYWORDS = {'try', 'except', 'else', 'finally', 'if', 'elif'}
+
+# Whitespace, comments, hashbangs and directives ('use strict') between imports
+JS_SKIP_RE = re.compile(r'''(?:\s+|//[^\n]*|/\*.*?\*/|\#![^\n]*|(['"])use\ [\w ]+\1;?)+''', re.DOTALL)
+JS_IMPORT_RE = re.compile(r'''
+    (?:import|export)\b[^'"`;]*?\bfrom\s*(['"])(?P<from>[^'"\n]+)\1       # import x from 'y', export * from 'y'
+  | import\s*(['"])(?P<bare>[^'"\n]+)\3                                   # import 'y'
+  | (?:(?:const|let|var)\s+[^=;'"]+?|import\s+[\w$]+)\s*=\s*
+    require\(\s*(['"])(?P<require>[^'"\n]+)\5\s*\)[\w$.]*                 # const x = require('y')
+''', re.VERBOSE)
+JS_END_RE = re.compile(r'[ \t]*;?')
+
+
+def package_name(specifier: str, kind: str) -> Optional[str]:
+    """
+    Package that an import specifier belongs to
+    
+    Args:
+        specifier: Module as written in the import ('flask.views', '@scope/pkg/sub')
+        kind: 'python' or 'js'
+    
+    Returns:
+        Top-level module or npm package name, or None for relative imports
+    """
+    if kind == 'python':
+        if specifier.startswith('.'):
+            return None
+        return specifier.split('.', 1)[0]
+    if specifier.startswith(('.', '/', '@/', '~/')):
+        # Relative imports and path aliases
+        return None
+    parts = specifier.split('/')
+    return '/'.join(parts[:2]) if specifier.startswith('@') else parts[0]
+
+
+def python_imports(text: str) -> List[str]:
+    """Modules imported by the leading import block of Python source"""
+    modules = []
+    depth = 0
+    line: List[tokenize.TokenInfo] = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(text).readline):
+            if token.type == tokenize.INDENT:
+                depth += 1
+            elif token.type == tokenize.DEDENT:
+                depth -= 1
+            elif token.type in (tokenize.COMMENT, tokenize.NL, tokenize.ENCODING):
+                continue
+            elif token.type not in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                line.append(token)
+                continue
+            
+            if not line:
+                continue
+            first_type = line[0].type
+            statement, line = [t.string for t in line], []
+            first = statement[0]
+            if first == 'import':
+                # import a.b as c, d
+                names = ' '.join(statement[1:]).replace(' . ', '.').split(',')
+                modules.extend(name.split()[0] for name in names if name.strip())
+            elif first == 'from':
+                end = statement.index('import') if 'import' in statement else len(statement)
+                modules.append(''.join(statement[1:end]))
+            elif depth > 0:
+                # Fallbacks inside try/if blocks (flask = None, pass, ...)
+                continue
+            elif first in PY_BLOCK_KEYWORDS and statement[-1] == ':':
+                continue
+            elif first_type == tokenize.STRING:
+                # Docstrings and other string expressions
+                continue
+            elif first.startswith('__') and len(statement) > 1 and statement[1] == '=':
+                # __all__, __version__, ...
+                continue
+            else:
+                break
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        pass
+    return modules
+
+
+def js_imports(text: str) -> List[str]:
+    """Modules imported by the leading import block of JavaScript/TypeScript source"""
+    modules = []
+    pos = 0
+    while True:
+        skip = JS_SKIP_RE.match(text, pos)
+        if skip:
+            pos = skip.end()
+        match = JS_IMPORT_RE.match(text, pos)
+        if not match:
+            break
+        modules.append(match.group('from') or match.group('bare') or match.group('require'))
+        pos = JS_END_RE.match(text, match.end()).end()
+    return modules
+
+
+def leading_imports(text: str, kind: str) -> List[str]:
+    """
+    Packages imported by the leading import block of a source text
+    
+    Args:
+        text: Start of a source file
+        kind: 'python' or 'js' (see SOURCE_KINDS)
+    
+    Returns:
+        Distinct package names in import order, without relative imports
+    """
+    specifiers = python_imports(text) if kind == 'python' else js_imports(text)
+    packages = (package_name(specifier, kind) for specifier in specifiers)
+    return list(dict.fromkeys(name for name in packages if name))
+
+
+def scan_head(data: bytes, kind: str, limit: int = DEFAULT_IMPORT_BYTES,
+              wanted: Optional[Collection[str]] = None) -> Tuple[List[str], int]:
+    """
+    List the packages imported by the start of a source file
+    
+    Args:
+        data: Up to `limit` bytes from the start of the file
+        kind: 'python' or 'js'
+        limit: Number of bytes that were requested; a head of exactly this
+            size is taken to be cut off after its last line
+        wanted: Packages of interest; files that do not mention any of them
+            are not tokenized and report no packages
+    
+    Returns:
+        (packages, size of data)
+    """
+    size = len(data)
+    if size == limit:
+        # Drop the last, possibly cut-off line
+        data = data[:data.rfind(b'\n') + 1]
+    text = data.decode('utf-8', 'replace')
+    if wanted is not None and not any(name in text for name in wanted):
+        return [], size
+    return leading_imports(text, kind), size
+
+
+def scan_file(path: str, kind: str, limit: int = DEFAULT_IMPORT_BYTES,
+              wanted: Optional[Collection[str]] = None) -> Tuple[List[str], int]:
+    """
+    Read the start of a source file and list its imported packages
+    
+    Safe to call from worker threads: it touches no shared state.
+    
+    Args:
+        path: File path
+        kind: 'python' or 'js'
+        limit: Maximum number of bytes to read
+        wanted: See scan_head()
+    
+    Returns:
+        (packages, bytes read); no packages if the file is unreadable
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read(limit)
+    except OSError:
+        return [], 0
+    return scan_head(data, kind, limit, wanted)
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='List the packages imported by the leading import block of source files',
+        epilog='Example: python import_scan.py app.py src/index.ts'
+    )
+    parser.add_argument('files', nargs='+', help='Python or JavaScript/TypeScript source files')
+    parser.add_argument('--bytes', type=int, default=DEFAULT_IMPORT_BYTES, metavar='N',
+                        help=f'Bytes read from the start of each file (default: {DEFAULT_IMPORT_BYTES})')
+    args = parser.parse_args()
+    
+    status = 0
+    for name in args.files:
+        kind = SOURCE_KINDS.get(name[name.rfind('.'):].lower()) if '.' in name else None
+        if kind is None:
+            print(f"{name}: not a Python or JavaScript/TypeScript file", file=sys.stderr)
+            status = 1
+            continue
+        packages, _ = scan_file(name, kind, args.bytes)
+        print(json.dumps({'path': name, 'imports': packages}))
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
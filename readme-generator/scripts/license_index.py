@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+License Fingerprint Index
+
+Identifies license texts by comparing word n-gram fingerprints against a
+bundled corpus of common SPDX licenses (assets/licenses/<SPDX-ID>.txt,
+plus <SPDX-ID>~<variant>.txt for other common forms such as the short
+Apache notice).
+Texts are normalized (case, punctuation, copyright lines) and only their
+first WINDOW_WORDS words are fingerprinted, so identifying a LICENSE file
+needs just its first few KB. The corpus fingerprints are precompiled into
+assets/licenses/index.json; run this script to rebuild it after changing
+the corpus.
+"""
+
+import argparse
+import functools
+import json
+import re
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+
+LICENSE_DIR = Path(__file__).resolve().parent.parent / 'assets' / 'licenses'
+INDEX_PATH = LICENSE_DIR / 'index.json'
+
+# Bump when normalization or fingerprinting changes
+INDEX_VERSION = 1
+NGRAM = 3
+WINDOW_WORDS = 400
+# Bytes of a license file to read; enough for WINDOW_WORDS words plus a
+# title, copyright lines and Markdown formatting
+HEAD_BYTES = 4096
+# Similarity below which a text is not considered a match
+MIN_CONFIDENCE = 0.5
+
+WORD_RE = re.compile(r"[a-z0-9]+(?:['.][a-z0-9]+)*")
+# Copyright notices differ per project and are left out of fingerprints
+COPYRIGHT_LINE_RE = re.compile(r'^\W*(?:copyright\s*(?:\(c\)|©|\d{4})|\(c\)\s*(?:\d{4}|<)|©)', re.IGNORECASE)
+SPDX_TAG_RE = re.compile(r'SPDX-License-Identifier:\s*([\w.+-]+(?:\s+(?:OR|AND|WITH)\s+[\w.+-]+)*)')
+
+# Spelling variants treated as the same word
+WORD_VARIANTS = {
+    'licence': 'license',
+    'licences': 'licenses',
+}
+
+
+def normalize(text: str) -> List[str]:
+    """
+    Normalize a license text into words
+    
+    Args:
+        text: License text (plain text or Markdown)
+    
+    Returns:
+        Lower-cased words without punctuation and copyright lines
+    """
+    words = []
+    for line in text.splitlines():
+        if COPYRIGHT_LINE_RE.match(line):
+            continue
+        for word in WORD_RE.findall(line.lower()):
+            words.append(WORD_VARIANTS.get(word, word))
+    return words
+
+
+def shingles(words: List[str]) -> FrozenSet[int]:
+    """Hashed word n-grams of the first WINDOW_WORDS words"""
+    words = words[:WINDOW_WORDS]
+    return frozenset(
+        zlib.crc32(' '.join(words[i:i + NGRAM]).encode('utf-8'))
+        for i in range(max(len(words) - NGRAM + 1, 0))
+    )
+
+
+def build_index(directory: Path = LICENSE_DIR) -> Dict:
+    """
+    Fingerprint every license text in a corpus directory
+    
+    Args:
+        directory: Directory of <SPDX-ID>[~<variant>].txt files
+    
+    Returns:
+        {'version', 'ngram', 'window', 'licenses': {file stem: [hashes]}}
+    """
+    licenses = {}
+    for path in sorted(directory.glob('*.txt')):
+        licenses[path.stem] = sorted(shingles(normalize(path.read_text(encoding='utf-8'))))
+    return {'version': INDEX_VERSION, 'ngram': NGRAM, 'window': WINDOW_WORDS, 'licenses': licenses}
+
+
+@functools.lru_cache(maxsize=4)
+def _loaded(path: str, mtime_ns: int, size: int) -> Dict[str, FrozenSet[int]]:
+    data = json.loads(Path(path).read_text(encoding='utf-8'))
+    if (data.get('version') != INDEX_VERSION or data.get('ngram') != NGRAM or
+            data.get('window') != WINDOW_WORDS):
+        raise ValueError(f"stale license index: {path}")
+    return {spdx_id: frozenset(hashes) for spdx_id, hashes in data['licenses'].items()}
+
+
+@functools.lru_cache(maxsize=1)
+def _built(directory: str) -> Dict[str, FrozenSet[int]]:
+    index = build_index(Path(directory))
+    return {spdx_id: frozenset(hashes) for spdx_id, hashes in index['licenses'].items()}
+
+
+def load_index(path: Path = INDEX_PATH) -> Dict[str, FrozenSet[int]]:
+    """
+    Load the precompiled fingerprints (cached until the file changes)
+    
+    Falls back to fingerprinting the corpus texts when the index file is
+    missing or was built with other settings.
+    
+    Returns:
+        Mapping of corpus file stem to its n-gram hashes
+    """
+    try:
+        st = path.stat()
+        return _loaded(str(path), st.st_mtime_ns, st.st_size)
+    except (OSError, ValueError):
+        return _built(str(path.parent))
+
+
+def identify(text: str) -> Optional[Tuple[str, float]]:
+    """
+    Identify the license of a text from its beginning
+    
+    An explicit `SPDX-License-Identifier:` tag wins; otherwise the text's
+    fingerprint is compared with every corpus license by Dice similarity.
+    
+    Args:
+        text: Start of a license file (at least HEAD_BYTES when available)
+    
+    Returns:
+        (SPDX ID, confidence between 0 and 1), or None below MIN_CONFIDENCE
+    """
+    tag = SPDX_TAG_RE.search(text)
+    if tag:
+        return tag.group(1), 1.0
+    
+    grams = shingles(normalize(text))
+    if not grams:
+        return None
+    best, score = None, 0.0
+    for name, reference in load_index().items():
+        similarity = 2 * len(grams & reference) / (len(grams) + len(reference))
+        if similarity > score:
+            best, score = name, similarity
+    if best is None or score < MIN_CONFIDENCE:
+        return None
+    return best.split('~', 1)[0], round(score, 3)
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='Rebuild the license fingerprint index, or identify license files',
+        epilog='Example: python license_index.py LICENSE'
+    )
+    parser.add_argument('files', nargs='*', help='License files to identify (default: rebuild the index)')
+    args = parser.parse_args()
+    
+    if not args.files:
+        index = build_index()
+        INDEX_PATH.write_text(json.dumps(index, separators=(',', ':')) + '\n', encoding='utf-8')
+        print(f"✅ Indexed {len(index['licenses'])} licenses into {INDEX_PATH}")
+        return
+    
+    status = 0
+    for name in args.files:
+        try:
+            with open(name, 'rb') as f:
+                head = f.read(HEAD_BYTES).decode('utf-8', 'replace')
+        except OSError as e:
+            print(f"{name}: error: {e}")
+            status = 1
+            continue
+        match = identify(head)
+        print(f"{name}: {match[0]} ({match[1]:.0%})" if match else f"{name}: unknown")
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
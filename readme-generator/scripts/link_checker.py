@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Link Checker
+
+Checks whether external README links are alive. Each unique URL is
+requested once with HEAD (falling back to GET for servers that reject
+HEAD), following redirects, over a small asyncio HTTP/1.1 client that
+keeps connections alive per host (see http_probe.py). Concurrency is
+capped per host and overall, and results are kept in a JSON cache with a
+TTL so repeated runs over many READMEs do not re-check the same badge and
+documentation URLs.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+from urllib.parse import urldefrag, urlsplit
+
+
+CACHE_VERSION = 1
+DEFAULT_TTL = 24 * 60 * 60
+
+# Statuses that mean the link is gone rather than temporarily failing
+DEAD_STATUSES = (404, 410)
+
+
+def default_cache_path() -> Path:
+    """Link cache location shared by all projects (~/.cache/readme-generator/links.json)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'readme-generator' / 'links.json'
+
+
+def is_checkable(url: str) -> bool:
+    """Check whether a link target is an absolute http(s) URL"""
+    return url.startswith(('http://', 'https://')) and bool(urlsplit(url).hostname)
+
+
+def is_dead(result: Dict) -> bool:
+    """Check whether a link result means the target no longer exists"""
+    return result.get('status') in DEAD_STATUSES
+
+
+def is_failed(result: Dict) -> bool:
+    """Check whether a link result is any kind of failure"""
+    status = result.get('status')
+    return status is None or status >= 400
+
+
+class LinkChecker:
+    """Concurrent HTTP link checker with keep-alive and a TTL cache"""
+    
+    def __init__(self, cache_path: Optional[Path] = None, ttl: float = DEFAULT_TTL,
+                 timeout: float = 10.0, per_host: int = 4, total: int = 32,
+                 max_redirects: int = 5):
+        """
+        Initialize link checker
+        
+        Args:
+            cache_path: JSON cache file (None disables the persistent cache)
+            ttl: Seconds a cached result stays valid
+            timeout: Seconds allowed for each request
+            per_host: Maximum concurrent requests to one host
+            total: Maximum concurrent requests overall
+            max_redirects: Redirects followed before giving up
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.ttl = ttl
+        self.timeout = timeout
+        self.per_host = per_host
+        self.total = total
+        self.max_redirects = max_redirects
+        self.cache: Dict[str, Dict] = self._load_cache()
+        self._dirty = False
+        # Counters for the last check() run
+        self.requests = 0
+        self.connections = 0
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Load cached results, dropping unreadable files"""
+        if self.cache_path is None:
+            return {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('links', {})
+    
+    def save(self):
+        """Merge results into the cache file and write it atomically"""
+        if self.cache_path is None or not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Other processes may have written the file since it was loaded
+        merged = self._load_cache()
+        for url, entry in self.cache.items():
+            if url not in merged or merged[url]['checked'] < entry['checked']:
+                merged[url] = entry
+        now = time.time()
+        merged = {url: entry for url, entry in merged.items() if now - entry['checked'] < self.ttl}
+        
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({'version': CACHE_VERSION, 'links': merged}), encoding='utf-8')
+        os.replace(tmp, self.cache_path)
+        self.cache = merged
+        self._dirty = False
+    
+    def check(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Check URLs, using cached results that are still fresh
+        
+        Args:
+            urls: Absolute http(s) URLs; fragments are ignored
+        
+        Returns:
+            Dict mapping each URL to {'status', 'error', 'final', 'checked'}.
+            'status' is the final HTTP status (None on network errors),
+            'final' the URL after redirects
+        """
+        now = time.time()
+        results = {}
+        pending = {}
+        for url in urls:
+            key = urldefrag(url)[0]
+            entry = self.cache.get(key)
+            if entry is not None and now - entry['checked'] < self.ttl:
+                results[url] = entry
+            else:
+                pending.setdefault(key, []).append(url)
+        
+        self.requests = 0
+        self.connections = 0
+        if pending:
+            from http_probe import URLProber
+            prober = URLProber(self.timeout, self.per_host, self.total, self.max_redirects)
+            checked = prober.run(list(pending))
+            self.requests = prober.requests
+            self.connections = prober.connections
+            for key, entry in checked.items():
+                for url in pending[key]:
+                    results[url] = entry
+                status = entry['status']
+                # Transient failures are retried on the next run
+                if status is not None and status < 500 and status != 429:
+                    self.cache[key] = entry
+                    self._dirty = True
+            self.save()
+        return results
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""
+Lockfile Reader
+
+Extracts dependency versions and package counts from lockfiles and
+requirement files (requirements.txt, Pipfile.lock, poetry.lock, Cargo.lock,
+go.sum, package-lock.json, pnpm-lock.yaml) without loading them whole.
+Text formats are read line by line; JSON lockfiles go through JSONStream,
+which decodes one object member at a time. Memory therefore stays bounded
+by the largest single entry and the size of the result, however large the
+lockfile is.
+"""
+
+import argparse
+import io
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, TextIO
+
+
+CHUNK_SIZE = 1 << 16
+# Largest single JSON value decoded at once (one lockfile entry)
+MAX_VALUE_CHARS = 1 << 24
+
+WS_RE = re.compile(r'[ \t\n\r]*')
+# What may follow a number, true, false or null
+SCALAR_END_RE = re.compile(r'[ \t\n\r,\]}]')
+# Skips to the next string or bracket; no match means more input is needed
+SKIP_RE = re.compile(r'[^"\[\]{}]*(?:("[^"\\]*(?:\\.[^"\\]*)*")|([\[\]{}]))')
+TOML_STRING_RE = re.compile(r'^([\w-]+)\s*=\s*"((?:[^"\\]|\\.)*)"')
+REQUIREMENT_RE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*(.*)$')
+
+# package.json / pnpm-lock.yaml dependency groups; the rest are runtime
+NPM_DEPENDENCY_GROUPS = ('dependencies', 'devDependencies', 'optionalDependencies', 'peerDependencies')
+NPM_DEV_GROUPS = ('devDependencies',)
+
+
+class LockfileError(Exception):
+    """Raised when a lockfile cannot be parsed"""
+
+
+def canonical_name(name: str) -> str:
+    """Normalize a Python package name (PEP 503) so lock and manifest names compare equal"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+
+class JSONStream:
+    """
+    Incremental reader for a JSON document in a text file
+    
+    Navigates objects member by member with members(); each member value is
+    either decoded with read_value() (C-speed via json raw_decode) or
+    skipped with skip_value() without building it. Only the input not yet
+    consumed, plus the value being decoded, is held in memory.
+    """
+    
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        """
+        Initialize a reader positioned at the start of the document
+        
+        Args:
+            file: Text file opened for reading
+            chunk_size: Characters read at a time
+        """
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.values = 0
+        self._decoder = json.JSONDecoder()
+    
+    def _more(self) -> bool:
+        """Read more input, at least doubling what is pending; False at EOF"""
+        chunk = self.file.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)"""
+        while True:
+            self.pos = WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more():
+                return ''
+    
+    def expect(self, char: str):
+        """Consume one structural character"""
+        found = self.peek()
+        if found != char:
+            raise LockfileError(f"expected {char!r}, found {found or 'end of input'!r}")
+        self.pos += 1
+    
+    def read_value(self) -> Any:
+        """Decode the next value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if len(self.buf) - self.pos > MAX_VALUE_CHARS:
+                    raise LockfileError(f"JSON value larger than {MAX_VALUE_CHARS} characters")
+                if not self._more():
+                    raise LockfileError(str(e))
+                continue
+            # A number may continue in the next chunk ('-1.5e' + '3')
+            if (not isinstance(value, (dict, list, str)) and not SCALAR_END_RE.match(self.buf, end)
+                    and self._more()):
+                continue
+            self.pos = end
+            self.values += 1
+            return value
+    
+    def skip_value(self):
+        """Skip the next value without decoding it"""
+        if self.peek() not in ('{', '['):
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            match = SKIP_RE.match(self.buf, self.pos)
+            if match is None:
+                # Input ends inside a string or before the next bracket
+                if not self._more():
+                    raise LockfileError('unterminated JSON value')
+                continue
+            self.pos = match.end()
+            bracket = match.group(2)
+            if bracket:
+                depth += 1 if bracket in '[{' else -1
+                if depth == 0:
+                    self.values += 1
+                    return
+    
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object at the current position
+        
+        After each key the caller reads or skips its value; values left
+        untouched are skipped automatically.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            self.values += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise LockfileError('expected an object key')
+            self.expect(':')
+            values = self.values
+            yield key
+            if self.values == values:
+                self.skip_value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == '}':
+                self.values += 1
+                return
+            if separator != ',':
+                raise LockfileError(f"expected ',' or '}}', found {separator or 'end of input'!r}")
+
+
+def _summary(packages: int, versions: Dict[str, str], direct: Optional[Dict[str, bool]] = None) -> Dict:
+    """Reader result (see read_lockfile)"""
+    return {'packages': packages, 'versions': versions, 'direct': direct}
+
+
+def read_package_lock(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read package-lock.json / npm-shrinkwrap.json (lockfile versions 1-3)"""
+    stream = JSONStream(file)
+    count = 0
+    versions: Dict[str, str] = {}
+    direct: Optional[Dict[str, bool]] = None
+    version = 1
+    for key in stream.members():
+        if key == 'lockfileVersion':
+            version = stream.read_value()
+        elif key == 'packages':
+            # v2/v3: flat map of install paths; '' is the root project
+            direct = {}
+            for rel in stream.members():
+                entry = stream.read_value()
+                if not isinstance(entry, dict):
+                    continue
+                if rel == '':
+                    for group in NPM_DEPENDENCY_GROUPS:
+                        for name in entry.get(group) or {}:
+                            direct.setdefault(name, group in NPM_DEV_GROUPS)
+                    continue
+                if 'node_modules/' not in rel or entry.get('link'):
+                    continue
+                count += 1
+                name = rel[len('node_modules/'):]
+                if (name in direct or name in wanted) and 'version' in entry:
+                    versions[name] = entry['version']
+            # The v2 'dependencies' tree repeats 'packages'
+            break
+        elif key == 'dependencies' and version == 1:
+            # v1: nested tree, one member per top-level package
+            for name in stream.members():
+                entry = stream.read_value()
+                if not isinstance(entry, dict):
+                    continue
+                pending = [entry]
+                while pending:
+                    node = pending.pop()
+                    count += 1
+                    pending.extend(child for child in (node.get('dependencies') or {}).values()
+                                   if isinstance(child, dict))
+                if name in wanted and 'version' in entry:
+                    versions[name] = entry['version']
+    return _summary(count, versions, direct)
+
+
+def read_pipfile_lock(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read Pipfile.lock ('default' and 'develop' package maps)"""
+    stream = JSONStream(file)
+    seen: Set[str] = set()
+    versions: Dict[str, str] = {}
+    for key in stream.members():
+        if key not in ('default', 'develop'):
+            continue
+        for name in stream.members():
+            entry = stream.read_value()
+            name = canonical_name(name)
+            seen.add(name)
+            if name in wanted and isinstance(entry, dict):
+                # Git and path dependencies are locked without a version
+                versions.setdefault(name, (entry.get('version') or '').lstrip('='))
+    return _summary(len(seen), versions)
+
+
+def _toml_packages(file: TextIO) -> Iterator[Dict[str, str]]:
+    """String fields of each [[package]] table of a lockfile, one table at a time"""
+    package: Optional[Dict[str, str]] = None
+    for line in file:
+        if line.startswith('['):
+            if package is not None:
+                yield package
+            package = {} if line.startswith('[[package]]') else None
+            continue
+        if package is not None:
+            match = TOML_STRING_RE.match(line)
+            if match:
+                package[match.group(1)] = match.group(2)
+    if package is not None:
+        yield package
+
+
+def read_poetry_lock(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read poetry.lock"""
+    count = 0
+    versions: Dict[str, str] = {}
+    for package in _toml_packages(file):
+        count += 1
+        name = canonical_name(package.get('name', ''))
+        if name in wanted and 'version' in package:
+            versions[name] = package['version']
+    return _summary(count, versions)
+
+
+def read_cargo_lock(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read Cargo.lock; crates without a source are the workspace's own"""
+    count = 0
+    versions: Dict[str, str] = {}
+    for package in _toml_packages(file):
+        if 'source' not in package:
+            continue
+        count += 1
+        name = package.get('name', '')
+        if name in wanted and 'version' in package:
+            versions[name] = package['version']
+    return _summary(count, versions)
+
+
+def read_go_sum(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read go.sum; modules whose go.mod alone was checked are not counted"""
+    count = 0
+    versions: Dict[str, str] = {}
+    previous = None
+    for line in file:
+        parts = line.split()
+        if len(parts) != 3 or parts[1].endswith('/go.mod'):
+            continue
+        # Lines are sorted, so one module version's lines are adjacent
+        if (parts[0], parts[1]) != previous:
+            previous = (parts[0], parts[1])
+            count += 1
+            if parts[0] in wanted:
+                versions[parts[0]] = parts[1]
+    return _summary(count, versions)
+
+
+def _yaml_key(text: str) -> str:
+    """Key of a 'key:' or 'key: value' YAML line, unquoted"""
+    key = text.split(': ', 1)[0].rstrip(':').strip()
+    return key[1:-1] if key[:1] in ('"', "'") and key[-1:] == key[:1] else key
+
+
+def read_pnpm_lock(file: TextIO, wanted: Set[str]) -> Dict:
+    """Read pnpm-lock.yaml (lockfile versions 5-9) line by line"""
+    count = 0
+    versions: Dict[str, str] = {}
+    direct: Dict[str, bool] = {}
+    section = importer = group = name = None
+    for line in file:
+        text = line.strip()
+        if not text or text.startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip(' '))
+        if indent == 0:
+            section = _yaml_key(text)
+            importer = '.' if section in NPM_DEPENDENCY_GROUPS else None
+            group = section if importer else None
+            continue
+        
+        if section == 'packages':
+            if indent == 2:
+                count += 1
+            continue
+        if section == 'importers':
+            if indent == 2:
+                importer = _yaml_key(text)
+                continue
+            if indent == 4:
+                group = _yaml_key(text)
+                continue
+            indent -= 4
+        elif group is None:
+            continue
+        
+        # Dependency lines of the root importer, relative to their group:
+        # 'name: version' (v5) or 'name:' followed by 'version: ...' (v6+)
+        if importer != '.' or group not in NPM_DEPENDENCY_GROUPS:
+            continue
+        if indent == 2:
+            name = _yaml_key(text)
+            direct.setdefault(name, group in NPM_DEV_GROUPS)
+            value = text.split(': ', 1)[1].strip() if ': ' in text else ''
+            if value:
+                versions[name] = value.strip('\'"').split('(', 1)[0].split('_', 1)[0]
+        elif indent == 4 and text.startswith('version:') and name is not None:
+            versions[name] = text[len('version:'):].strip().strip('\'"').split('(', 1)[0]
+    return _summary(count, versions, direct)
+
+
+def read_requirements(file: TextIO, wanted: Set[str]) -> Dict:
+    """
+    Read requirements.txt
+    
+    Every requirement is direct, except in pip-compile output where a
+    requirement pulled in only by other packages ('# via <package>') is
+    transitive. Options (-r, -e, --hash) are ignored.
+    """
+    versions: Dict[str, str] = {}
+    vias: Dict[str, List[str]] = {}
+    current = None
+    in_via = False
+    pending = ''
+    for raw in file:
+        line = pending + raw.rstrip('\n')
+        pending = ''
+        if line.endswith('\\'):
+            pending = line[:-1] + ' '
+            continue
+        stripped = line.strip()
+        if stripped.startswith('#'):
+            # pip-compile: '# via pkg', or '# via' followed by '#   pkg' lines
+            comment = stripped.lstrip('#').strip()
+            if current is not None and comment.startswith('via'):
+                in_via = True
+                comment = comment[3:].strip()
+            if in_via and comment:
+                vias[current].append(comment)
+            continue
+        in_via = False
+        requirement = stripped.split(' #', 1)[0].split(' --', 1)[0].strip()
+        match = REQUIREMENT_RE.match(requirement) if not requirement.startswith('-') else None
+        if not match:
+            current = None
+            continue
+        current = canonical_name(match.group(1))
+        vias[current] = []
+        spec = match.group(2).split(';', 1)[0].strip()
+        if spec:
+            versions[current] = spec[2:].strip() if spec.startswith('==') else spec
+    
+    direct = {}
+    for name, sources in vias.items():
+        # Required by a requirements/project file rather than only by packages
+        if not sources or any(source.startswith(('-r ', '-c ')) or
+                              source.endswith(('.in', '.txt', '.toml', '.cfg', '.py')) for source in sources):
+            direct[name] = False
+    return _summary(len(vias), versions, direct)
+
+
+# Lockfile name -> (ecosystem, reader)
+LOCKFILE_READERS: Dict[str, tuple] = {
+    'package-lock.json': ('npm', read_package_lock),
+    'npm-shrinkwrap.json': ('npm', read_package_lock),
+    'pnpm-lock.yaml': ('npm', read_pnpm_lock),
+    'poetry.lock': ('python', read_poetry_lock),
+    'Pipfile.lock': ('python', read_pipfile_lock),
+    'requirements.txt': ('python', read_requirements),
+    'Cargo.lock': ('cargo', read_cargo_lock),
+    'go.sum': ('go', read_go_sum),
+}
+
+
+def read_lockfile(path: Path, wanted: Iterable[str] = (), raw: Optional[BinaryIO] = None) -> Dict:
+    """
+    Read a lockfile or requirements file by streaming it
+    
+    Args:
+        path: File whose name is a LOCKFILE_READERS key
+        wanted: Package names (canonical for Python) whose locked versions
+            are reported, e.g. the direct dependencies from the manifest
+        raw: Binary stream to read instead of opening `path` (e.g. an
+            archive member); it is closed afterwards
+    
+    Returns:
+        {'packages': number of locked packages, 'versions': {name: version}
+        for the wanted packages found in the file ('' if locked without one),
+        'direct': {name: development only} when the file itself records
+        the direct dependencies, else None, 'bytes_read': bytes read}
+    
+    Raises:
+        LockfileError: The file is malformed
+        OSError: The file cannot be read
+    """
+    _, reader = LOCKFILE_READERS[path.name]
+    if raw is None:
+        raw = open(path, 'rb')
+    with raw:
+        with io.TextIOWrapper(raw, encoding='utf-8', errors='replace') as file:
+            summary = reader(file, set(wanted))
+            summary['bytes_read'] = raw.tell()
+    return summary
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='Summarize lockfiles without loading them into memory',
+        epilog='Example: python lockfiles.py package-lock.json --want react'
+    )
+    parser.add_argument('files', nargs='+', help=f"Lockfiles ({', '.join(LOCKFILE_READERS)})")
+    parser.add_argument('--want', action='append', default=[], metavar='NAME',
+                        help='Report the locked version of NAME (repeatable)')
+    args = parser.parse_args()
+    
+    status = 0
+    for name in args.files:
+        path = Path(name)
+        if path.name not in LOCKFILE_READERS:
+            print(f"{name}: unsupported lockfile", file=sys.stderr)
+            status = 1
+            continue
+        try:
+            summary = read_lockfile(path, args.want)
+        except (OSError, LockfileError) as e:
+            print(f"{name}: {e}", file=sys.stderr)
+            status = 1
+            continue
+        print(json.dumps({'path': name, **summary}))
+    sys.exit(status)
+
+
+if __name__ == '__main__':
+    main()
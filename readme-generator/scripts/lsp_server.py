@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+README Language Server
+
+Runs READMEValidator as a Language Server Protocol server over stdio. Open
+documents are kept in memory, `didChange` edits are applied incrementally
+and validation results are published as diagnostics. Re-validation goes
+through the per-section cache, so only edited sections are re-checked.
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+from typing import BinaryIO, Dict, List, Optional
+from urllib.parse import unquote, urlsplit
+
+from validate_readme import READMEValidator, rule_set_for
+
+
+# LSP constants
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+SEVERITY = {'error': 1, 'warning': 2, 'suggestion': 3}
+SERVER_NOT_INITIALIZED = -32002
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+DIAGNOSTIC_SOURCE = 'readme-validator'
+
+
+def read_message(stream: BinaryIO) -> Optional[Dict]:
+    """
+    Read one JSON-RPC message framed with a Content-Length header
+    
+    Returns:
+        Decoded message, or None at end of input
+    """
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            if length is None:
+                continue
+            break
+        name, _, value = line.decode('ascii', 'replace').partition(':')
+        if name.strip().lower() == 'content-length':
+            length = int(value.strip())
+    
+    body = stream.read(length)
+    if len(body) < length:
+        return None
+    return json.loads(body.decode('utf-8'))
+
+
+def write_message(stream: BinaryIO, message: Dict):
+    """Write one JSON-RPC message with a Content-Length header"""
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> str:
+    """Local path of a file:// URI (other URIs are returned unchanged)"""
+    parts = urlsplit(uri)
+    if parts.scheme != 'file':
+        return uri
+    path = unquote(parts.path)
+    # file:///C:/... on Windows
+    if len(path) > 2 and path[0] == '/' and path[2] == ':':
+        path = path[1:]
+    return path
+
+
+class TextDocument:
+    """In-memory text of an open document, stored as a list of lines"""
+    
+    def __init__(self, uri: str, text: str, version: int, encoding: str = 'utf-16'):
+        """
+        Initialize document
+        
+        Args:
+            uri: Document URI
+            text: Full document text
+            version: Version number sent by the client
+            encoding: Position encoding negotiated with the client
+                ('utf-16', 'utf-8' or 'utf-32')
+        """
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.version = version
+        self.encoding = encoding
+        self.lines = text.split('\n')
+    
+    @property
+    def text(self) -> str:
+        """Full document text"""
+        return '\n'.join(self.lines)
+    
+    def _index(self, text: str, character: int) -> int:
+        """Convert a position character offset within a line to a str index"""
+        if self.encoding == 'utf-32' or text.isascii():
+            return min(character, len(text))
+        if self.encoding == 'utf-8':
+            return len(text.encode('utf-8')[:character].decode('utf-8', 'ignore'))
+        units = 0
+        for index, char in enumerate(text):
+            if units >= character:
+                return index
+            units += 2 if ord(char) > 0xFFFF else 1
+        return len(text)
+    
+    def width(self, line: int) -> int:
+        """Length of a line in position units"""
+        text = self.lines[line]
+        if self.encoding == 'utf-32' or text.isascii():
+            return len(text)
+        if self.encoding == 'utf-8':
+            return len(text.encode('utf-8'))
+        return len(text.encode('utf-16-le')) // 2
+    
+    def apply(self, change: Dict):
+        """
+        Apply one TextDocumentContentChangeEvent
+        
+        Args:
+            change: {'text'} for a full replacement, or {'range', 'text'}
+                for an incremental edit
+        """
+        if 'range' not in change:
+            self.lines = change['text'].split('\n')
+            return
+        
+        start = change['range']['start']
+        end = change['range']['end']
+        last = len(self.lines) - 1
+        start_line = min(start['line'], last)
+        end_line = min(end['line'], last)
+        start_char = start['character'] if start['line'] <= last else len(self.lines[last])
+        end_char = end['character'] if end['line'] <= last else len(self.lines[last])
+        
+        prefix = self.lines[start_line][:self._index(self.lines[start_line], start_char)]
+        suffix = self.lines[end_line][self._index(self.lines[end_line], end_char):]
+        self.lines[start_line:end_line + 1] = (prefix + change['text'] + suffix).split('\n')
+
+
+class LanguageServer:
+    """Minimal LSP server publishing README validation diagnostics"""
+    
+    def __init__(self, reader: BinaryIO, writer: BinaryIO):
+        """
+        Initialize server
+        
+        Args:
+            reader: Binary input stream (client messages)
+            writer: Binary output stream (server messages)
+        """
+        self.reader = reader
+        self.writer = writer
+        self.documents: Dict[str, TextDocument] = {}
+        self.dirty: Dict[str, None] = {}
+        self.encoding = 'utf-16'
+        self.initialized = False
+        self.shutdown_requested = False
+        self.exit_code: Optional[int] = None
+        self.handlers = {
+            'initialize': self.initialize,
+            'initialized': lambda params: None,
+            'shutdown': self.shutdown,
+            'exit': self.exit,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didSave': self.did_save,
+            'textDocument/didClose': self.did_close,
+        }
+    
+    def run(self) -> int:
+        """
+        Serve until the client sends `exit` or closes the input
+        
+        Messages are read on a separate thread; diagnostics are published
+        once no further messages are waiting, so a burst of keystrokes is
+        validated once.
+        
+        Returns:
+            Process exit code (0 after an orderly shutdown)
+        """
+        inbox: 'queue.Queue[Optional[Dict]]' = queue.Queue()
+        
+        def read_loop():
+            while True:
+                try:
+                    message = read_message(self.reader)
+                except (ValueError, OSError):
+                    message = None
+                inbox.put(message)
+                if message is None:
+                    return
+        
+        threading.Thread(target=read_loop, daemon=True).start()
+        
+        while self.exit_code is None:
+            message = inbox.get()
+            if message is None:
+                return 0 if self.shutdown_requested else 1
+            self.dispatch(message)
+            if self.dirty and inbox.empty():
+                self.publish_dirty()
+        return self.exit_code
+    
+    def dispatch(self, message: Dict):
+        """Handle one request or notification"""
+        method = message.get('method')
+        if method is None:
+            # Response to a server request; none are sent
+            return
+        is_request = 'id' in message
+        
+        if not self.initialized and method not in ('initialize', 'exit'):
+            if is_request:
+                self.respond_error(message['id'], SERVER_NOT_INITIALIZED, 'server not initialized')
+            return
+        
+        handler = self.handlers.get(method)
+        if handler is None:
+            if is_request:
+                self.respond_error(message['id'], METHOD_NOT_FOUND, f"unsupported method: {method}")
+            return
+        
+        try:
+            result = handler(message.get('params') or {})
+        except Exception as e:
+            if is_request:
+                self.respond_error(message['id'], INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+            else:
+                print(f"{method} failed: {type(e).__name__}: {e}", file=sys.stderr)
+            return
+        if is_request:
+            write_message(self.writer, {'jsonrpc': '2.0', 'id': message['id'], 'result': result})
+    
+    def respond_error(self, request_id, code: int, text: str):
+        """Send an error response"""
+        write_message(self.writer, {
+            'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': text},
+        })
+    
+    def initialize(self, params: Dict) -> Dict:
+        """Negotiate the position encoding and announce capabilities"""
+        offered = params.get('capabilities', {}).get('general', {}).get('positionEncodings') or []
+        for encoding in ('utf-32', 'utf-8'):
+            if encoding in offered:
+                self.encoding = encoding
+                break
+        self.initialized = True
+        return {
+            'capabilities': {
+                'positionEncoding': self.encoding,
+                'textDocumentSync': {
+                    'openClose': True,
+                    'change': TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                    'save': {'includeText': False},
+                },
+            },
+            'serverInfo': {'name': 'readme-validator'},
+        }
+    
+    def shutdown(self, params: Dict):
+        """Acknowledge shutdown; the process ends on `exit`"""
+        self.shutdown_requested = True
+        return None
+    
+    def exit(self, params: Dict):
+        """Stop serving"""
+        self.exit_code = 0 if self.shutdown_requested else 1
+    
+    def did_open(self, params: Dict):
+        """Start tracking a document"""
+        item = params['textDocument']
+        uri = item['uri']
+        self.documents[uri] = TextDocument(uri, item['text'], item.get('version', 0), self.encoding)
+        self.dirty[uri] = None
+    
+    def did_change(self, params: Dict):
+        """Apply edits to a tracked document"""
+        uri = params['textDocument']['uri']
+        document = self.documents.get(uri)
+        if document is None:
+            return
+        for change in params['contentChanges']:
+            document.apply(change)
+        document.version = params['textDocument'].get('version', document.version)
+        self.dirty[uri] = None
+    
+    def did_save(self, params: Dict):
+        """Re-validate on save (linked files may have changed meanwhile)"""
+        uri = params['textDocument']['uri']
+        if uri in self.documents:
+            self.dirty[uri] = None
+    
+    def did_close(self, params: Dict):
+        """Stop tracking a document and clear its diagnostics"""
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self.dirty.pop(uri, None)
+        self.publish(uri, [], None)
+    
+    def publish_dirty(self):
+        """Validate every changed document and publish its diagnostics"""
+        while self.dirty:
+            uri = next(iter(self.dirty))
+            del self.dirty[uri]
+            document = self.documents.get(uri)
+            if document is None:
+                continue
+            try:
+                diagnostics = self.diagnostics(document)
+            except Exception as e:
+                # e.g. a malformed rule config or a failing in-house rule:
+                # report it on the document and keep serving the others
+                message = f"validation failed: {type(e).__name__}: {e}"
+                print(f"{uri}: {message}", file=sys.stderr)
+                diagnostics = [{
+                    'range': {
+                        'start': {'line': 0, 'character': 0},
+                        'end': {'line': 0, 'character': document.width(0)},
+                    },
+                    'severity': SEVERITY['error'],
+                    'source': DIAGNOSTIC_SOURCE,
+                    'message': message,
+                }]
+            self.publish(uri, diagnostics, document.version)
+    
+    def diagnostics(self, document: TextDocument) -> List[Dict]:
+        """Validate a document and convert its findings to LSP diagnostics"""
+        validator = READMEValidator(document.path, content=document.text,
+                                    rules=rule_set_for(document.path))
+        validator.validate_all()
+        
+        diagnostics = []
+        for finding in validator.findings:
+            line = finding['line'] if finding['line'] is not None else 0
+            line = min(line, len(document.lines) - 1)
+            diagnostics.append({
+                'range': {
+                    'start': {'line': line, 'character': 0},
+                    'end': {'line': line, 'character': document.width(line)},
+                },
+                'severity': SEVERITY[finding['severity']],
+                'source': DIAGNOSTIC_SOURCE,
+                'code': finding['rule'],
+                'message': finding['message'],
+            })
+        return diagnostics
+    
+    def publish(self, uri: str, diagnostics: List[Dict], version: Optional[int]):
+        """Send textDocument/publishDiagnostics"""
+        params = {'uri': uri, 'diagnostics': diagnostics}
+        if version is not None:
+            params['version'] = version
+        write_message(self.writer, {
+            'jsonrpc': '2.0', 'method': 'textDocument/publishDiagnostics', 'params': params,
+        })
+
+
+def serve():
+    """Run the language server on stdin/stdout and exit the process"""
+    code = LanguageServer(sys.stdin.buffer, sys.stdout.buffer).run()
+    sys.stdout.flush()
+    # The reader thread may still be blocked on stdin, which would stall
+    # interpreter shutdown
+    os._exit(code)
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Markdown Tokenizer
+
+Single-pass, line-oriented tokenizer for README files. Produces a compact
+list of block and inline tokens (headings, code fences, paragraphs, links,
+images and badges) that all READMEValidator checks consume. Content inside
+fenced code blocks and inline code spans never produces heading or link
+tokens.
+"""
+
+import re
+import unicodedata
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+
+# Token kinds
+HEADING = 'heading'
+FENCE = 'fence'
+PARAGRAPH = 'paragraph'
+LINK = 'link'
+IMAGE = 'image'
+BADGE = 'badge'
+
+# Lines longer than this are reported by the formatting check
+LONG_LINE = 120
+
+FENCE_OPEN_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})[ \t]*([^`\s]*)')
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+CODE_SPAN_RE = re.compile(r'(`+)(?:.+?)\1')
+INLINE_RE = re.compile(
+    r'\[!\[(?P<badge_alt>[^\]]*)\]\((?P<badge_src>[^)]*)\)\]\((?P<badge_href>[^)]*)\)'
+    r'|!\[(?P<image_alt>[^\]]*)\]\((?P<image_src>[^)]*)\)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<link_href>[^)]*)\)'
+)
+HTML_ANCHOR_RE = re.compile(r'<a\s[^>]*?\b(?:name|id)\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+INLINE_LINK_TEXT_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+
+
+class Token(NamedTuple):
+    """
+    One token of a Markdown document
+    
+    Attributes:
+        kind: Token kind (HEADING, FENCE, PARAGRAPH, LINK, IMAGE, BADGE)
+        line: 0-based line where the token starts
+        end: 0-based last line of the token (-1 for an unclosed fence)
+        text: Heading text, fence info string, paragraph text, link text
+            or image alt text
+        level: Heading level, or fence marker length
+        target: Link/image URL (image URL for badges)
+        href: Link URL wrapped around a badge image
+    """
+    kind: str
+    line: int
+    end: int
+    text: str
+    level: int = 0
+    target: str = ''
+    href: str = ''
+
+
+class Anchors(NamedTuple):
+    """Anchor index of a document, one namespace per kind of anchor"""
+    # Heading slug (repeated slugs numbered '-1', '-2', ...) -> 0-based line
+    slugs: Dict[str, int]
+    # Explicit <a name=...> / id=... anchors, as written
+    html: FrozenSet[str]
+    
+    def resolves(self, fragment: str) -> bool:
+        """
+        Check whether a link fragment (without '#') points at an anchor
+        
+        HTML anchors match case-sensitively, as in browsers; heading slugs
+        are lower-case and match any case.
+        """
+        return fragment in self.html or fragment.lower() in self.slugs
+
+
+class MarkdownDocument:
+    """Token list and line statistics of a Markdown document"""
+    
+    def __init__(self, lines: List[str], tokens: List[Token], word_count: int,
+                 long_lines: List[int], html_anchors: Optional[List[str]] = None):
+        """
+        Initialize document
+        
+        Args:
+            lines: Document lines
+            tokens: Tokens in document order
+            word_count: Number of whitespace-separated words
+            long_lines: 0-based numbers of lines longer than LONG_LINE
+                characters that are not bare URLs
+            html_anchors: Explicit anchors from <a name=...> / <a id=...> tags
+        """
+        self.lines = lines
+        self.tokens = tokens
+        self.word_count = word_count
+        self.long_lines = long_lines
+        self.html_anchors = html_anchors or []
+        self._anchors: Optional[Anchors] = None
+    
+    @property
+    def line_count(self) -> int:
+        """Number of lines"""
+        return len(self.lines)
+    
+    def of_kind(self, *kinds: str) -> List[Token]:
+        """Tokens of the given kinds, in document order"""
+        return [token for token in self.tokens if token.kind in kinds]
+    
+    @property
+    def anchors(self) -> Anchors:
+        """
+        Anchor index of the document, built on first use
+        
+        Holds every GitHub-style heading slug (duplicates numbered '-1',
+        '-2', ...) with its 0-based line, and the explicit HTML anchors.
+        """
+        if self._anchors is None:
+            slugs = [(slugify(token.text), token.line) for token in self.of_kind(HEADING)]
+            self._anchors = anchor_index(slugs, self.html_anchors)
+        return self._anchors
+
+
+def anchor_index(slugs: List[Tuple[str, int]], html_anchors: List[str]) -> Anchors:
+    """
+    Build an anchor index from heading slugs in document order
+    
+    Args:
+        slugs: (slug, 0-based line) for every heading
+        html_anchors: Explicit HTML anchor names
+    
+    Returns:
+        Anchors whose slugs map to lines, repeated slugs getting '-1',
+        '-2', ... suffixes; HTML anchors are kept apart and unchanged
+    """
+    anchors: Dict[str, int] = {}
+    counts: Dict[str, int] = {}
+    for slug, line in slugs:
+        if slug in counts:
+            counts[slug] += 1
+            unique = f"{slug}-{counts[slug]}"
+        else:
+            counts[slug] = 0
+            unique = slug
+        anchors.setdefault(unique, line)
+    return Anchors(anchors, frozenset(html_anchors))
+
+
+def slugify(text: str) -> str:
+    """
+    Build the anchor GitHub generates for a heading
+    
+    Markup is reduced to its text, the result lower-cased, characters
+    other than letters, marks, numbers, connector punctuation, spaces and
+    hyphens removed, and each space replaced by a hyphen.
+    """
+    text = INLINE_LINK_TEXT_RE.sub(r'\1', HTML_TAG_RE.sub('', text)).lower()
+    kept = []
+    for char in text:
+        category = unicodedata.category(char)
+        if char in ' -' or category[0] in 'LMN' or category == 'Pc':
+            kept.append(char)
+    return ''.join(kept).replace(' ', '-')
+
+
+def link_url(target: str) -> str:
+    """Strip an optional title from a link target: 'url "title"' -> 'url'"""
+    target = target.strip()
+    if target.startswith('<') and '>' in target:
+        return target[1:target.index('>')]
+    return target.split(None, 1)[0] if target else ''
+
+
+def _inline_tokens(line: str, number: int, tokens: List[Token]):
+    """Append link, image and badge tokens found in one line of text"""
+    if '](' not in line:
+        return
+    if '`' in line:
+        # Blank out inline code spans so their contents are not parsed
+        line = CODE_SPAN_RE.sub(lambda m: ' ' * len(m.group(0)), line)
+    
+    for match in INLINE_RE.finditer(line):
+        if match.group('badge_src') is not None:
+            tokens.append(Token(BADGE, number, number, match.group('badge_alt'),
+                                target=match.group('badge_src'), href=match.group('badge_href')))
+        elif match.group('image_src') is not None:
+            tokens.append(Token(IMAGE, number, number, match.group('image_alt'),
+                                target=match.group('image_src')))
+        else:
+            tokens.append(Token(LINK, number, number, match.group('link_text'),
+                                target=match.group('link_href')))
+
+
+def tokenize(content: str) -> MarkdownDocument:
+    """
+    Tokenize a Markdown document in one pass over its lines
+    
+    Args:
+        content: Document text
+    
+    Returns:
+        MarkdownDocument with tokens and line statistics
+    """
+    lines = content.split('\n')
+    tokens: List[Token] = []
+    word_count = 0
+    long_lines = []
+    html_anchors = []
+    
+    fence = None          # (start line, marker char, marker length, info)
+    paragraph_start = -1
+    paragraph_lines: List[str] = []
+    paragraph_index = 0   # slot reserved in tokens for the open paragraph
+    
+    def close_paragraph(end: int):
+        nonlocal paragraph_start
+        if paragraph_start >= 0:
+            tokens[paragraph_index] = Token(PARAGRAPH, paragraph_start, end, '\n'.join(paragraph_lines))
+            paragraph_lines.clear()
+            paragraph_start = -1
+    
+    for number, line in enumerate(lines):
+        word_count += len(line.split())
+        if len(line) > LONG_LINE and not line.startswith('http'):
+            long_lines.append(number)
+        
+        if fence is not None:
+            start, char, length, info = fence
+            stripped = line.strip()
+            if (len(line) - len(line.lstrip(' ')) <= 3 and stripped and
+                    set(stripped) == {char} and len(stripped) >= length):
+                tokens.append(Token(FENCE, start, number, info, length))
+                fence = None
+            continue
+        
+        if not line.strip():
+            close_paragraph(number - 1)
+            continue
+        
+        if line.lstrip(' ')[:1] in ('`', '~'):
+            match = FENCE_OPEN_RE.match(line)
+            if match:
+                close_paragraph(number - 1)
+                marker = match.group(1)
+                fence = (number, marker[0], len(marker), match.group(2))
+                continue
+        
+        if line.lstrip(' ')[:1] == '#':
+            match = HEADING_RE.match(line)
+            if match:
+                close_paragraph(number - 1)
+                text = (match.group(2) or '').strip()
+                tokens.append(Token(HEADING, number, number, text, len(match.group(1))))
+                _inline_tokens(text, number, tokens)
+                continue
+        
+        if '<a' in line or '<A' in line:
+            html_anchors.extend(HTML_ANCHOR_RE.findall(line))
+        
+        if paragraph_start < 0:
+            paragraph_start = number
+            paragraph_index = len(tokens)
+            tokens.append(None)
+        paragraph_lines.append(line)
+        _inline_tokens(line, number, tokens)
+    
+    close_paragraph(len(lines) - 1)
+    if fence is not None:
+        start, _, length, info = fence
+        tokens.append(Token(FENCE, start, -1, info, length))
+    
+    return MarkdownDocument(lines, tokens, word_count, long_lines, html_anchors)
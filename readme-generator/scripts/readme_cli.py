@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+README Generator CLI
+
+One entry point for the scripts in this directory:
+
+    readme_cli.py analyze PROJECT_DIR       (same options as analyze_project.py)
+    readme_cli.py validate README.md        (same options as validate_readme.py)
+    readme_cli.py render PROJECT_DIR        (same options as render_readme.py)
+    readme_cli.py badges PROJECT_DIR|FILE   (badges from an analysis or project info JSON)
+    readme_cli.py all PROJECT_DIR           (analyze -> badges -> render -> validate)
+    readme_cli.py server serve|analyze|...  (same options as readme_server.py)
+
+PROJECT_DIR may also be a source archive (.tar.gz, .tar.zst, .zip, .whl),
+which is analyzed without extracting it.
+
+`all` runs the whole pipeline in one process, handing the analysis and the
+rendered README from step to step in memory. Modules are imported only by
+the subcommand that needs them, so `--help` and single subcommands start
+without loading the others.
+"""
+
+import argparse
+import importlib
+import sys
+
+
+# Subcommands handled by a script's own main(): name -> (module, help)
+DELEGATED = {
+    'analyze': ('analyze_project', 'Analyze a project directory'),
+    'validate': ('validate_readme', 'Validate README files'),
+    'render': ('render_readme', 'Render a README from project analysis'),
+    'server': ('readme_server', 'Run or query the resident analysis/validation server'),
+}
+
+
+def run_delegated(command: str, argv: list):
+    """Run a script's main() with the arguments after the subcommand"""
+    module = importlib.import_module(DELEGATED[command][0])
+    sys.argv = [f"{sys.argv[0]} {command}", *argv]
+    module.main()
+
+
+def run_badges(args: argparse.Namespace) -> int:
+    """Print badges for a project directory or archive, or a project info JSON file"""
+    import json
+    from pathlib import Path
+    from generate_badges import BadgeGenerator
+    from render_readme import badge_info, badge_renderer, github_owner
+    from source_archive import is_archive
+    
+    source = Path(args.source)
+    if source.is_dir() or is_archive(source):
+        from analyze_project import ProjectAnalyzer
+        analyzer = ProjectAnalyzer(str(source))
+        info = badge_info(analyzer.analyze(), args.owner or github_owner(analyzer.root))
+    else:
+        with open(source, 'r') as f:
+            info = json.load(f)
+        if args.owner:
+            info['username'] = args.owner
+    
+    renderer = badge_renderer(args.local, args.link_prefix) if args.local else None
+    print(BadgeGenerator(info, renderer).generate_all())
+    return 0
+
+
+def run_all(args: argparse.Namespace) -> int:
+    """Analyze a project, render its README and validate the result"""
+    import json
+    from contextlib import redirect_stdout
+    from pathlib import Path
+    from analyze_project import ProjectAnalyzer
+    from render_readme import badge_renderer, github_owner, render_readme, resolve_template
+    from validate_readme import READMEValidator, rule_set_for
+    
+    analyzer = ProjectAnalyzer(args.project_dir)
+    analysis = analyzer.analyze()
+    
+    owner = args.owner or github_owner(analyzer.root)
+    template = resolve_template(args.template) if args.template else None
+    renderer = badge_renderer(args.badge_dir, args.badge_url, args.output) if args.badge_dir else None
+    readme = render_readme(analysis, owner, template, not args.no_badges, renderer)
+    
+    # Relative links and the rule config are resolved where the README goes
+    readme_path = args.output or str(analyzer.root / 'README.md')
+    checker = None
+    if args.check_links:
+        from link_checker import LinkChecker, default_cache_path
+        checker = LinkChecker(default_cache_path())
+    validator = READMEValidator(readme_path, checker, content=readme,
+                                rules=rule_set_for(readme_path, args.config))
+    is_valid, results = validator.validate_all()
+    
+    if args.output:
+        Path(args.output).write_text(readme, encoding='utf-8')
+    
+    if args.json:
+        print(json.dumps({
+            'path': args.project_dir,
+            'analysis': analysis,
+            'readme': readme,
+            'validation': results,
+        }, indent=2, ensure_ascii=False))
+    elif args.output:
+        print(f"✅ README written to {args.output}")
+        validator.print_results(results)
+    else:
+        # README on stdout, report on stderr
+        print(readme, end='')
+        with redirect_stdout(sys.stderr):
+            validator.print_results(results)
+    
+    return 0 if is_valid else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Argument parser listing every subcommand"""
+    parser = argparse.ArgumentParser(
+        description='Analyze projects, generate badges, render and validate READMEs',
+        epilog='Example: python readme_cli.py all /path/to/project -o README.md'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+    for name, (_, help_text) in DELEGATED.items():
+        subparsers.add_parser(name, help=f"{help_text} (see {name} --help)")
+    
+    badges = subparsers.add_parser('badges', help='Generate badges for a project directory or project info JSON')
+    badges.add_argument('source', help='Project root or source archive to analyze, or project info JSON file')
+    badges.add_argument('--owner', metavar='NAME',
+                        help="GitHub user or organization (default: from the 'origin' remote)")
+    badges.add_argument('--local', metavar='DIR',
+                        help='Render static badges as SVG files into DIR instead of linking to shields.io')
+    badges.add_argument('--link-prefix', metavar='PATH',
+                        help='Path or URL of DIR used in the Markdown (default: DIR)')
+    
+    pipeline = subparsers.add_parser('all', help='Analyze, generate badges, render and validate in one process')
+    pipeline.add_argument('project_dir', help='Project root directory or source archive')
+    pipeline.add_argument('-o', '--output', metavar='FILE',
+                          help='Write the README to FILE (default: print it, report on stderr)')
+    pipeline.add_argument('--owner', metavar='NAME',
+                          help="GitHub user or organization (default: from the 'origin' remote)")
+    pipeline.add_argument('--template', metavar='NAME',
+                          help='Template name or path (default: chosen from project_type)')
+    pipeline.add_argument('--no-badges', action='store_true', help="Keep the template's example badges")
+    pipeline.add_argument('--badge-dir', metavar='DIR',
+                          help='Render static badges as SVG files into DIR (shared, content-addressed)')
+    pipeline.add_argument('--badge-url', metavar='PREFIX',
+                          help='Path or URL of --badge-dir used in the README '
+                               '(default: DIR relative to the output file)')
+    pipeline.add_argument('--config', metavar='FILE',
+                          help='Rule config (default: .readme-validator.json next to the README)')
+    pipeline.add_argument('--check-links', action='store_true',
+                          help='Check that external links are reachable (network access)')
+    pipeline.add_argument('--json', action='store_true',
+                          help='Print analysis, README and validation results as one JSON object')
+    return parser
+
+
+def main():
+    """Main entry point for command-line usage"""
+    # Delegated subcommands parse their own options, so they skip the
+    # parser below entirely
+    if len(sys.argv) > 1 and sys.argv[1] in DELEGATED:
+        run_delegated(sys.argv[1], sys.argv[2:])
+        return
+    
+    args = build_parser().parse_args()
+    try:
+        if args.command == 'badges':
+            sys.exit(run_badges(args))
+        sys.exit(run_all(args))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""
+README Service
+
+Resident analysis and validation server for hosts that run many CI jobs.
+One long-running process answers analyze, badges and validate requests
+over HTTP on a Unix socket (or a local TCP port) and keeps detector
+results, file indexes, parsed manifests and per-section validation results
+in bounded in-memory LRU caches, so jobs on the same host share one warm
+process instead of starting cold ones. Requests are spread over a pool of
+worker threads. The client commands of this script only use the standard
+library's HTTP client; the analyzer and validator are loaded by the server.
+
+Protocol: POST /analyze, /badges or /validate with
+{"paths": [...], "options": {...}} returns {"results": [...]} with one
+result per path in the form of the --batch JSON lines; GET /stats returns
+cache statistics and POST /shutdown stops the server.
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from batch import expand_paths
+
+
+DEFAULT_MAX_PROJECTS = 64
+DEFAULT_MAX_MANIFESTS = 4096
+DEFAULT_MAX_SECTIONS = 65536
+DEFAULT_HOST = '127.0.0.1'
+
+COMMANDS = ('analyze', 'badges', 'validate')
+
+
+def default_socket_path() -> Path:
+    """Server socket shared by all jobs of a user (~/.cache/readme-generator/server.sock)"""
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'readme-generator' / 'server.sock'
+
+
+class LRUCache:
+    """Thread-safe bounded LRU cache with get()/put() like SectionCache"""
+    
+    def __init__(self, max_entries: int):
+        """
+        Initialize cache
+        
+        Args:
+            max_entries: Maximum number of entries kept
+        """
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[Any, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Look up an entry, marking it as recently used"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: Any, entry: Any):
+        """Store an entry, evicting the least recently used ones beyond the limit"""
+        with self._lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+    
+    def save(self):
+        """Nothing to persist (lets the cache stand in for a SectionCache)"""
+    
+    def stats(self) -> Dict[str, int]:
+        """Entry count and hit/miss counters"""
+        return {
+            'entries': len(self.entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+class ProjectState:
+    """Warm state of one project: detector results and its file index"""
+    
+    def __init__(self):
+        # MemoryAnalysisCache contents, and the file index with the
+        # fingerprints of its tree_paths() when it was built
+        self.data: Optional[Dict] = None
+        self.index = None
+        self.index_stamps: Dict[str, Any] = {}
+        # Requests for the same project run one at a time
+        self.lock = threading.Lock()
+    
+    def fresh_index(self, root: Path):
+        """The cached file index if the tree shape is unchanged, else None"""
+        from analysis_cache import fingerprint
+        if self.index is None:
+            return None
+        if any(fingerprint(root / rel) != stamp for rel, stamp in self.index_stamps.items()):
+            self.index = None
+            return None
+        if self.index.source == 'walk':
+            # Walked sizes are stat'ed lazily and may have changed
+            self.index.sizes.clear()
+        return self.index
+    
+    def remember_index(self, root: Path, index):
+        """Keep a newly built file index together with its tree fingerprints"""
+        from analysis_cache import fingerprint
+        if index is None or index is self.index:
+            return
+        self.index = index
+        self.index_stamps = {rel: fingerprint(root / rel) for rel in index.tree_paths()}
+
+
+class ReadmeService:
+    """Answers analyze, badges and validate requests from warm caches"""
+    
+    def __init__(self, workers: Optional[int] = None, max_projects: int = DEFAULT_MAX_PROJECTS,
+                 max_manifests: int = DEFAULT_MAX_MANIFESTS, max_sections: int = DEFAULT_MAX_SECTIONS,
+                 link_cache: Optional[str] = None, link_ttl: Optional[float] = None):
+        """
+        Initialize service
+        
+        Args:
+            workers: Worker threads (defaults to the CPU count)
+            max_projects: Projects whose detector results and file index are kept
+            max_manifests: Parsed manifests kept
+            max_sections: Per-section validation results kept
+            link_cache: Link check cache file (default: ~/.cache/readme-generator/links.json)
+            link_ttl: Seconds before a cached link result is re-checked
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ThreadPoolExecutor(max_workers=self.workers)
+        self.projects = LRUCache(max_projects)
+        self.manifests = LRUCache(max_manifests)
+        self.sections = LRUCache(max_sections)
+        self.link_cache = link_cache
+        self.link_ttl = link_ttl
+        self._link_checker = None
+        self._link_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+    
+    def project(self, root: Path) -> ProjectState:
+        """Warm state of a project, created on first use"""
+        with self._lock:
+            state = self.projects.get(str(root))
+            if state is None:
+                state = ProjectState()
+                self.projects.put(str(root), state)
+            return state
+    
+    def analyze(self, path: str) -> Dict:
+        """
+        Analyze a project, reusing unchanged detector results
+        
+        Args:
+            path: Project root directory
+        
+        Returns:
+            ProjectAnalyzer.analyze() result
+        """
+        from analysis_cache import MemoryAnalysisCache
+        from analyze_project import ProjectAnalyzer
+        
+        root = Path(path).resolve()
+        if not root.is_dir():
+            raise FileNotFoundError(f"Project directory not found: {path}")
+        state = self.project(root)
+        with state.lock:
+            analyzer = ProjectAnalyzer(str(root), index=state.fresh_index(root),
+                                       manifest_cache=self.manifests)
+            cache = MemoryAnalysisCache(analyzer.root, analyzer.cache_config(), state.data)
+            result = analyzer.analyze(cache)
+            state.data = cache.data
+            # Built only if some detector had to run
+            state.remember_index(root, analyzer._index)
+        return result
+    
+    def badges(self, path: str, owner: Optional[str] = None, local: Optional[str] = None,
+               link_prefix: Optional[str] = None) -> str:
+        """
+        Generate the badge block of a project
+        
+        Args:
+            path: Project root directory
+            owner: GitHub user or organization (default: from the 'origin' remote)
+            local: Render static badges as SVG files into this directory
+            link_prefix: Path or URL of the local directory used in the Markdown
+        
+        Returns:
+            Badge Markdown
+        """
+        from generate_badges import BadgeGenerator
+        from render_readme import badge_info, badge_renderer, github_owner
+        
+        analysis = self.analyze(path)
+        owner = owner or github_owner(Path(path).resolve())
+        renderer = badge_renderer(local, link_prefix) if local else None
+        return BadgeGenerator(badge_info(analysis, owner), renderer).generate_all()
+    
+    def validate(self, path: str, check_links: bool = False, config: Optional[str] = None) -> Dict:
+        """
+        Validate a README, reusing results of unchanged sections
+        
+        Args:
+            path: README file, or a directory containing README.md
+            check_links: Verify external links
+            config: Rule config file
+        
+        Returns:
+            READMEValidator.validate_all() results
+        """
+        from validate_readme import READMEValidator, rule_set_for
+        
+        if os.path.isdir(path):
+            path = os.path.join(path, 'README.md')
+        rules = rule_set_for(path, config)
+        if not check_links:
+            _, results = READMEValidator(path, section_cache=self.sections, rules=rules).validate_all()
+            return results
+        # The link checker and its cache file are shared, so link-checked
+        # validations take turns (each still checks its URLs concurrently)
+        with self._link_lock:
+            validator = READMEValidator(path, self.link_checker(), self.sections, rules=rules)
+            _, results = validator.validate_all()
+        return results
+    
+    def link_checker(self):
+        """Link checker shared by all requests, created on first use"""
+        if self._link_checker is None:
+            from link_checker import DEFAULT_TTL, LinkChecker, default_cache_path
+            self._link_checker = LinkChecker(self.link_cache or default_cache_path(),
+                                             ttl=self.link_ttl or DEFAULT_TTL)
+        return self._link_checker
+    
+    def handle(self, command: str, path: str, options: Dict) -> Dict:
+        """
+        Run one command on one path, isolating any failure
+        
+        Returns:
+            {'path', 'ok', ...} as in the --batch JSON lines of each script,
+            or {'path', 'ok': False, 'error'} on failure
+        """
+        try:
+            if command == 'analyze':
+                return {'path': path, 'ok': True, 'result': self.analyze(path)}
+            if command == 'badges':
+                badges = self.badges(path, options.get('owner'), options.get('local'),
+                                     options.get('link_prefix'))
+                return {'path': path, 'ok': True, 'badges': badges}
+            results = self.validate(path, bool(options.get('check_links')), options.get('config'))
+            return {'path': path, 'ok': True, **results}
+        except Exception as e:
+            return {'path': path, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+    
+    def run(self, command: str, paths: List[str], options: Dict) -> List[Dict]:
+        """Run a command over paths on the worker pool, keeping their order"""
+        with self._lock:
+            self.requests += 1
+        return list(self.pool.map(lambda path: self.handle(command, path, options), paths))
+    
+    def stats(self) -> Dict:
+        """Server and cache statistics"""
+        return {
+            'pid': os.getpid(),
+            'uptime': round(time.time() - self.started, 3),
+            'workers': self.workers,
+            'requests': self.requests,
+            'caches': {
+                'projects': self.projects.stats(),
+                'manifests': self.manifests.stats(),
+                'sections': self.sections.stats(),
+            },
+        }
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """HTTP front end of the ReadmeService attached to the server"""
+    
+    protocol_version = 'HTTP/1.1'
+    
+    def send_json(self, status: int, payload: Dict):
+        """Send a JSON response"""
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_GET(self):
+        """GET /stats"""
+        if self.path.rstrip('/') == '/stats':
+            self.send_json(200, self.server.service.stats())
+        else:
+            self.send_json(404, {'error': f"unknown endpoint: {self.path}"})
+    
+    def do_POST(self):
+        """POST /analyze, /badges, /validate or /shutdown"""
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self.send_json(400, {'error': f"invalid JSON: {e}"})
+            return
+        
+        command = self.path.strip('/')
+        if command == 'shutdown':
+            self.send_json(200, {'ok': True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+            return
+        if command not in COMMANDS:
+            self.send_json(404, {'error': f"unknown endpoint: {self.path}"})
+            return
+        paths = request.get('paths')
+        if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+            self.send_json(400, {'error': "'paths' must be a list of strings"})
+            return
+        results = self.server.service.run(command, paths, request.get('options') or {})
+        self.send_json(200, {'results': results})
+    
+    def log_message(self, format: str, *args):
+        """Log requests only in verbose mode"""
+        if self.server.verbose:
+            sys.stderr.write(f"{self.log_date_time_string()} {format % args}\n")
+
+
+class TCPServiceServer(ThreadingHTTPServer):
+    """ServiceHandler served on a TCP port"""
+    
+    daemon_threads = True
+
+
+class UnixServiceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ServiceHandler served on a Unix socket"""
+    
+    daemon_threads = True
+
+
+def serve(service: ReadmeService, socket_path: Optional[Path] = None, port: Optional[int] = None,
+          host: str = DEFAULT_HOST, verbose: bool = False):
+    """
+    Serve requests until shut down (POST /shutdown, SIGTERM or Ctrl-C)
+    
+    Args:
+        service: Service answering the requests
+        socket_path: Unix socket to listen on (ignored when port is given)
+        port: TCP port to listen on instead of the socket
+        host: TCP address to bind
+        verbose: Log each request on stderr
+    """
+    import signal
+    
+    if port is not None:
+        server = TCPServiceServer((host, port), ServiceHandler)
+        address = f"http://{host}:{server.server_address[1]}"
+    else:
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            if is_running(socket_path):
+                raise OSError(f"a server is already listening on {socket_path}")
+            # Left behind by a server that did not shut down cleanly
+            socket_path.unlink()
+        server = UnixServiceServer(str(socket_path), ServiceHandler)
+        address = str(socket_path)
+    server.service = service
+    server.verbose = verbose
+    
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown, daemon=True).start())
+    print(f"Serving on {address} with {service.workers} worker(s)", file=sys.stderr, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.pool.shutdown()
+        if port is None:
+            try:
+                socket_path.unlink()
+            except OSError:
+                pass
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """HTTPConnection over a Unix socket"""
+    
+    def __init__(self, socket_path: str, timeout: Optional[float] = None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+    
+    def connect(self):
+        """Connect to the socket instead of a host and port"""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class ServiceError(Exception):
+    """Error response from the server"""
+
+
+def request(method: str, endpoint: str, payload: Optional[Dict] = None,
+            socket_path: Optional[Path] = None, port: Optional[int] = None,
+            host: str = DEFAULT_HOST, timeout: Optional[float] = None) -> Dict:
+    """
+    Send one request to a running server
+    
+    Args:
+        method: 'GET' or 'POST'
+        endpoint: 'analyze', 'badges', 'validate', 'stats' or 'shutdown'
+        payload: JSON request body
+        socket_path: Unix socket of the server (ignored when port is given)
+        port: TCP port of the server instead of the socket
+        host: TCP address of the server
+        timeout: Socket timeout in seconds (None waits indefinitely)
+    
+    Returns:
+        Decoded JSON response
+    
+    Raises:
+        OSError: The server is not reachable
+        ServiceError: The server rejected the request
+    """
+    if port is not None:
+        connection = HTTPConnection(host, port, timeout=timeout)
+    else:
+        connection = UnixHTTPConnection(str(socket_path or default_socket_path()), timeout)
+    try:
+        body = json.dumps(payload).encode('utf-8') if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        connection.request(method, f"/{endpoint}", body, headers)
+        response = connection.getresponse()
+        data = json.loads(response.read().decode('utf-8'))
+    finally:
+        connection.close()
+    if response.status != 200:
+        raise ServiceError(data.get('error', f"HTTP {response.status}"))
+    return data
+
+
+def is_running(socket_path: Path) -> bool:
+    """Check whether a server answers on a Unix socket"""
+    try:
+        request('GET', 'stats', socket_path=socket_path, timeout=2)
+    except (OSError, ValueError, ServiceError):
+        return False
+    return True
+
+
+def main():
+    """Main entry point for command-line usage"""
+    connection = argparse.ArgumentParser(add_help=False)
+    connection.add_argument('--socket', metavar='PATH',
+                            help='Unix socket (default: ~/.cache/readme-generator/server.sock)')
+    connection.add_argument('--port', type=int, help='Use a TCP port on --host instead of the socket')
+    connection.add_argument('--host', default=DEFAULT_HOST, help=f"TCP address (default: {DEFAULT_HOST})")
+    
+    parser = argparse.ArgumentParser(
+        description='Resident analysis/validation server and its client',
+        epilog='Example: python readme_server.py serve & python readme_server.py validate README.md'
+    )
+    subparsers = parser.add_subparsers(dest='command', metavar='COMMAND')
+    subparsers.required = True
+    
+    server = subparsers.add_parser('serve', parents=[connection], help='Run the server')
+    server.add_argument('-j', '--workers', type=int, help='Worker threads (default: CPU count)')
+    server.add_argument('--max-projects', type=int, default=DEFAULT_MAX_PROJECTS, metavar='N',
+                        help=f"Projects kept warm (default: {DEFAULT_MAX_PROJECTS})")
+    server.add_argument('--max-manifests', type=int, default=DEFAULT_MAX_MANIFESTS, metavar='N',
+                        help=f"Parsed manifests kept (default: {DEFAULT_MAX_MANIFESTS})")
+    server.add_argument('--max-sections', type=int, default=DEFAULT_MAX_SECTIONS, metavar='N',
+                        help=f"README section results kept (default: {DEFAULT_MAX_SECTIONS})")
+    server.add_argument('--link-cache', metavar='FILE',
+                        help='Link check cache file (default: ~/.cache/readme-generator/links.json)')
+    server.add_argument('--link-ttl', type=float, metavar='SECONDS',
+                        help='Seconds before a cached link result is re-checked (default: 86400)')
+    server.add_argument('--verbose', action='store_true', help='Log requests on stderr')
+    
+    analyze = subparsers.add_parser('analyze', parents=[connection],
+                                    help='Analyze projects on the server (one JSON line each)')
+    badges = subparsers.add_parser('badges', parents=[connection],
+                                   help='Generate badges on the server (one JSON line each)')
+    badges.add_argument('--owner', metavar='NAME',
+                        help="GitHub user or organization (default: from the 'origin' remote)")
+    badges.add_argument('--local', metavar='DIR',
+                        help='Render static badges as SVG files into DIR instead of linking to shields.io')
+    badges.add_argument('--link-prefix', metavar='PATH',
+                        help='Path or URL of DIR used in the Markdown (default: DIR)')
+    validate = subparsers.add_parser('validate', parents=[connection],
+                                     help='Validate READMEs on the server (one JSON line each)')
+    validate.add_argument('--check-links', action='store_true',
+                          help='Check that external links are reachable (network access)')
+    validate.add_argument('--config', metavar='FILE',
+                          help='Rule config (default: .readme-validator.json next to the README)')
+    for client in (analyze, badges, validate):
+        client.add_argument('paths', nargs='*', help='Paths or glob patterns')
+        client.add_argument('--from-file', metavar='FILE',
+                            help="Read paths from FILE, one per line ('-' for stdin)")
+    subparsers.add_parser('stats', parents=[connection], help='Print server and cache statistics')
+    subparsers.add_parser('stop', parents=[connection], help='Shut the server down')
+    args = parser.parse_args()
+    
+    socket_path = Path(args.socket) if args.socket else default_socket_path()
+    
+    if args.command == 'serve':
+        service = ReadmeService(args.workers, args.max_projects, args.max_manifests, args.max_sections,
+                                args.link_cache, args.link_ttl)
+        try:
+            serve(service, socket_path, args.port, args.host, args.verbose)
+        except OSError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
+    
+    def send(method: str, endpoint: str, payload: Optional[Dict] = None) -> Dict:
+        return request(method, endpoint, payload, socket_path, args.port, args.host)
+    
+    try:
+        if args.command == 'stats':
+            print(json.dumps(send('GET', 'stats'), indent=2))
+            return
+        if args.command == 'stop':
+            send('POST', 'shutdown', {})
+            return
+        
+        match = os.path.isfile if args.command == 'validate' else os.path.isdir
+        paths = [os.path.abspath(path) for path in expand_paths(args.paths, args.from_file, match=match)]
+        if not paths:
+            parser.error('no paths given')
+        options = {}
+        if args.command == 'badges':
+            options = {'owner': args.owner, 'local': args.local and os.path.abspath(args.local),
+                       'link_prefix': args.link_prefix}
+        elif args.command == 'validate':
+            options = {'check_links': args.check_links,
+                       'config': args.config and os.path.abspath(args.config)}
+        results = send('POST', args.command, {'paths': paths, 'options': options})['results']
+    except ServiceError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except OSError as e:
+        where = f"{args.host}:{args.port}" if args.port is not None else socket_path
+        print(f"Error: no server at {where} ({e}); start one with 'readme_server.py serve'",
+              file=sys.stderr)
+        sys.exit(1)
+    
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+    sys.exit(1 if any(not result['ok'] for result in results) else 0)
+
+
+if __name__ == '__main__':
+    main()
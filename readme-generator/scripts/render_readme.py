@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+README Renderer
+
+Fills the templates in assets/templates/ (and the snippets in
+assets/snippets/) from ProjectAnalyzer output. Each file is compiled once
+into literal text and field slots (bracketed placeholders such as
+`[ライブラリ名]`, the name/owner tokens used in example URLs and commands,
+the badge block and the tagline under the title), so rendering a README is
+a single join. Fields the analysis does not provide keep the template text.
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from generate_badges import BadgeGenerator
+from git_index import find_git_dir
+from svg_badges import SVGBadgeRenderer
+
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / 'assets'
+TEMPLATE_DIR = ASSETS_DIR / 'templates'
+SNIPPET_DIR = ASSETS_DIR / 'snippets'
+
+# project_type -> template file; other types use DEFAULT_TEMPLATE
+TEMPLATES = {
+    'library': 'library.md',
+    'webapp': 'webapp.md',
+    'cli-tool': 'cli-tool.md',
+}
+DEFAULT_TEMPLATE = 'basic.md'
+
+# Bracketed placeholder text -> field
+PLACEHOLDERS = {
+    'プロジェクト名': 'project_name',
+    'ライブラリ名': 'project_name',
+    'アプリ名': 'project_name',
+    'CLIツール名': 'project_name',
+}
+
+# Package managers whose packages are published under another registry name
+BADGE_REGISTRIES = {
+    'pip': 'pypi', 'pipenv': 'pypi', 'poetry': 'pypi',
+    'yarn': 'npm', 'pnpm': 'npm',
+    'bundler': 'gem',
+}
+
+# Tokens the templates use for the package name, its importable form, the
+# repository owner and the license name
+TOKEN_RE = re.compile(
+    '|'.join([
+        r'\[(?P<placeholder>' + '|'.join(map(re.escape, PLACEHOLDERS)) + r')\]',
+        r'(?<![\w\-\[])(?P<slug>library-name|project-name|package-name|app-name|tool-name|cli-tool)(?!\w)',
+        r'(?<![\w-])(?P<module>library_name|project_name|package_name)(?!\w)',
+        r'(?<![\w-])(?P<owner>username)(?!\w)',
+        r'(?<=username/)(?P<repo>repo)(?![\w-])',
+        r'(?P<license>MIT)(?= ライセンス)',
+    ])
+)
+
+# Lines of the badge block under the title
+BADGE_LINE_RE = re.compile(r'^\[!\[|^!\[')
+
+GITHUB_REMOTE_RE = re.compile(
+    r'^\s*url\s*=\s*(?:https?://(?:[^@/\s]+@)?github\.com/|git@github\.com:|ssh://git@github\.com/)'
+    r'([^/\s]+)/', re.MULTILINE
+)
+
+
+class Slot(NamedTuple):
+    """
+    A replaceable span of a template
+    
+    Attributes:
+        field: Field providing the value
+        default: Template text kept when the field is empty
+        prefix: Text put before the value
+    """
+    field: str
+    default: str
+    prefix: str = ''
+
+
+class Template:
+    """Template compiled into alternating literal text and slots"""
+    
+    def __init__(self, text: str):
+        """
+        Compile template text
+        
+        Args:
+            text: Template Markdown
+        """
+        self.literals: List[str] = []
+        self.slots: List[Slot] = []
+        position = 0
+        for start, end, slot in _find_slots(text):
+            self.literals.append(text[position:start])
+            self.slots.append(slot)
+            position = end
+        self.literals.append(text[position:])
+        self.fields = frozenset(slot.field for slot in self.slots)
+    
+    def render(self, fields: Dict[str, str]) -> str:
+        """
+        Fill the slots
+        
+        Args:
+            fields: Field values; missing or empty fields keep the template text
+        
+        Returns:
+            Rendered Markdown
+        """
+        literals = self.literals
+        parts = [literals[0]]
+        for i, slot in enumerate(self.slots, 1):
+            value = fields.get(slot.field)
+            parts.append(slot.prefix + value if value else slot.default)
+            parts.append(literals[i])
+        return ''.join(parts)
+
+
+def _find_slots(text: str) -> List[Tuple[int, int, Slot]]:
+    """
+    Locate the slots of a template
+    
+    The badge lines and the first blockquote right below the H1 title
+    become the 'badges' and 'description' slots; bracketed placeholders
+    and name/owner/license tokens elsewhere become slots of their fields.
+    
+    Returns:
+        Non-overlapping (start offset, end offset, slot) in text order
+    """
+    slots = []
+    lines = text.split('\n')
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line) + 1)
+    
+    title = next((i for i, line in enumerate(lines) if line.startswith('# ')), None)
+    if title is not None:
+        i = title + 1
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        first = i
+        while i < len(lines) and BADGE_LINE_RE.match(lines[i]):
+            i += 1
+        if i > first:
+            start, end = offsets[first], offsets[i] - 1
+            slots.append((start, end, Slot('badges', text[start:end])))
+        while i < len(lines) and not lines[i].strip():
+            i += 1
+        if i < len(lines) and lines[i].startswith('> '):
+            start, end = offsets[i], offsets[i + 1] - 1
+            slots.append((start, end, Slot('description', text[start:end], '> ')))
+    
+    structural = list(slots)
+    for match in TOKEN_RE.finditer(text):
+        start, end = match.span()
+        if any(s <= start < e for s, e, _ in structural):
+            continue
+        kind = match.lastgroup
+        field = PLACEHOLDERS[match.group(kind)] if kind == 'placeholder' else kind
+        slots.append((start, end, Slot(field, match.group(0))))
+    
+    slots.sort(key=lambda slot: slot[0])
+    return slots
+
+
+@functools.lru_cache(maxsize=64)
+def _compiled(path: str, mtime_ns: int, size: int) -> Template:
+    """Compile a template file (cached on path and stat data)"""
+    return Template(Path(path).read_text(encoding='utf-8'))
+
+
+def load_template(path: Path) -> Template:
+    """Compiled template of a file, recompiled only when the file changes"""
+    st = path.stat()
+    return _compiled(str(path), st.st_mtime_ns, st.st_size)
+
+
+def template_for(project_type: Optional[str]) -> Path:
+    """Template file for a project type"""
+    return TEMPLATE_DIR / TEMPLATES.get(project_type or '', DEFAULT_TEMPLATE)
+
+
+def resolve_template(name: str, directory: Path = TEMPLATE_DIR) -> Path:
+    """
+    Resolve a template or snippet given by name ('library') or path
+    
+    Raises:
+        FileNotFoundError: If there is no such template
+    """
+    path = Path(name)
+    if not path.is_file():
+        path = directory / (name if name.endswith('.md') else f"{name}.md")
+    if not path.is_file():
+        available = ', '.join(sorted(p.stem for p in directory.glob('*.md')))
+        raise FileNotFoundError(f"template not found: {name} (available: {available})")
+    return path
+
+
+def github_owner(project_dir: Path) -> Optional[str]:
+    """GitHub owner of the repository's origin remote, if it is on GitHub"""
+    found = find_git_dir(project_dir)
+    if found is None:
+        return None
+    try:
+        config = (found[1] / 'config').read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return None
+    section = config.split('[remote "origin"]', 1)
+    if len(section) < 2:
+        return None
+    match = GITHUB_REMOTE_RE.search(section[1].split('\n[', 1)[0])
+    return match.group(1) if match else None
+
+
+def template_fields(analysis: Dict, owner: Optional[str] = None, badges: bool = True,
+                    renderer: Optional[SVGBadgeRenderer] = None) -> Dict[str, str]:
+    """
+    Build template field values from an analysis
+    
+    Args:
+        analysis: ProjectAnalyzer.analyze() result
+        owner: GitHub user or organization owning the repository
+        badges: Generate the badge block with BadgeGenerator
+        renderer: Render static badges to local SVG files
+    
+    Returns:
+        Field values ('project_name', 'slug', 'module', 'owner', 'repo',
+        'description', 'license', 'badges'); unknown fields are empty
+    """
+    name = analysis.get('project_name') or ''
+    fields = {
+        'project_name': name,
+        'slug': name,
+        'module': name.replace('-', '_').replace('.', '_'),
+        'owner': owner or '',
+        'repo': name if owner else '',
+        'description': analysis.get('description') or '',
+        'license': analysis.get('license') or '',
+        'badges': '',
+    }
+    if badges and name:
+        fields['badges'] = BadgeGenerator(badge_info(analysis, owner), renderer).generate_all()
+    return fields
+
+
+def badge_info(analysis: Dict, owner: Optional[str] = None) -> Dict:
+    """BadgeGenerator project info for an analysis"""
+    info = dict(analysis)
+    info['username'] = owner
+    manager = analysis.get('package_manager')
+    info['package_manager'] = BADGE_REGISTRIES.get(manager, manager)
+    return info
+
+
+def badge_renderer(badge_dir: str, badge_url: Optional[str] = None,
+                   output: Optional[str] = None) -> SVGBadgeRenderer:
+    """
+    Local badge renderer for a README
+    
+    Args:
+        badge_dir: Directory the SVG files are written to
+        badge_url: Path or URL of badge_dir as written in the README
+        output: README file; without badge_url, links are made relative to it
+    
+    Returns:
+        SVGBadgeRenderer
+    """
+    link_prefix = badge_url
+    if link_prefix is None and output:
+        link_prefix = Path(os.path.relpath(badge_dir, Path(output).resolve().parent)).as_posix()
+    return SVGBadgeRenderer(Path(badge_dir), link_prefix)
+
+
+def render_readme(analysis: Dict, owner: Optional[str] = None, template: Optional[Path] = None,
+                  badges: bool = True, renderer: Optional[SVGBadgeRenderer] = None) -> str:
+    """
+    Render a README from an analysis
+    
+    Args:
+        analysis: ProjectAnalyzer.analyze() result
+        owner: GitHub user or organization owning the repository
+        template: Template file (defaults to the one for project_type)
+        badges: Replace the template's badge block with generated badges
+        renderer: Render static badges to local SVG files
+    
+    Returns:
+        README Markdown
+    """
+    path = template if template is not None else template_for(analysis.get('project_type'))
+    return load_template(path).render(template_fields(analysis, owner, badges, renderer))
+
+
+def _is_batch_record(record: Dict) -> bool:
+    """Check whether a JSON object is an analyze_project.py --batch line"""
+    return 'result' in record or 'ok' in record
+
+
+def read_analyses(source: str) -> Tuple[List[Tuple[Optional[str], Dict]], bool]:
+    """
+    Read analyses from a JSON file or analyze_project.py --batch JSONL
+    
+    Args:
+        source: File path, or '-' for stdin
+    
+    Returns:
+        Tuple of ((project path or None, analysis) list, whether the input
+        is JSONL); failed batch lines are skipped
+    """
+    source_file = contextlib.nullcontext(sys.stdin) if source == '-' else open(source, encoding='utf-8')
+    with source_file as stream:
+        text = stream.read()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    # A one-project batch run is a single line that also parses as a whole
+    if isinstance(data, dict) and not _is_batch_record(data):
+        return [(None, data)], False
+    
+    analyses = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if _is_batch_record(record):
+            if record.get('ok'):
+                analyses.append((record.get('path'), record['result']))
+        else:
+            analyses.append((None, record))
+    return analyses, True
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='Render a README from project analysis',
+        epilog='Example: python render_readme.py /path/to/project -o README.md'
+    )
+    parser.add_argument('project_dir', nargs='?', help='Project root to analyze')
+    parser.add_argument('--analysis', metavar='FILE',
+                        help="Analysis JSON, or analyze_project.py --batch JSONL ('-' for stdin); "
+                             "JSONL input renders one JSON line per project")
+    parser.add_argument('--template', metavar='NAME',
+                        help='Template name or path (default: chosen from project_type)')
+    parser.add_argument('--snippet', metavar='NAME',
+                        help='Render a snippet from assets/snippets/ instead of a template')
+    parser.add_argument('--owner', metavar='NAME',
+                        help="GitHub user or organization (default: from the 'origin' remote)")
+    parser.add_argument('--no-badges', action='store_true', help="Keep the template's example badges")
+    parser.add_argument('--badge-dir', metavar='DIR',
+                        help='Render static badges as SVG files into DIR (shared, content-addressed)')
+    parser.add_argument('--badge-url', metavar='PREFIX',
+                        help='Path or URL of --badge-dir used in the README '
+                             '(default: DIR relative to the output file)')
+    parser.add_argument('-o', '--output', metavar='FILE', help='Write the README to FILE instead of stdout')
+    args = parser.parse_args()
+    
+    if bool(args.project_dir) == bool(args.analysis):
+        parser.error('give either a project directory or --analysis')
+    
+    try:
+        template = None
+        if args.snippet:
+            template = resolve_template(args.snippet, SNIPPET_DIR)
+        elif args.template:
+            template = resolve_template(args.template)
+        
+        if args.project_dir:
+            from analyze_project import ProjectAnalyzer
+            analyzer = ProjectAnalyzer(args.project_dir)
+            analyses, jsonl = [(args.project_dir, analyzer.analyze())], False
+        else:
+            analyses, jsonl = read_analyses(args.analysis)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    renderer = None
+    if args.badge_dir:
+        output = None if jsonl else args.output
+        renderer = badge_renderer(args.badge_dir, args.badge_url, output)
+    
+    def owner_of(path: Optional[str]) -> Optional[str]:
+        if args.owner:
+            return args.owner
+        return github_owner(Path(path).resolve()) if path and Path(path).is_dir() else None
+    
+    if jsonl:
+        # Fleet mode: one JSON line per project
+        target = open(args.output, 'w', encoding='utf-8') if args.output else contextlib.nullcontext(sys.stdout)
+        with target as out:
+            for path, analysis in analyses:
+                chosen = template or template_for(analysis.get('project_type'))
+                readme = render_readme(analysis, owner_of(path), chosen, not args.no_badges, renderer)
+                out.write(json.dumps({'path': path, 'template': chosen.stem, 'readme': readme},
+                                     ensure_ascii=False) + '\n')
+        return
+    
+    if not analyses:
+        print("Error: no analysis found", file=sys.stderr)
+        sys.exit(1)
+    path, analysis = analyses[0]
+    readme = render_readme(analysis, owner_of(path), template, not args.no_badges, renderer)
+    if args.output:
+        Path(args.output).write_text(readme, encoding='utf-8')
+        print(f"✅ README written to {args.output}")
+    else:
+        print(readme, end='')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+"""
+Validation Rules
+
+Registry of the rules READMEValidator runs. Each rule has a stable ID, a
+default severity and the token kinds it subscribes to. Rules work in two
+steps:
+
+- collect(tokens, section): called once per section with only the
+  subscribed tokens; returns JSON-serializable facts (line numbers
+  relative to the section) that are cached with the section
+- check(validator, facts): called once per document with the facts of
+  every section as (section start line, facts); reports results through
+  validator.report()
+
+A rule may also implement fix(lines, findings) to repair its findings in
+place. In-house rules are added by importing a module that calls
+register_rule() or defines a RULES list (see load_rules_module()).
+"""
+
+import functools
+import importlib
+import importlib.util
+import json
+import re
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import unquote
+
+from git_index import find_git_dir
+from link_checker import is_checkable, is_dead, is_failed
+from markdown_tokens import (
+    BADGE, FENCE, HEADING, IMAGE, LINK, PARAGRAPH, Anchors, MarkdownDocument, Token, link_url, tokenize,
+)
+
+
+SEVERITIES = ('error', 'warning', 'suggestion')
+CONFIG_FILE = '.readme-validator.json'
+
+# Link targets with a scheme (https:, mailto:, ...) are not local files
+URL_SCHEME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+
+# Section name -> heading pattern (matched against H2 and below)
+REQUIRED_SECTIONS = {
+    'installation': r'(Installation|Getting Started|Setup)',
+    'usage': r'(Usage|Quick Start|Examples)',
+    'license': r'License',
+}
+RECOMMENDED_SECTIONS = {
+    'contributing': r'(Contributing|Contribution)',
+    'features': r'Features',
+}
+
+LINK_KINDS = (LINK, IMAGE, BADGE)
+
+
+class Rule:
+    """Base class of validation rules"""
+    
+    # Stable identifier used in config files, findings and timings
+    id = ''
+    # Default severity: 'error' (issue), 'warning' or 'suggestion'
+    severity = 'error'
+    # Token kinds passed to collect(); rules without kinds skip collect()
+    kinds: Tuple[str, ...] = ()
+    # Bump when collect() output changes, to invalidate cached sections
+    version = 1
+    # Whether the rule implements fix()
+    fixable = False
+    
+    def collect(self, tokens: List[Token], section: MarkdownDocument) -> Any:
+        """
+        Extract facts from one section
+        
+        Args:
+            tokens: Tokens of the subscribed kinds, in document order
+            section: Tokenized section (lines and statistics)
+        
+        Returns:
+            JSON-serializable facts with section-relative line numbers
+        """
+        return None
+    
+    def check(self, validator, facts: List[Tuple[int, Any]]):
+        """
+        Report findings for the whole document
+        
+        Args:
+            validator: READMEValidator; provides document-level data
+                (headings, line and word counts, anchors, path) and report()
+            facts: (section start line, collect() result) for every section
+                where collect() returned something other than None or []
+        """
+        raise NotImplementedError
+    
+    def fix(self, lines: List[str], findings: List[Dict]) -> int:
+        """
+        Repair findings of this rule in place
+        
+        Args:
+            lines: Document lines (modified in place; line count must only
+                change at the end of the document)
+            findings: Findings reported by this rule
+        
+        Returns:
+            Number of findings fixed
+        """
+        return 0
+
+
+# Registered rules in execution order, keyed by ID
+RULES: Dict[str, Rule] = {}
+
+
+def register_rule(rule: Rule) -> Rule:
+    """
+    Add a rule to the registry
+    
+    Args:
+        rule: Rule instance with a unique ID
+    
+    Returns:
+        The rule, so that this can be used on module-level instances
+    
+    Raises:
+        ValueError: If the ID is empty, taken or the severity is unknown
+    """
+    if not rule.id:
+        raise ValueError(f"rule {type(rule).__name__} has no id")
+    if rule.id in RULES and RULES[rule.id] is not rule:
+        raise ValueError(f"duplicate rule id: {rule.id}")
+    if rule.severity not in SEVERITIES:
+        raise ValueError(f"rule {rule.id}: unknown severity {rule.severity!r}")
+    RULES[rule.id] = rule
+    return rule
+
+
+@functools.lru_cache(maxsize=None)
+def load_rules_module(spec: str):
+    """
+    Import a module of in-house rules
+    
+    The module registers rules with register_rule() when imported, or
+    defines a RULES list of Rule instances. Each module is loaded once.
+    
+    Args:
+        spec: Path of a .py file, or a dotted module name on sys.path
+    
+    Returns:
+        The imported module
+    """
+    if spec.endswith('.py'):
+        path = Path(spec).resolve()
+        module_spec = importlib.util.spec_from_file_location(f"readme_rules_{path.stem}", path)
+        if module_spec is None or module_spec.loader is None:
+            raise ImportError(f"cannot load rules from {spec}")
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(spec)
+    
+    for rule in getattr(module, 'RULES', []):
+        register_rule(rule)
+    return module
+
+
+class RuleSet:
+    """Enabled rules with their effective severities"""
+    
+    def __init__(self, rules: List[Rule], severities: Optional[Dict[str, str]] = None):
+        """
+        Initialize rule set
+        
+        Args:
+            rules: Rules in execution order
+            severities: Severity overrides by rule ID
+        """
+        self.rules = rules
+        self.severities = {rule.id: rule.severity for rule in rules}
+        self.severities.update(severities or {})
+        collecting = ','.join(f"{rule.id}@{rule.version}" for rule in rules if rule.kinds)
+        # Part of the section cache key: cached facts depend on these rules
+        self.key = blake2b(collecting.encode('utf-8'), digest_size=8).hexdigest()
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None) -> 'RuleSet':
+        """
+        Select registered rules according to a config
+        
+        Args:
+            config: {'rules': {rule_id: setting}} where setting is true/false,
+                'off', a severity, or {'enabled': bool, 'severity': str}.
+                Unconfigured rules run with their default severity.
+        
+        Returns:
+            RuleSet
+        
+        Raises:
+            ValueError: If the config names an unknown rule or severity
+        """
+        settings = (config or {}).get('rules', {})
+        unknown = [rule_id for rule_id in settings if rule_id not in RULES]
+        if unknown:
+            raise ValueError(f"unknown rule(s) in config: {', '.join(unknown)}")
+        
+        rules = []
+        severities = {}
+        for rule_id, rule in RULES.items():
+            setting = settings.get(rule_id, True)
+            if isinstance(setting, dict):
+                enabled = setting.get('enabled', True)
+                severity = setting.get('severity')
+            elif isinstance(setting, str):
+                enabled = setting != 'off'
+                severity = setting if enabled else None
+            else:
+                enabled = bool(setting)
+                severity = None
+            
+            if not enabled:
+                continue
+            if severity is not None:
+                if severity not in SEVERITIES:
+                    raise ValueError(f"rule {rule_id}: unknown severity {severity!r}")
+                severities[rule_id] = severity
+            rules.append(rule)
+        return cls(rules, severities)
+
+
+def load_config(readme_path: Path, config_path: Optional[str] = None) -> Dict:
+    """
+    Load rule configuration
+    
+    Args:
+        readme_path: README being validated
+        config_path: Explicit config file; defaults to .readme-validator.json
+            next to the README, if present
+    
+    Returns:
+        Config dict (empty if there is none)
+    """
+    path = Path(config_path) if config_path else readme_path.resolve().parent / CONFIG_FILE
+    if not config_path and not path.is_file():
+        return {}
+    return json.loads(path.read_text(encoding='utf-8'))
+
+
+def _targets(token: Token) -> List[str]:
+    """Link URLs of a link, image or badge token (badges have two)"""
+    targets = [token.target, token.href] if token.kind == BADGE else [token.target]
+    return [link_url(target) for target in targets]
+
+
+def _first_title(validator) -> Optional[Tuple[int, str]]:
+    """(line, text) of the first H1 in the first 10 lines"""
+    for line, level, text, _ in validator.headings:
+        if line >= 10:
+            break
+        if level == 1 and text:
+            return line, text
+    return None
+
+
+def linked_anchors(path: Path) -> Anchors:
+    """Anchors of another Markdown file, tokenized once per file version"""
+    st = path.stat()
+    return _anchors_of(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _anchors_of(path: str, mtime_ns: int, size: int) -> Anchors:
+    """Tokenize a file and return its anchor index (cached on path and stat data)"""
+    content = Path(path).read_text(encoding='utf-8', errors='replace')
+    return tokenize(content).anchors
+
+
+class TitleRule(Rule):
+    """The README starts with a usable H1 title"""
+    id = 'title'
+    severity = 'error'
+    
+    def check(self, validator, facts):
+        title = _first_title(validator)
+        if title is None:
+            validator.report("Missing H1 title (# Project Name)")
+        elif len(title[1]) < 2:
+            validator.report("Title is too short", [(title[0], '')])
+
+
+class TitleLengthRule(Rule):
+    """The title fits on one line"""
+    id = 'title-length'
+    severity = 'warning'
+    
+    def check(self, validator, facts):
+        title = _first_title(validator)
+        if title is not None and len(title[1]) > 80:
+            validator.report("Title is very long (>80 characters)", [(title[0], '')])
+
+
+class DescriptionRule(Rule):
+    """A descriptive sentence appears within the first 20 lines"""
+    id = 'description'
+    severity = 'error'
+    kinds = (PARAGRAPH,)
+    
+    def collect(self, tokens, section):
+        # First line that reads like a description sentence (within 20 lines)
+        for token in tokens:
+            if token.line >= 20:
+                break
+            for offset, line in enumerate(token.text.split('\n')[:20 - token.line]):
+                # Skip short lines and badges
+                if (not line.startswith('[![') and
+                        not line.startswith('![') and
+                        len(line.strip()) > 20):
+                    return token.line + offset
+        return None
+    
+    def check(self, validator, facts):
+        if not any(line is not None and start + line < 20 for start, line in facts if start < 20):
+            validator.report("Missing project description (add 1-2 sentences after title)")
+
+
+class SectionPresenceRule(Rule):
+    """Sections with the given names exist (as H2 or below)"""
+    kinds = (HEADING,)
+    
+    def __init__(self, rule_id: str, severity: str, sections: Dict[str, str], message: str):
+        """
+        Initialize rule
+        
+        Args:
+            rule_id: Rule ID
+            severity: Default severity
+            sections: Section name -> heading pattern
+            message: Message prefix, followed by the section name
+        """
+        self.id = rule_id
+        self.severity = severity
+        self.sections = sections
+        self.message = message
+    
+    def collect(self, tokens, section):
+        # Section headings are H2 or below
+        headings = [token.text for token in tokens if token.level >= 2]
+        return [
+            name for name, pattern in self.sections.items()
+            if any(re.match(pattern, text, re.IGNORECASE) for text in headings)
+        ]
+    
+    def check(self, validator, facts):
+        found = set()
+        for _, names in facts:
+            found.update(names)
+        for name in self.sections:
+            if name not in found:
+                validator.report(f"{self.message}: {name.capitalize()}")
+
+
+class UnclosedCodeBlockRule(Rule):
+    """Every code fence is closed"""
+    id = 'unclosed-code-block'
+    severity = 'error'
+    kinds = (FENCE,)
+    fixable = True
+    
+    def collect(self, tokens, section):
+        return next((token.line for token in tokens if token.end < 0), None)
+    
+    def check(self, validator, facts):
+        unclosed = [(start + line, '') for start, line in facts if line is not None]
+        if unclosed:
+            validator.report("Unclosed code block (missing closing ```)", unclosed)
+    
+    def fix(self, lines, findings):
+        if not findings:
+            return 0
+        # Only the last fence can be unclosed: it runs to the end
+        opening = lines[findings[-1]['line']].strip()
+        marker = opening[0] * (len(opening) - len(opening.lstrip(opening[0])))
+        if lines and lines[-1] == '':
+            lines[-1] = marker
+            lines.append('')
+        else:
+            lines.append(marker)
+        return len(findings)
+
+
+class CodeBlockLanguageRule(Rule):
+    """Code blocks name their language"""
+    id = 'code-block-language'
+    severity = 'suggestion'
+    kinds = (FENCE,)
+    
+    def collect(self, tokens, section):
+        return [token.line for token in tokens if not token.text]
+    
+    def check(self, validator, facts):
+        lines = [(start + line, '') for start, section_lines in facts for line in section_lines]
+        if lines:
+            validator.report(f"{len(lines)} code block(s) without language specification",
+                             lines, label='Code block without language specification')
+
+
+class EmptyLinkRule(Rule):
+    """Links have a target"""
+    id = 'empty-link'
+    severity = 'error'
+    kinds = LINK_KINDS
+    
+    def collect(self, tokens, section):
+        return [token.line for token in tokens for url in _targets(token) if not url]
+    
+    def check(self, validator, facts):
+        lines = [(start + line, '') for start, section_lines in facts for line in section_lines]
+        if lines:
+            validator.report(f"{len(lines)} empty link(s) found", lines, label='Empty link')
+
+
+class PlaceholderLinkRule(Rule):
+    """Links do not point at placeholders left from a template"""
+    id = 'placeholder-link'
+    severity = 'warning'
+    kinds = LINK_KINDS
+    
+    PLACEHOLDERS = ('example.com', 'your-', 'placeholder', 'todo')
+    
+    def collect(self, tokens, section):
+        return [
+            [token.line, f"{token.text} -> {url}"]
+            for token in tokens for url in _targets(token)
+            if any(placeholder in url.lower() for placeholder in self.PLACEHOLDERS)
+        ]
+    
+    def check(self, validator, facts):
+        links = [(start + line, link) for start, section_links in facts for line, link in section_links]
+        if links:
+            validator.report(
+                f"{len(links)} placeholder link(s) found:\n" +
+                '\n'.join(f"     - {link}" for _, link in links[:3]),
+                links, label='Placeholder link'
+            )
+
+
+class InternalLinkRule(Rule):
+    """In-page anchors and relative links resolve"""
+    id = 'broken-internal-link'
+    severity = 'error'
+    kinds = LINK_KINDS
+    
+    def collect(self, tokens, section):
+        return [
+            [token.line, url] for token in tokens for url in _targets(token)
+            if url and not URL_SCHEME_RE.match(url) and not url.startswith('//')
+        ]
+    
+    def resolve(self, validator, facts) -> Iterator[Tuple[int, str, str, Optional[Path], str]]:
+        """
+        Resolve collected links against the README location
+        
+        Args:
+            validator: READMEValidator whose README the links belong to
+            facts: (section start line, links) as passed to check()
+        
+        Yields:
+            (line, url, path, resolved file or None for in-page links, fragment)
+        """
+        base = validator.path.resolve().parent
+        root = None
+        for start, links in facts:
+            for line, url in links:
+                path, _, fragment = url.partition('#')
+                path = path.split('?', 1)[0]
+                if '%' in url:
+                    path, fragment = unquote(path), unquote(fragment)
+                if not path:
+                    yield start + line, url, path, None, fragment
+                    continue
+                
+                if path.startswith('/'):
+                    # Repository-root relative, as rendered by GitHub
+                    if root is None:
+                        found = find_git_dir(base)
+                        root = found[0] if found else base
+                    resolved = root / path.lstrip('/')
+                else:
+                    resolved = base / path
+                yield start + line, url, path, resolved, fragment
+    
+    def check(self, validator, facts):
+        anchors = validator.anchors
+        exists: Dict[Path, bool] = {}
+        broken = []
+        
+        for line, url, path, resolved, fragment in self.resolve(validator, facts):
+            if resolved is None:
+                if fragment and not anchors.resolves(fragment):
+                    broken.append((line, f"{url} (no such heading)"))
+                continue
+            if resolved not in exists:
+                exists[resolved] = resolved.exists()
+            if not exists[resolved]:
+                broken.append((line, f"{url} (file not found)"))
+            elif fragment and resolved.suffix.lower() in ('.md', '.markdown') and resolved.is_file():
+                if not linked_anchors(resolved).resolves(fragment):
+                    broken.append((line, f"{url} (no such heading in {path})"))
+        
+        if broken:
+            validator.report(
+                f"{len(broken)} broken internal link(s) found:\n" +
+                '\n'.join(f"     - line {line + 1}: {link}" for line, link in broken[:5]),
+                broken, label='Broken internal link'
+            )
+
+
+class ExternalLinkRule(Rule):
+    """External links respond (only with a link checker)"""
+    kinds = LINK_KINDS
+    
+    def __init__(self, rule_id: str, severity: str, dead: bool):
+        """
+        Initialize rule
+        
+        Args:
+            rule_id: Rule ID
+            severity: Default severity
+            dead: Report gone targets (404/410) if true, other failures if false
+        """
+        self.id = rule_id
+        self.severity = severity
+        self.dead = dead
+    
+    def collect(self, tokens, section):
+        return [[token.line, url] for token in tokens for url in _targets(token) if is_checkable(url)]
+    
+    def check(self, validator, facts):
+        if validator.link_checker is None:
+            return
+        urls = {}
+        for start, links in facts:
+            for line, url in links:
+                urls.setdefault(url, start + line)
+        results = validator.link_results(urls)
+        
+        found = []
+        for url, line in urls.items():
+            result = results[url]
+            if self.dead and is_dead(result):
+                found.append((line, f"{url} ({result['status']})"))
+            elif not self.dead and is_failed(result) and not is_dead(result):
+                found.append((line, f"{url} ({result['status'] or result['error']})"))
+        
+        if found:
+            if self.dead:
+                message, label = f"{len(found)} dead link(s) found", 'Dead link'
+            else:
+                message, label = f"{len(found)} link(s) could not be verified", 'Link could not be verified'
+            validator.report(
+                f"{message}:\n" + '\n'.join(f"     - line {line + 1}: {link}" for line, link in found[:5]),
+                found, label=label
+            )
+
+
+class ShortDocumentRule(Rule):
+    """The README has at least 20 lines"""
+    id = 'short-document'
+    severity = 'warning'
+    
+    def check(self, validator, facts):
+        if validator.line_count < 20:
+            validator.report("README is very short (<20 lines)")
+
+
+class LongDocumentRule(Rule):
+    """The README is not so long that it should be split"""
+    id = 'long-document'
+    severity = 'suggestion'
+    
+    def check(self, validator, facts):
+        if validator.line_count > 1000:
+            validator.report("README is very long (>1000 lines). Consider splitting into multiple docs")
+
+
+class WordCountRule(Rule):
+    """The README has at least 50 words"""
+    id = 'word-count'
+    severity = 'error'
+    
+    def check(self, validator, facts):
+        if validator.word_count < 50:
+            validator.report("README is too short (<50 words)")
+
+
+class HeadingIncrementRule(Rule):
+    """Heading levels increase by one at a time"""
+    id = 'heading-increment'
+    severity = 'warning'
+    fixable = True
+    
+    def check(self, validator, facts):
+        headings = validator.headings
+        for previous, current in zip(headings, headings[1:]):
+            if current[1] - previous[1] > 1:
+                validator.report("Skipped heading level (e.g., H1 -> H3 without H2)",
+                                 [(current[0], f"H{previous[1]} -> H{current[1]}")])
+                break
+    
+    def fix(self, lines, findings):
+        fixed = 0
+        for finding in findings:
+            match = re.match(r'H(\d) -> H(\d)', finding['detail'])
+            line = lines[finding['line']]
+            indent = len(line) - len(line.lstrip(' '))
+            hashes = len(line[indent:]) - len(line[indent:].lstrip('#'))
+            lines[finding['line']] = line[:indent] + '#' * (int(match.group(1)) + 1) + line[indent + hashes:]
+            fixed += 1
+        return fixed
+
+
+class SingleH1Rule(Rule):
+    """Only the title is an H1"""
+    id = 'single-h1'
+    severity = 'warning'
+    fixable = True
+    
+    def check(self, validator, facts):
+        h1_lines = [line for line, level, _, _ in validator.headings if level == 1]
+        if len(h1_lines) > 1:
+            validator.report(f"Multiple H1 headings ({len(h1_lines)}). Use only one H1 for title",
+                             [(line, '') for line in h1_lines[1:]])
+    
+    def fix(self, lines, findings):
+        for finding in findings:
+            line = lines[finding['line']]
+            index = line.index('#')
+            lines[finding['line']] = line[:index] + '#' + line[index:]
+        return len(findings)
+
+
+class MissingH1Rule(Rule):
+    """The document has an H1 heading"""
+    id = 'missing-h1'
+    severity = 'error'
+    
+    def check(self, validator, facts):
+        if not any(level == 1 for _, level, _, _ in validator.headings):
+            validator.report("No H1 heading found")
+
+
+class LongLinesRule(Rule):
+    """At most 10 lines are longer than 120 characters"""
+    id = 'long-lines'
+    severity = 'suggestion'
+    
+    def check(self, validator, facts):
+        long_lines = validator.long_lines
+        if len(long_lines) > 10:
+            validator.report(f"{len(long_lines)} lines are very long (>120 chars)",
+                             [(line, '') for line in long_lines], label='Line is very long (>120 chars)')
+
+
+for _rule in (
+    TitleRule(),
+    TitleLengthRule(),
+    DescriptionRule(),
+    SectionPresenceRule('required-sections', 'error', REQUIRED_SECTIONS, "Missing required section"),
+    SectionPresenceRule('recommended-sections', 'warning', RECOMMENDED_SECTIONS,
+                        "Missing recommended section"),
+    UnclosedCodeBlockRule(),
+    CodeBlockLanguageRule(),
+    EmptyLinkRule(),
+    PlaceholderLinkRule(),
+    InternalLinkRule(),
+    ExternalLinkRule('dead-link', 'error', dead=True),
+    ExternalLinkRule('unverified-link', 'warning', dead=False),
+    ShortDocumentRule(),
+    LongDocumentRule(),
+    WordCountRule(),
+    HeadingIncrementRule(),
+    SingleH1Rule(),
+    MissingH1Rule(),
+    LongLinesRule(),
+):
+    register_rule(_rule)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Section Cache
+
+Splits a Markdown document into heading-delimited sections and caches
+per-section results by content hash, so that re-validating an edited
+README only re-tokenizes and re-checks the sections that changed.
+"""
+
+import json
+import os
+import re
+from collections import OrderedDict
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+from markdown_tokens import FENCE_OPEN_RE, HEADING_RE
+
+
+# Bump when the cached section summaries change shape or meaning
+SECTION_CACHE_VERSION = 3
+DEFAULT_MAX_ENTRIES = 4096
+
+# Lines that may start a section or open/close a code fence
+BOUNDARY_RE = re.compile(r'^ {0,3}(?:#|`{3,}|~{3,}).*', re.MULTILINE)
+
+
+def split_sections(content: str) -> List[Tuple[int, str]]:
+    """
+    Split a document before every ATX heading outside code fences
+    
+    Only candidate lines found by a regular expression are inspected, so
+    splitting costs little more than one scan of the text. Headings inside
+    fences (including an unclosed fence running to the end) do not split.
+    
+    Args:
+        content: Document text
+    
+    Returns:
+        List of (0-based start line, section text); joining the texts with
+        newlines gives back the document
+    """
+    starts = [0]
+    fence = None      # (marker char, marker length)
+    for match in BOUNDARY_RE.finditer(content):
+        text = match.group(0)
+        
+        if fence is not None:
+            char, length = fence
+            stripped = text.strip()
+            if len(stripped) >= length and not stripped.strip(char):
+                fence = None
+            continue
+        
+        opening = FENCE_OPEN_RE.match(text)
+        if opening:
+            marker = opening.group(1)
+            fence = (marker[0], len(marker))
+        elif match.start() > 0 and HEADING_RE.match(text):
+            starts.append(match.start())
+    
+    sections = []
+    line = 0
+    for i, start in enumerate(starts):
+        # Section text excludes the newline that separates it from the next
+        end = starts[i + 1] - 1 if i + 1 < len(starts) else len(content)
+        text = content[start:end]
+        sections.append((line, text))
+        line += text.count('\n') + 1
+    return sections
+
+
+def section_digest(text: str) -> str:
+    """Content hash of a section"""
+    return blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+class SectionCache:
+    """Bounded LRU cache of per-section results, optionally persisted"""
+    
+    def __init__(self, path: Optional[Path] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize section cache
+        
+        Args:
+            path: JSON file to load from and save to (None keeps it in memory)
+            max_entries: Maximum number of cached sections
+        """
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self.entries: 'OrderedDict[str, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        if self.path is not None:
+            self._load()
+    
+    def _load(self):
+        """Load entries from the cache file, ignoring stale or unreadable files"""
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == SECTION_CACHE_VERSION:
+            self.entries.update(data.get('sections', {}))
+    
+    def get(self, digest: str) -> Optional[Any]:
+        """Look up a section result by content hash"""
+        entry = self.entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(digest)
+        return entry
+    
+    def put(self, digest: str, entry: Any):
+        """Store a JSON-serializable section result"""
+        self.entries[digest] = entry
+        self.entries.move_to_end(digest)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._dirty = True
+    
+    def save(self):
+        """Write the cache file atomically if anything changed"""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({'version': SECTION_CACHE_VERSION, 'sections': self.entries}),
+                       encoding='utf-8')
+        os.replace(tmp, self.path)
+        self._dirty = False
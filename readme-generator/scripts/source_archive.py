@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Source Archive Reader
+
+Lets ProjectAnalyzer analyze release tarballs, sdists, zip files and wheels
+in place. The file index is built from the archive's member table and
+members are streamed out of the archive when a detector reads them, so
+nothing is extracted and no temporary files are written.
+
+Zip archives (and wheels) are read at random through their central
+directory. Compressed tar streams cannot seek: listing one is a single
+pass that also keeps the small members the analyzer asks for (manifests,
+license files, ...) in memory, and reading any other member costs another
+pass up to it. read_heads() fetches the start of many members in one pass.
+
+A single top-level directory, as in most release tarballs and sdists, is
+treated as the project root.
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import sys
+import tarfile
+import zipfile
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+from file_index import FileIndex, IOCounters
+
+
+# Archive suffix -> format
+ARCHIVE_SUFFIXES = {
+    '.tar.gz': 'tar',
+    '.tgz': 'tar',
+    '.tar.bz2': 'tar',
+    '.tar.xz': 'tar',
+    '.tar': 'tar',
+    '.tar.zst': 'tar.zst',
+    '.tar.zstd': 'tar.zst',
+    '.tzst': 'tar.zst',
+    '.zip': 'zip',
+    '.whl': 'zip',
+}
+
+# Largest member kept in memory by the tar listing pass
+CAPTURE_BYTES = 256 * 1024
+
+# Wheels have no PKG-INFO; their core metadata is exposed under this name
+WHEEL_METADATA = 'METADATA'
+
+
+class ArchiveError(OSError):
+    """Unsupported or unreadable archive"""
+
+
+def archive_format(path: Union[str, Path]) -> Optional[str]:
+    """Format of an archive by file name ('tar', 'tar.zst' or 'zip'), or None"""
+    name = str(path).lower()
+    for suffix, kind in ARCHIVE_SUFFIXES.items():
+        if name.endswith(suffix):
+            return kind
+    return None
+
+
+def is_archive(path: Union[str, Path]) -> bool:
+    """Check whether a path is an existing file with a supported archive suffix"""
+    return archive_format(path) is not None and Path(path).is_file()
+
+
+def member_path(name: str) -> Optional[str]:
+    """
+    Normalize an archive member name into a relative path
+    
+    Returns:
+        Path without './' prefixes (directories keep their trailing '/'),
+        or None for the root itself and for absolute or '..' paths
+    """
+    is_dir = name.endswith('/')
+    parts = [part for part in name.replace('\\', '/').split('/') if part not in ('', '.')]
+    if not parts or name.startswith('/') or '..' in parts:
+        return None
+    return '/'.join(parts) + ('/' if is_dir else '')
+
+
+def common_top(paths: Iterable[str]) -> str:
+    """Single top-level directory shared by all paths ('name/'), or '' if there is none"""
+    top = None
+    for rel in paths:
+        head, slash, _ = rel.partition('/')
+        if not slash or (top is not None and head != top):
+            return ''
+        top = head
+    return top + '/' if top else ''
+
+
+class StreamedMember(io.RawIOBase):
+    """
+    Sequential reader over a member of a tar stream
+    
+    tarfile's own member files fail on seekable() and tell() in stream mode.
+    """
+    
+    def __init__(self, member: BinaryIO):
+        self._member = member
+        self._position = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        count = self._member.readinto(buffer)
+        self._position += count
+        return count
+    
+    def tell(self) -> int:
+        return self._position
+
+
+class SourceArchive:
+    """Read-only view of a source archive as a project tree"""
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open an archive
+        
+        Args:
+            path: .tar.gz/.tgz, .tar.bz2, .tar.xz, .tar, .tar.zst, .zip or .whl file
+        
+        Raises:
+            ArchiveError: Unsupported format, missing zstd support, or not a zip file
+        """
+        self.path = Path(path)
+        self.format = archive_format(self.path)
+        if self.format is None:
+            raise ArchiveError(f"Unsupported archive format: {path}")
+        if self.format == 'tar.zst' and zstd is None:
+            raise ArchiveError(f"Reading {self.path.name} needs the zstandard package "
+                               "(pip install zstandard) or Python 3.14+")
+        self._zip: Optional[zipfile.ZipFile] = None
+        if self.format == 'zip':
+            try:
+                self._zip = zipfile.ZipFile(self.path)
+            except zipfile.BadZipFile as e:
+                raise ArchiveError(f"{self.path}: {e}") from e
+        # Project path -> member name, filled by the first listing
+        self.members: Optional[Dict[str, str]] = None
+        self._entries: Optional[List[Tuple[str, Optional[int]]]] = None
+        # Member name -> content kept by the tar listing pass
+        self.captured: Dict[str, bytes] = {}
+        # Directory of the project within the archive (see subarchive())
+        self.prefix = ''
+        self.top = ''
+    
+    @property
+    def name(self) -> str:
+        """Project directory name: the top-level directory, else the archive name"""
+        if self.prefix:
+            return self.prefix.rstrip('/').rsplit('/', 1)[-1]
+        if self.top:
+            return self.top.rstrip('/')
+        name = self.path.name
+        if name.lower().endswith('.whl'):
+            # {distribution}-{version}-{python tag}-{abi tag}-{platform tag}.whl
+            return name.split('-', 1)[0]
+        return name[:-len(next(suffix for suffix in ARCHIVE_SUFFIXES if name.lower().endswith(suffix)))]
+    
+    def close(self):
+        """Close the zip file handle, if any"""
+        if self._zip is not None:
+            self._zip.close()
+    
+    def subarchive(self, rel: str) -> 'SourceArchive':
+        """View of a subdirectory sharing this archive's listing and captured members"""
+        self._listing()
+        view = copy.copy(self)
+        view.prefix = self.prefix + rel.strip('/') + '/'
+        return view
+    
+    @contextlib.contextmanager
+    def _tar_stream(self) -> Iterator[tarfile.TarFile]:
+        """Open the tar archive for one sequential pass"""
+        with open(self.path, 'rb') as raw:
+            if self.format == 'tar.zst':
+                if hasattr(zstd, 'ZstdFile'):
+                    stream = zstd.ZstdFile(raw)
+                else:
+                    stream = zstd.ZstdDecompressor().stream_reader(raw)
+                mode = 'r|'
+            else:
+                stream, mode = raw, 'r|*'
+            try:
+                with tarfile.open(fileobj=stream, mode=mode) as tar:
+                    yield tar
+            except (tarfile.TarError, EOFError, zlib.error) as e:
+                raise ArchiveError(f"{self.path}: {e}") from e
+    
+    def _listing(self, capture: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, Optional[int]]]:
+        """Member table relative to the project root, read once"""
+        if self._entries is not None:
+            return self._entries
+        
+        listed: List[Tuple[str, Optional[int], str]] = []
+        if self._zip is not None:
+            for info in self._zip.infolist():
+                rel = member_path(info.filename)
+                if rel is not None:
+                    listed.append((rel, None if info.is_dir() else info.file_size, info.filename))
+        else:
+            guess = None
+            with self._tar_stream() as tar:
+                for info in tar:
+                    rel = member_path(info.name)
+                    if rel is None or not (info.isdir() or info.isfile()):
+                        continue
+                    if info.isdir():
+                        rel = rel.rstrip('/') + '/'
+                    listed.append((rel, info.size if info.isfile() else None, info.name))
+                    if guess is None:
+                        # The top-level directory is only known at the end;
+                        # the first member's is right for nearly every archive
+                        guess = common_top([rel])
+                    if (info.isfile() and capture is not None and info.size <= CAPTURE_BYTES and
+                            capture(rel[len(guess):] if rel.startswith(guess) else rel)):
+                        self.captured[info.name] = tar.extractfile(info).read()
+        
+        # Wheels put packages and metadata side by side at the top level
+        is_wheel = self.path.name.lower().endswith('.whl')
+        self.top = '' if is_wheel else common_top(rel for rel, _, _ in listed)
+        self.members = {}
+        self._entries = []
+        for rel, size, name in listed:
+            rel = rel[len(self.top):]
+            if not rel:
+                continue
+            if size is not None:
+                self.members[rel] = name
+            self._entries.append((rel, size))
+        
+        if is_wheel and 'PKG-INFO' not in self.members:
+            for rel, size in list(self._entries):
+                directory, _, base = rel.rpartition('/')
+                if base == WHEEL_METADATA and directory.endswith('.dist-info') and '/' not in directory:
+                    self.members['PKG-INFO'] = self.members[rel]
+                    self._entries.append(('PKG-INFO', size))
+                    break
+        return self._entries
+    
+    def file_index(self, prune: Optional[Iterable[str]] = None,
+                   capture: Optional[Callable[[str], bool]] = None,
+                   counters: Optional[IOCounters] = None) -> FileIndex:
+        """
+        Build a file index from the member table
+        
+        Args:
+            prune: Directory names to skip (defaults to file_index.DEFAULT_PRUNE)
+            capture: Called with each tar member's project path during the
+                listing pass; members it accepts (up to CAPTURE_BYTES) are
+                kept in memory so that reading them needs no further pass
+            counters: Optional counters for the listing
+        
+        Returns:
+            FileIndex whose root is the archive path and whose source is 'archive'
+        """
+        entries = self._listing(capture)
+        if self.prefix:
+            entries = [(rel[len(self.prefix):], size) for rel, size in entries
+                       if rel.startswith(self.prefix) and rel != self.prefix]
+        index = FileIndex.from_listing(self.path / self.prefix, entries, prune, source='archive')
+        if counters is not None:
+            # A tar listing decompresses the whole archive; a zip one reads the central directory
+            if self._zip is None:
+                counters.read_file(self.path.stat().st_size)
+            counters.files_visited += len(index.files)
+        return index
+    
+    def _member(self, rel: str) -> str:
+        """Member name of a project path"""
+        self._listing()
+        name = self.members.get(self.prefix + rel)
+        if name is None:
+            raise FileNotFoundError(f"{self.path}: no member {self.top}{self.prefix}{rel}")
+        return name
+    
+    @contextlib.contextmanager
+    def open(self, rel: str) -> Iterator[BinaryIO]:
+        """
+        Open a member for binary reading, streamed from the archive
+        
+        Args:
+            rel: Path relative to the project root
+        
+        Raises:
+            FileNotFoundError: No such member
+            ArchiveError: The archive is unreadable
+        """
+        name = self._member(rel)
+        if name in self.captured:
+            yield io.BytesIO(self.captured[name])
+        elif self._zip is not None:
+            try:
+                member = self._zip.open(name)
+            except (zipfile.BadZipFile, NotImplementedError) as e:
+                raise ArchiveError(f"{self.path}: {e}") from e
+            with member:
+                yield member
+        else:
+            with self._tar_stream() as tar:
+                for info in tar:
+                    if info.name == name and info.isfile():
+                        with io.BufferedReader(StreamedMember(tar.extractfile(info))) as member:
+                            yield member
+                        return
+            raise FileNotFoundError(f"{self.path}: no member {name}")
+    
+    def read_heads(self, rels: Iterable[str], size: int) -> Dict[str, bytes]:
+        """
+        Read the first bytes of many members
+        
+        Members not captured by the listing are read in one pass over a
+        tar archive, however many there are.
+        
+        Args:
+            rels: Paths relative to the project root
+            size: Bytes to read from the start of each member
+        
+        Returns:
+            Mapping of path to head, for the members that could be read
+        """
+        heads = {}
+        pending: Dict[str, str] = {}
+        for rel in rels:
+            try:
+                name = self._member(rel)
+            except FileNotFoundError:
+                continue
+            if name in self.captured:
+                heads[rel] = self.captured[name][:size]
+            elif self._zip is not None:
+                try:
+                    with self._zip.open(name) as member:
+                        heads[rel] = member.read(size)
+                except (zipfile.BadZipFile, NotImplementedError, OSError, zlib.error):
+                    continue
+            else:
+                pending[name] = rel
+        
+        if pending:
+            with self._tar_stream() as tar:
+                for info in tar:
+                    rel = pending.pop(info.name, None)
+                    if rel is not None and info.isfile():
+                        heads[rel] = tar.extractfile(info).read(size)
+                    if not pending:
+                        break
+        return heads
+
+
+def main():
+    """Main entry point for command-line usage"""
+    parser = argparse.ArgumentParser(
+        description='List or read the files of a source archive as ProjectAnalyzer sees them',
+        epilog='Example: python source_archive.py dist/project-1.0.tar.gz --cat pyproject.toml'
+    )
+    parser.add_argument('archive', help=f"Archive ({', '.join(ARCHIVE_SUFFIXES)})")
+    parser.add_argument('--cat', metavar='PATH', help='Print the file at PATH (relative to the project root)')
+    args = parser.parse_args()
+    
+    try:
+        archive = SourceArchive(args.archive)
+        if args.cat:
+            with archive.open(args.cat) as member:
+                sys.stdout.buffer.write(member.read())
+            return
+        index = archive.file_index()
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(json.dumps({'root': archive.name, 'top': archive.top, 'files': len(index.files)}))
+    for rel in index.files:
+        print(json.dumps({'path': rel, 'size': index.sizes.get(rel)}))
+
+
+if __name__ == '__main__':
+    main()
@@ -4,221 +4,292 @@ README Validator
 
 Validates README.md files for completeness, structure, and quality.
 Checks for required sections, proper formatting, and common issues.
+The checks themselves are rules registered in rules.py.
 """
 
+import argparse
+import functools
+import mmap
+import os
 import re
 import sys
+import time
+from collections import Counter
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Dict, Iterable, Optional, Tuple
+
+from analysis_cache import DEFAULT_CACHE_DIR
+from batch import expand_paths, run_batch
+from link_checker import DEFAULT_TTL, LinkChecker, default_cache_path
+from markdown_tokens import HEADING, Anchors, MarkdownDocument, anchor_index, slugify, tokenize
+from rules import RULES, RuleSet, load_config, load_rules_module
+from section_cache import SectionCache, section_digest, split_sections
+
+
+# Section summaries shared by every validator in this process (watch mode,
+# editor integrations); --cache adds an on-disk cache for separate runs
+SHARED_SECTION_CACHE = SectionCache()
+
+# Prefix of report messages by severity
+SEVERITY_PREFIX = {'error': '❌ ', 'warning': '⚠️  ', 'suggestion': '💡 '}
 
 
 class READMEValidator:
     """Validate README files for quality and completeness"""
     
-    def __init__(self, readme_path: str):
+    def __init__(self, readme_path: str, link_checker: Optional[LinkChecker] = None,
+                 section_cache: Optional[SectionCache] = None, content: Optional[str] = None,
+                 rules: Optional[RuleSet] = None):
         """
         Initialize validator with README file path
         
         Args:
             readme_path: Path to README.md file
+            link_checker: Optional LinkChecker used to verify external links
+            section_cache: Cache of per-section results (defaults to a cache
+                shared by all validators in this process)
+            content: README text to validate instead of the file contents
+                (e.g. an unsaved editor buffer); relative links are still
+                resolved against readme_path
+            rules: Rules to run (defaults to every registered rule)
         """
         self.path = Path(readme_path)
-        if not self.path.exists():
+        if content is None and not self.path.exists():
             raise FileNotFoundError(f"README not found: {readme_path}")
         
-        self.content = self.path.read_text(encoding='utf-8')
-        self.lines = self.content.split('\n')
+        self.link_checker = link_checker
+        self.section_cache = section_cache if section_cache is not None else SHARED_SECTION_CACHE
+        self.rules = rules if rules is not None else RuleSet.from_config()
+        self.reload(content)
+    
+    def reload(self, content: Optional[str] = None):
+        """
+        Re-read the README (or take new content) and clear previous results
+        
+        Rules and section cache are kept, so a long-lived validator (watch
+        mode) only summarizes the sections that changed.
+        
+        Args:
+            content: README text to validate instead of the file contents
+        """
+        self.content = read_readme(self.path) if content is None else content
+        self._doc = None
+        self._anchors = None
+        self._link_results = None
+        self._rule = None
+        # (rule ID, severity, message) of every report, to undo in recheck()
+        self._reported = []
         self.issues = []
         self.warnings = []
         self.suggestions = []
+        # Located findings: {'rule', 'severity', 'line', 'message', 'detail'}
+        self.findings = []
+        # Seconds spent per rule (collect on uncached sections + check)
+        self.timings: Dict[str, float] = {}
     
-    def validate_all(self) -> Tuple[bool, Dict]:
+    @property
+    def doc(self) -> MarkdownDocument:
+        """Token list of the whole document, tokenized on first use"""
+        if self._doc is None:
+            self._doc = tokenize(self.content)
+        return self._doc
+    
+    @property
+    def anchors(self) -> Anchors:
+        """Anchor index of the document (heading slugs and HTML anchors)"""
+        if self._anchors is None:
+            html_anchors = [name for _, summary in self.sections for name in summary['html_anchors']]
+            self._anchors = anchor_index([(slug, line) for line, _, _, slug in self.headings], html_anchors)
+        return self._anchors
+    
+    def link_results(self, urls: Iterable[str]) -> Dict[str, Dict]:
+        """Results of the link checker, checked once per validation"""
+        if self._link_results is None:
+            self._link_results = self.link_checker.check(urls)
+        return self._link_results
+    
+    def _summarize(self, text: str) -> Dict:
         """
-        Run all validation checks
+        Tokenize one section and run the collect step of every rule on it
         
-        Returns:
-            Tuple of (is_valid, results_dict)
+        Line numbers are relative to the section so that the summary stays
+        valid when the section moves within the document.
         """
-        self.check_title()
-        self.check_description()
-        self.check_required_sections()
-        self.check_code_blocks()
-        self.check_links()
-        self.check_length()
-        self.check_formatting()
-        
-        results = {
-            'valid': len(self.issues) == 0,
-            'issues': self.issues,
-            'warnings': self.warnings,
-            'suggestions': self.suggestions,
-            'score': self.calculate_score()
+        started = time.perf_counter()
+        doc = tokenize(text)
+        self.timings['(tokenize)'] = self.timings.get('(tokenize)', 0.0) + time.perf_counter() - started
+        
+        by_kinds = {}
+        facts = {}
+        for rule in self.rules.rules:
+            if not rule.kinds:
+                continue
+            tokens = by_kinds.get(rule.kinds)
+            if tokens is None:
+                tokens = by_kinds[rule.kinds] = [token for token in doc.tokens if token.kind in rule.kinds]
+            started = time.perf_counter()
+            fact = rule.collect(tokens, doc)
+            self.timings[rule.id] = self.timings.get(rule.id, 0.0) + time.perf_counter() - started
+            # Sections with nothing to report are left out of the facts
+            if fact is not None and fact != []:
+                facts[rule.id] = fact
+        
+        return {
+            'lines': doc.line_count,
+            'words': doc.word_count,
+            'long_lines': doc.long_lines,
+            'headings': [
+                [token.line, token.level, token.text, slugify(token.text)]
+                for token in doc.of_kind(HEADING)
+            ],
+            'html_anchors': doc.html_anchors,
+            'facts': facts,
         }
-        
-        return results['valid'], results
     
-    def check_title(self):
-        """Check if README has a proper title (H1)"""
-        h1_pattern = r'^# .+'
-        
-        # Find first H1
-        h1_line = None
-        for i, line in enumerate(self.lines[:10]):  # Check first 10 lines
-            if re.match(h1_pattern, line):
-                h1_line = i
-                break
+    def collect_sections(self):
+        """
+        Summarize every section, reusing cached summaries of unchanged ones
         
-        if h1_line is None:
-            self.issues.append("❌ Missing H1 title (# Project Name)")
-        else:
-            title = self.lines[h1_line].lstrip('# ').strip()
-            if len(title) < 2:
-                self.issues.append("❌ Title is too short")
-            elif len(title) > 80:
-                self.warnings.append("⚠️  Title is very long (>80 characters)")
+        Sets self.sections to a list of (start line, summary), self.facts
+        to the (start line, facts) of each rule, and the document-level
+        self.headings ((line, level, text, slug)), self.line_count,
+        self.word_count and self.long_lines.
+        """
+        self.sections = []
+        self.facts: Dict[str, list] = {rule.id: [] for rule in self.rules.rules}
+        self.headings = []
+        self.long_lines = []
+        self.line_count = 0
+        self.word_count = 0
+        for start, text in split_sections(self.content):
+            digest = f"{section_digest(text)}:{self.rules.key}"
+            summary = self.section_cache.get(digest)
+            if summary is None:
+                summary = self._summarize(text)
+                self.section_cache.put(digest, summary)
+            self.sections.append((start, summary))
+            for rule_id, fact in summary['facts'].items():
+                self.facts[rule_id].append((start, fact))
+            self.headings.extend(
+                (start + line, level, heading, slug)
+                for line, level, heading, slug in summary['headings']
+            )
+            self.long_lines.extend(start + line for line in summary['long_lines'])
+            self.line_count += summary['lines']
+            self.word_count += summary['words']
     
-    def check_description(self):
-        """Check if README has a description"""
-        # Look for description in first 20 lines
-        has_description = False
+    def validate_all(self) -> Tuple[bool, Dict]:
+        """
+        Run all validation checks
         
-        for line in self.lines[:20]:
-            # Skip empty lines, titles, and badges
-            if (line.strip() and 
-                not line.startswith('#') and
-                not line.startswith('[![') and
-                not line.startswith('![') and
-                len(line.strip()) > 20):
-                has_description = True
-                break
+        Section-local facts come from the section cache; each rule's check
+        step then combines them for the whole document.
         
-        if not has_description:
-            self.issues.append("❌ Missing project description (add 1-2 sentences after title)")
+        Returns:
+            Tuple of (is_valid, results_dict)
+        """
+        self.collect_sections()
+        self._check(self.rules.rules)
+        self.section_cache.save()
+        return self._results()
     
-    def check_required_sections(self):
-        """Check for required README sections"""
-        required_sections = {
-            'installation': r'##\s+(Installation|Getting Started|Setup)',
-            'usage': r'##\s+(Usage|Quick Start|Examples)',
-            'license': r'##\s+License',
-        }
-        
-        recommended_sections = {
-            'contributing': r'##\s+(Contributing|Contribution)',
-            'features': r'##\s+Features',
-        }
+    def recheck(self, rule_ids: Iterable[str]) -> Tuple[bool, Dict]:
+        """
+        Re-run the check step of some rules, keeping all other results
         
-        content_lower = self.content.lower()
+        For rules that also read files other than the README (relative
+        links) when only those files changed: the facts collected by the
+        last validate_all() are reused.
         
-        # Check required sections
-        for name, pattern in required_sections.items():
-            if not re.search(pattern, self.content, re.IGNORECASE):
-                self.issues.append(f"❌ Missing required section: {name.capitalize()}")
+        Args:
+            rule_ids: IDs of the rules to check again
         
-        # Check recommended sections
-        for name, pattern in recommended_sections.items():
-            if not re.search(pattern, self.content, re.IGNORECASE):
-                self.warnings.append(f"⚠️  Missing recommended section: {name.capitalize()}")
+        Returns:
+            Tuple of (is_valid, results_dict)
+        """
+        rule_ids = set(rule_ids)
+        for rule_id, severity, message in self._reported:
+            if rule_id in rule_ids:
+                self._messages(severity).remove(message)
+        self._reported = [reported for reported in self._reported if reported[0] not in rule_ids]
+        self.findings = [finding for finding in self.findings if finding['rule'] not in rule_ids]
+        self._check([rule for rule in self.rules.rules if rule.id in rule_ids])
+        return self._results()
     
-    def check_code_blocks(self):
-        """Check code blocks are properly formatted"""
-        # Find code blocks
-        code_block_pattern = r'```(\w*)\n'
-        code_blocks = re.finditer(code_block_pattern, self.content)
-        
-        unclosed_blocks = 0
-        blocks_without_language = 0
-        
-        for match in code_blocks:
-            language = match.group(1)
-            if not language:
-                blocks_without_language += 1
-        
-        # Check for unclosed code blocks
-        opening_blocks = len(re.findall(r'```', self.content))
-        if opening_blocks % 2 != 0:
-            self.issues.append("❌ Unclosed code block (missing closing ```)")
-        
-        if blocks_without_language > 0:
-            self.suggestions.append(
-                f"💡 {blocks_without_language} code block(s) without language specification"
-            )
+    def _check(self, rules: Iterable):
+        """Run the check step of rules on the collected facts"""
+        for rule in rules:
+            self._rule = rule
+            started = time.perf_counter()
+            rule.check(self, self.facts[rule.id])
+            self.timings[rule.id] = self.timings.get(rule.id, 0.0) + time.perf_counter() - started
+        self._rule = None
     
-    def check_links(self):
-        """Check for broken or empty links"""
-        # Find markdown links
-        link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        links = re.finditer(link_pattern, self.content)
-        
-        empty_links = 0
-        suspicious_links = []
-        
-        for match in links:
-            text = match.group(1)
-            url = match.group(2)
-            
-            # Check for empty URLs
-            if not url or url.isspace():
-                empty_links += 1
-            
-            # Check for placeholder URLs
-            if any(placeholder in url.lower() for placeholder in 
-                   ['example.com', 'your-', 'placeholder', 'todo']):
-                suspicious_links.append(f"{text} -> {url}")
-        
-        if empty_links > 0:
-            self.issues.append(f"❌ {empty_links} empty link(s) found")
-        
-        if suspicious_links:
-            self.warnings.append(
-                f"⚠️  {len(suspicious_links)} placeholder link(s) found:\n" +
-                '\n'.join(f"     - {link}" for link in suspicious_links[:3])
-            )
+    def _messages(self, severity: str) -> list:
+        """Report messages of a severity"""
+        return {'error': self.issues, 'warning': self.warnings, 'suggestion': self.suggestions}[severity]
     
-    def check_length(self):
-        """Check README length"""
-        line_count = len(self.lines)
-        word_count = len(self.content.split())
-        
-        if line_count < 20:
-            self.warnings.append("⚠️  README is very short (<20 lines)")
-        elif line_count > 1000:
-            self.suggestions.append(
-                "💡 README is very long (>1000 lines). Consider splitting into multiple docs"
-            )
+    def _results(self) -> Tuple[bool, Dict]:
+        """Current (is_valid, results_dict), copied so recheck() leaves it alone"""
+        results = {
+            'valid': len(self.issues) == 0,
+            'issues': list(self.issues),
+            'warnings': list(self.warnings),
+            'suggestions': list(self.suggestions),
+            'score': self.calculate_score(),
+            'findings': self.findings,
+        }
         
-        if word_count < 50:
-            self.issues.append("❌ README is too short (<50 words)")
+        return results['valid'], results
     
-    def check_formatting(self):
-        """Check formatting and style"""
-        # Check for consistent heading levels
-        headings = []
-        for line in self.lines:
-            if line.startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                headings.append(level)
+    def report(self, message: str, lines: Iterable[Tuple[int, str]] = (), label: Optional[str] = None):
+        """
+        Record a result of the rule currently being checked
         
-        # Check for skipped heading levels
-        if headings:
-            for i in range(len(headings) - 1):
-                if headings[i+1] - headings[i] > 1:
-                    self.warnings.append(
-                        "⚠️  Skipped heading level (e.g., H1 -> H3 without H2)"
-                    )
-                    break
+        Args:
+            message: Message for the text report (without severity prefix)
+            lines: (0-based line, detail) pairs locating the result; without
+                them it applies to the whole document (line None)
+            label: Text of each located finding (defaults to the first line
+                of the message)
+        """
+        rule_id = self._rule.id
+        severity = self.rules.severities[rule_id]
+        self._messages(severity).append(SEVERITY_PREFIX[severity] + message)
+        self._reported.append((rule_id, severity, SEVERITY_PREFIX[severity] + message))
+        
+        summary = label or message.split('\n', 1)[0].rstrip(':')
+        located = list(lines) or [(None, '')]
+        for line, detail in located:
+            self.findings.append({
+                'rule': rule_id,
+                'severity': severity,
+                'line': line,
+                'message': f"{summary}: {detail}" if detail else summary,
+                'detail': detail,
+            })
+    
+    def apply_fixes(self) -> int:
+        """
+        Apply the autofixes of rules that reported findings
         
-        # Check for multiple H1s
-        h1_count = sum(1 for h in headings if h == 1)
-        if h1_count > 1:
-            self.warnings.append(f"⚠️  Multiple H1 headings ({h1_count}). Use only one H1 for title")
-        elif h1_count == 0:
-            self.issues.append("❌ No H1 heading found")
+        Updates self.content; call validate_all() on a new validator to
+        check the result.
         
-        # Check for very long lines
-        long_lines = sum(1 for line in self.lines if len(line) > 120 and not line.startswith('http'))
-        if long_lines > 10:
-            self.suggestions.append(f"💡 {long_lines} lines are very long (>120 chars)")
+        Returns:
+            Number of findings fixed
+        """
+        lines = self.content.split('\n')
+        fixed = 0
+        for rule in self.rules.rules:
+            if not rule.fixable:
+                continue
+            findings = [f for f in self.findings if f['rule'] == rule.id and f['line'] is not None]
+            if findings:
+                fixed += rule.fix(lines, findings)
+        if fixed:
+            self.content = '\n'.join(lines)
+        return fixed
     
     def calculate_score(self) -> int:
         """
@@ -288,20 +359,233 @@ class READMEValidator:
         print("="*60 + "\n")
 
 
+def read_readme(path: Path) -> str:
+    """
+    Read a README through a memory map
+    
+    The text is decoded straight from the mapped pages through a
+    memoryview, without first copying the file into a bytes object;
+    batch workers receive only the path and map the file themselves.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return str(view, 'utf-8')
+
+
+def section_cache_for(readme_path: str, cache_dir: Optional[str] = None) -> SectionCache:
+    """On-disk section cache for a README (<README dir>/.cache/readme-generator by default)"""
+    directory = Path(cache_dir) if cache_dir else Path(readme_path).resolve().parent / DEFAULT_CACHE_DIR
+    return SectionCache(directory / 'sections.json')
+
+
+def rule_set_for(readme_path: str, config_path: Optional[str] = None,
+                 disable: Iterable[str] = (), rules_modules: Iterable[str] = ()) -> RuleSet:
+    """
+    Build the rule set for a README
+    
+    Args:
+        readme_path: README being validated (its directory is searched for
+            .readme-validator.json when config_path is not given)
+        config_path: Rule config file
+        disable: Rule IDs to disable in addition to the config
+        rules_modules: Modules or .py files with in-house rules to load
+    
+    Returns:
+        RuleSet
+    """
+    for spec in rules_modules:
+        load_rules_module(spec)
+    settings = dict(load_config(Path(readme_path), config_path).get('rules', {}))
+    for rule_id in disable:
+        settings[rule_id] = False
+    return RuleSet.from_config({'rules': settings})
+
+
+def validate_path(readme_path: str, check_links: bool = False,
+                  link_cache: Optional[str] = None, link_ttl: float = DEFAULT_TTL,
+                  use_cache: bool = False, cache_dir: Optional[str] = None,
+                  config_path: Optional[str] = None, disable: Tuple[str, ...] = (),
+                  rules_modules: Tuple[str, ...] = (), timings: bool = False) -> Dict:
+    """
+    Validate one README for batch mode, isolating any failure
+    
+    Args:
+        readme_path: Path to README file
+        check_links: Verify external links
+        link_cache: Link cache file (shared by all workers)
+        link_ttl: Seconds a cached link result stays valid
+        use_cache: Reuse section results from an on-disk cache
+        cache_dir: Section cache directory
+        config_path: Rule config file
+        disable: Rule IDs to disable
+        rules_modules: In-house rule modules to load
+        timings: Include per-rule seconds under 'timings'
+    
+    Returns:
+        {'path', 'ok', 'valid', 'score', 'issues', 'warnings', 'suggestions',
+        'findings'} on success, {'path', 'ok', 'error'} on failure
+    """
+    try:
+        checker = LinkChecker(link_cache, ttl=link_ttl) if check_links else None
+        section_cache = section_cache_for(readme_path, cache_dir) if use_cache else None
+        rules = rule_set_for(readme_path, config_path, disable, rules_modules)
+        validator = READMEValidator(readme_path, checker, section_cache, rules=rules)
+        _, results = validator.validate_all()
+        if timings:
+            results['timings'] = validator.timings
+        return {'path': readme_path, 'ok': True, **results}
+    except Exception as e:
+        return {'path': readme_path, 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+
+class BatchSummary:
+    """Aggregate statistics over batch validation results"""
+    
+    def __init__(self):
+        self.histogram = Counter()
+        self.messages = Counter()
+        self.scores = []
+        self.timings: Dict[str, float] = {}
+    
+    def add(self, result: Dict):
+        """Record one validate_path() result"""
+        if not result.get('ok'):
+            return
+        score = result['score']
+        self.scores.append(score)
+        self.histogram[min(score // 10 * 10, 90)] += 1
+        for rule_id, seconds in result.get('timings', {}).items():
+            self.timings[rule_id] = self.timings.get(rule_id, 0.0) + seconds
+        for key in ('issues', 'warnings'):
+            for message in result[key]:
+                # Group messages that differ only in counts or details
+                first_line = message.split('\n', 1)[0]
+                self.messages[re.sub(r'\d+', 'N', first_line)] += 1
+    
+    def print(self, stream=sys.stderr, top: int = 10):
+        """Print score histogram and most common issues"""
+        if not self.scores:
+            return
+        print(f"\nREADMEs validated: {len(self.scores)}, "
+              f"mean score {sum(self.scores) / len(self.scores):.1f}", file=stream)
+        print("Score histogram:", file=stream)
+        peak = max(self.histogram.values())
+        for low in range(90, -1, -10):
+            count = self.histogram.get(low, 0)
+            bar = '#' * (round(count / peak * 40) if peak else 0)
+            label = f"{low}-{low + 10 if low == 90 else low + 9}"
+            print(f"  {label:>6} {count:>7} {bar}", file=stream)
+        print("Most common issues:", file=stream)
+        for message, count in self.messages.most_common(top):
+            print(f"  {count:>7}  {message}", file=stream)
+        if self.timings:
+            print_timings(self.timings, stream)
+
+
+def print_timings(timings: Dict[str, float], stream=sys.stderr):
+    """Print per-rule time, slowest first"""
+    total = sum(timings.values()) or 1e-9
+    print("Rule timings:", file=stream)
+    for rule_id, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True):
+        print(f"  {seconds * 1000:>10.2f} ms {seconds / total:>6.1%}  {rule_id}", file=stream)
+
+
 def main():
     """Main entry point for command-line usage"""
-    if len(sys.argv) < 2:
-        print("Usage: validate_readme.py <path/to/README.md>")
-        print("\nExample:")
-        print("  python validate_readme.py README.md")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description='Validate README files',
+        epilog='Example: python validate_readme.py README.md'
+    )
+    parser.add_argument('readme', nargs='*', help='Path to README.md (several paths, directories or globs with --batch)')
+    parser.add_argument('--batch', action='store_true',
+                        help='Validate many READMEs in parallel and print one JSON line per file')
+    parser.add_argument('--from-file', metavar='FILE',
+                        help="Read README paths from FILE, one per line ('-' for stdin); implies --batch")
+    parser.add_argument('-j', '--jobs', type=int, help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--check-links', action='store_true',
+                        help='Check that external links are reachable (network access)')
+    parser.add_argument('--link-cache', metavar='FILE',
+                        help='Link check cache file (default: ~/.cache/readme-generator/links.json)')
+    parser.add_argument('--link-ttl', type=float, default=DEFAULT_TTL, metavar='SECONDS',
+                        help='Seconds before a cached link result is re-checked (default: 86400)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse results of unchanged sections from the previous run')
+    parser.add_argument('--cache-dir',
+                        help='Cache directory (default: <README dir>/.cache/readme-generator, implies --cache)')
+    parser.add_argument('--config', metavar='FILE',
+                        help='Rule config (default: .readme-validator.json next to the README)')
+    parser.add_argument('--disable', action='append', default=[], metavar='RULE',
+                        help='Disable a rule by ID (repeatable, or comma-separated)')
+    parser.add_argument('--rules-module', action='append', default=[], metavar='MODULE',
+                        help='Load in-house rules from a module name or .py file (repeatable)')
+    parser.add_argument('--list-rules', action='store_true', help='List registered rules and exit')
+    parser.add_argument('--timings', action='store_true', help='Report time spent per rule on stderr')
+    parser.add_argument('--fix', action='store_true',
+                        help='Apply autofixes of fixable rules to the README before reporting')
+    parser.add_argument('--lsp', action='store_true',
+                        help='Run as a Language Server Protocol server on stdin/stdout')
+    parser.add_argument('--quiet', action='store_true', help='Suppress progress and summary on stderr')
+    args = parser.parse_args()
+    link_cache = str(args.link_cache or default_cache_path())
+    use_cache = args.cache or bool(args.cache_dir)
+    disable = tuple(rule_id for value in args.disable for rule_id in value.split(',') if rule_id)
+    rules_modules = tuple(args.rules_module)
+    
+    if args.list_rules:
+        for spec in rules_modules:
+            load_rules_module(spec)
+        for rule in RULES.values():
+            fix = ' (fixable)' if rule.fixable else ''
+            print(f"{rule.id:<24} {rule.severity:<11} {(type(rule).__doc__ or '').strip()}{fix}")
+        sys.exit(0)
+    
+    if args.lsp:
+        from lsp_server import serve
+        serve()
+    
+    if args.batch or args.from_file:
+        patterns = [
+            os.path.join(path, '**', 'README.md') if os.path.isdir(path) else path
+            for path in args.readme
+        ]
+        paths = expand_paths(patterns, args.from_file, match=os.path.isfile)
+        summary = BatchSummary()
+        worker = functools.partial(validate_path, check_links=args.check_links,
+                                   link_cache=link_cache, link_ttl=args.link_ttl,
+                                   use_cache=use_cache, cache_dir=args.cache_dir,
+                                   config_path=args.config, disable=disable,
+                                   rules_modules=rules_modules, timings=args.timings)
+        progress = run_batch(worker, paths, jobs=args.jobs, label='validated',
+                             quiet=args.quiet, on_result=summary.add)
+        if not args.quiet:
+            summary.print()
+        sys.exit(1 if progress.errors else 0)
+    
+    if not args.readme:
+        parser.error('README path required')
+    if len(args.readme) > 1:
+        parser.error('multiple README paths require --batch')
     
-    readme_path = sys.argv[1]
+    readme_path = args.readme[0]
     
     try:
-        validator = READMEValidator(readme_path)
+        checker = LinkChecker(link_cache, ttl=args.link_ttl) if args.check_links else None
+        section_cache = section_cache_for(readme_path, args.cache_dir) if use_cache else None
+        rules = rule_set_for(readme_path, args.config, disable, rules_modules)
+        validator = READMEValidator(readme_path, checker, section_cache, rules=rules)
         is_valid, results = validator.validate_all()
+        if args.fix:
+            fixed = validator.apply_fixes()
+            if fixed:
+                Path(readme_path).write_text(validator.content, encoding='utf-8')
+                print(f"Fixed {fixed} finding(s) in {readme_path}")
+                validator = READMEValidator(readme_path, checker, section_cache, rules=rules)
+                is_valid, results = validator.validate_all()
         validator.print_results(results)
+        if args.timings:
+            print_timings(validator.timings)
         
         # Exit with appropriate code
         sys.exit(0 if is_valid else 1)
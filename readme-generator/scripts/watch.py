@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Watch Mode
+
+Keeps a ProjectAnalyzer and a READMEValidator warm in one process, waits
+for file changes (inotify on Linux, polling elsewhere) and recomputes only
+the detectors and validation results that depend on the changed paths.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from analysis_cache import fingerprint
+from file_index import TREE
+
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_ATTRIB | IN_CREATE | IN_DELETE |
+              IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF)
+STRUCTURE_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+EVENT_HEADER = struct.Struct('iIII')
+
+# Editor swap/backup files that should never trigger a refresh
+IGNORED_NAMES = ('*.swp', '*.swx', '*~', '.#*', '#*#', '4913', '*.tmp')
+
+# Rule whose results also depend on the files the README links to
+LINK_RULE = 'broken-internal-link'
+
+# Time to keep collecting events after the first one (editors often
+# write a file through several syscalls)
+SETTLE_SECONDS = 0.01
+
+
+def _ignored(rel: str) -> bool:
+    """Check whether a changed path is editor noise"""
+    name = rel.rsplit('/', 1)[-1]
+    return any(fnmatch(name, pattern) for pattern in IGNORED_NAMES)
+
+
+class InotifyWatcher:
+    """Directory watcher based on Linux inotify"""
+    
+    def __init__(self, root: Path):
+        """
+        Initialize inotify instance
+        
+        Args:
+            root: Project root; changes are reported relative to it
+        
+        Raises:
+            OSError: If inotify is not available
+        """
+        self.root = root
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        if not hasattr(libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches: Dict[int, str] = {}
+        self._watched: Set[str] = set()
+    
+    def sync(self, dirs: Iterable[str], files: Iterable[str] = ()):
+        """
+        Make sure the given directories are watched
+        
+        Args:
+            dirs: Directories relative to the root (or absolute)
+            files: Files of interest; their parent directories are watched
+        """
+        wanted = set(dirs)
+        wanted.update(os.path.dirname(path) for path in files)
+        for rel in wanted - self._watched:
+            path = str(self.root / rel) if rel else str(self.root)
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = rel
+                self._watched.add(rel)
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Wait for changes
+        
+        Args:
+            timeout: Seconds to wait, None to wait forever
+        
+        Returns:
+            Tuple of (changed relative paths, structure changed), or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if not ready:
+                return None
+            changed, structural = self._collect()
+            # Only ignored or unwatched paths: keep waiting for the rest of the timeout
+            if changed or structural:
+                return changed, structural
+    
+    def _collect(self) -> Tuple[Set[str], bool]:
+        """Read pending events until they settle"""
+        changed: Set[str] = set()
+        structural = False
+        deadline = time.monotonic() + SETTLE_SECONDS
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                data = b''
+            
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'surrogateescape')
+                offset += length
+                
+                if mask & IN_Q_OVERFLOW:
+                    structural = True
+                    continue
+                if mask & IN_IGNORED:
+                    rel = self._watches.pop(wd, None)
+                    self._watched.discard(rel)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                rel = f"{directory}/{name}" if directory and name else (name or directory)
+                if _ignored(rel):
+                    continue
+                changed.add(rel)
+                if mask & (STRUCTURE_MASK | IN_DELETE_SELF):
+                    structural = True
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self.fd], [], [], remaining)[0]:
+                break
+        return changed, structural
+    
+    def close(self):
+        """Release the inotify instance"""
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Portable watcher comparing stat fingerprints at a fixed interval"""
+    
+    def __init__(self, root: Path, interval: float = 0.05):
+        """
+        Initialize poller
+        
+        Args:
+            root: Project root; changes are reported relative to it
+            interval: Seconds between polls
+        """
+        self.root = root
+        self.interval = interval
+        self._dirs: Dict[str, Optional[List[int]]] = {}
+        self._files: Dict[str, Optional[List[int]]] = {}
+    
+    def sync(self, dirs: Iterable[str], files: Iterable[str] = ()):
+        """
+        Set the directories and files to poll
+        
+        Args:
+            dirs: Directories whose entries matter (their mtime changes when
+                entries are added, removed or renamed)
+            files: Files whose content matters
+        """
+        self._dirs = {rel: fingerprint(self.root / rel) for rel in dirs}
+        self._files = {rel: fingerprint(self.root / rel) for rel in files}
+    
+    def wait(self, timeout: Optional[float] = None) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Poll until something changes
+        
+        Args:
+            timeout: Seconds to wait, None to wait forever
+        
+        Returns:
+            Tuple of (changed relative paths, structure changed), or None on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            structural = False
+            for watched, is_dir in ((self._dirs, True), (self._files, False)):
+                for rel, fp in watched.items():
+                    current = fingerprint(self.root / rel)
+                    if current != fp:
+                        watched[rel] = current
+                        changed.add(rel)
+                        structural = structural or is_dir or current is None or fp is None
+            if changed:
+                return changed, structural
+            
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(self.interval)
+    
+    def close(self):
+        """Nothing to release"""
+
+
+def validation_diff(old: Optional[Dict], new: Dict) -> List[str]:
+    """Describe the difference between two READMEValidator results"""
+    lines = []
+    if old is None or old['score'] != new['score']:
+        lines.append(f"score: {old['score'] if old else '-'} -> {new['score']}")
+    for key in ('issues', 'warnings', 'suggestions'):
+        before = old[key] if old else []
+        for message in new[key]:
+            if message not in before:
+                lines.append(f"+ {message}")
+        for message in before:
+            if message not in new[key]:
+                lines.append(f"- {message}")
+    return lines
+
+
+def run_watch(analyzer, readme: Optional[Path] = None, poll: bool = False, out=sys.stdout):
+    """
+    Watch a project and print changed results until interrupted
+    
+    Args:
+        analyzer: ProjectAnalyzer that has already run analyze()
+        readme: README file to keep validated, if any
+        poll: Use the polling watcher even where inotify is available
+        out: Output stream
+    """
+    from section_cache import SectionCache
+    from validate_readme import READMEValidator
+    
+    root = analyzer.root
+    readme_rel = None
+    validator = None
+    validation = None
+    # One section cache for the whole session: edits re-summarize only the
+    # sections they touch
+    section_cache = SectionCache()
+    linked: Set[str] = set()
+    
+    def validate() -> Dict:
+        """Validate the README again, reusing the validator"""
+        nonlocal validator
+        if validator is None:
+            validator = READMEValidator(str(readme), section_cache=section_cache)
+        else:
+            validator.reload()
+        return validator.validate_all()[1]
+    
+    def linked_files() -> Set[str]:
+        """Files inside the project that relative links of the README point to"""
+        paths = set()
+        for rule in validator.rules.rules if validator else ():
+            if rule.id != LINK_RULE:
+                continue
+            for _, _, _, resolved, _ in rule.resolve(validator, validator.facts[rule.id]):
+                if resolved is None:
+                    continue
+                rel = os.path.relpath(resolved, root)
+                if rel != readme_rel and rel != os.pardir and not rel.startswith(os.pardir + os.sep):
+                    paths.add(rel)
+        return paths
+    
+    if readme is not None:
+        readme = readme.resolve()
+        readme_rel = os.path.relpath(readme, root)
+        if readme.exists():
+            validation = validate()
+            linked = linked_files()
+    
+    watcher = None
+    if not poll:
+        try:
+            watcher = InotifyWatcher(root)
+        except OSError:
+            watcher = None
+    if watcher is None:
+        watcher = PollingWatcher(root)
+    
+    def sync():
+        index = analyzer.index
+        dirs = list(index.walked_dirs)
+        if index.tree_deps:
+            # e.g. the directory holding .git/index
+            dirs.extend(os.path.dirname(dep) for dep in index.tree_deps)
+        files = set()
+        for deps in analyzer.dependencies.values():
+            files.update(dep for dep in deps if dep != TREE)
+        if readme_rel:
+            files.add(readme_rel)
+        files.update(linked)
+        watcher.sync(dirs, files)
+    
+    sync()
+    print(f"Watching {root} ({type(watcher).__name__}). Press Ctrl+C to stop.", file=out, flush=True)
+    
+    try:
+        while True:
+            event = watcher.wait()
+            if event is None:
+                continue
+            changed, structural = event
+            start = time.perf_counter()
+            
+            lines = []
+            for key, (old, new) in analyzer.refresh(changed, structural).items():
+                lines.append(f"{key}: {old!r} -> {new!r}")
+            
+            resync = structural
+            result = None
+            if readme_rel and (readme_rel in changed or structural):
+                if readme.exists():
+                    result = validate()
+                    links = linked_files()
+                    resync = resync or links != linked
+                    linked = links
+            elif validator is not None and not linked.isdisjoint(changed):
+                # Only files the README links to changed: the README's
+                # sections and the other rules' results are still valid
+                _, result = validator.recheck([LINK_RULE])
+            if result is not None:
+                lines.extend(validation_diff(validation, result))
+                validation = result
+            
+            if resync:
+                sync()
+            
+            if lines:
+                elapsed = (time.perf_counter() - start) * 1000
+                stamp = time.strftime('%H:%M:%S')
+                print(f"[{stamp}] {len(changed)} path(s) changed, updated in {elapsed:.1f} ms", file=out)
+                for line in lines:
+                    print(f"  {line}", file=out)
+                out.flush()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
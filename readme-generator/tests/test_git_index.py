@@ -0,0 +1,53 @@
+"""Tests for reading the file list from an enclosing repository's git index"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from analyze_project import ProjectAnalyzer
+from git_index import load_tracked_files
+
+
+@unittest.skipIf(shutil.which('git') is None, 'git is not installed')
+class EnclosingRepositoryTest(unittest.TestCase):
+    """Subdirectories of a repository, tracked or not"""
+    
+    def setUp(self):
+        self.top = Path(tempfile.mkdtemp()).resolve()
+        self.addCleanup(shutil.rmtree, self.top)
+        subprocess.run(['git', 'init', '-q', str(self.top)], check=True)
+        
+        tracked = self.top / 'tracked'
+        tracked.mkdir()
+        (tracked / 'app.py').write_text('import os\n')
+        subprocess.run(['git', '-C', str(self.top), 'add', 'tracked'], check=True)
+        
+        self.untracked = self.top / 'untracked'
+        self.untracked.mkdir()
+        (self.untracked / 'main.py').write_text('print("hello")\n')
+        (self.untracked / 'package.json').write_text('{"name": "untracked-app", "version": "1.2.3"}\n')
+    
+    def test_tracked_subdirectory_uses_parent_index(self):
+        loaded = load_tracked_files(self.top / 'tracked')
+        self.assertIsNotNone(loaded)
+        self.assertEqual([path for path, _, _ in loaded[1]], ['app.py'])
+    
+    def test_untracked_subdirectory_has_no_index(self):
+        self.assertIsNone(load_tracked_files(self.untracked))
+    
+    def test_untracked_subdirectory_is_walked(self):
+        analyzer = ProjectAnalyzer(str(self.untracked))
+        analysis = analyzer.analyze()
+        self.assertEqual(analyzer.index.source, 'walk')
+        self.assertEqual(analysis['project_name'], 'untracked-app')
+        self.assertEqual(analysis['version'], '1.2.3')
+        self.assertIn('Python', analysis['languages'])
+
+
+if __name__ == '__main__':
+    unittest.main()